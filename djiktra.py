@@ -124,10 +124,13 @@ def hierarchy_pos_by_distance(graph):
 #           DIBUJAR GRAFO COMPLETO + EXPORT PNG
 # ===========================================================
 
-import networkx as nx
-import matplotlib.pyplot as plt
+# networkx y matplotlib se importan dentro de cada función de
+# dibujo: importar este módulo no los carga
 
 def draw_dijkstra_graph(graph, export_filename="dijkstra_graph.png"):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     G = nx.DiGraph()
 
     # añadir nodos con etiquetas
@@ -175,6 +178,9 @@ def draw_dijkstra_graph(graph, export_filename="dijkstra_graph.png"):
 # ===========================================================
 
 def draw_path(graph, path):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     G = nx.DiGraph()
 
     # añadir aristas del camino
@@ -215,37 +221,38 @@ def draw_path(graph, path):
 #                     PRUEBA FINAL
 # ===========================================================
 
-# Crear grafo de ejemplo
-g = Graph()
+if __name__ == "__main__":
+    # Crear grafo de ejemplo
+    g = Graph()
 
-for name in ["A", "B", "C", "D", "E", "F"]:
-    g.add_vertex(name)
+    for name in ["A", "B", "C", "D", "E", "F"]:
+        g.add_vertex(name)
 
-g.add_edge("A", "B", 4)
-g.add_edge("A", "C", 2)
-g.add_edge("B", "C", 1)
-g.add_edge("B", "D", 5)
-g.add_edge("C", "D", 8)
-g.add_edge("C", "E", 10)
-g.add_edge("D", "E", 2)
-g.add_edge("D", "F", 6)
-g.add_edge("E", "F", 3)
+    g.add_edge("A", "B", 4)
+    g.add_edge("A", "C", 2)
+    g.add_edge("B", "C", 1)
+    g.add_edge("B", "D", 5)
+    g.add_edge("C", "D", 8)
+    g.add_edge("C", "E", 10)
+    g.add_edge("D", "E", 2)
+    g.add_edge("D", "F", 6)
+    g.add_edge("E", "F", 3)
 
-start = "A"
-end = "F"
+    start = "A"
+    end = "F"
 
-dijkstra(g, start)
-path = reconstruct_path(g, start, end)
+    dijkstra(g, start)
+    path = reconstruct_path(g, start, end)
 
-print("\n==== DISTANCIAS MÍNIMAS ====")
-for v in g.vertices.values():
-    print(f"{v.name}: {v.distance}")
+    print("\n==== DISTANCIAS MÍNIMAS ====")
+    for v in g.vertices.values():
+        print(f"{v.name}: {v.distance}")
 
-print("\n==== CAMINO ÓPTIMO A F ====")
-print(" -> ".join(path))
+    print("\n==== CAMINO ÓPTIMO A F ====")
+    print(" -> ".join(path))
 
-# Dibujar grafo completo + exportar PNG
-draw_dijkstra_graph(g)
+    # Dibujar grafo completo + exportar PNG
+    draw_dijkstra_graph(g)
 
-# Dibujar solo el camino óptimo
-draw_path(g, path)
+    # Dibujar solo el camino óptimo
+    draw_path(g, path)
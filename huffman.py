@@ -64,8 +64,8 @@ class HuffmanTree:
 #        DIBUJO DEL ÁRBOL COMPLETO — JERÁRQUICO + PNG
 # ===========================================================
 
-import networkx as nx
-import matplotlib.pyplot as plt
+# networkx y matplotlib se importan dentro de cada función de
+# dibujo: importar este módulo no los carga
 
 
 # ---------------- Calcular niveles del árbol ----------------
@@ -106,6 +106,8 @@ def hierarchy_pos(G, root):
 # --------------- Dibujar y exportar a PNG ----------------
 
 def draw_huffman_tree(tree, export_filename="huffman_tree.png"):
+    import networkx as nx
+    import matplotlib.pyplot as plt
 
     G = nx.DiGraph()
     levels = {}
@@ -160,23 +162,24 @@ def draw_huffman_tree(tree, export_filename="huffman_tree.png"):
 #                     PRUEBA FINAL
 # ===========================================================
 
-freq_table = {
-    "A": 5,
-    "B": 9,
-    "C": 12,
-    "D": 13,
-    "E": 16,
-    "F": 45
-}
-
-# Construcción
-huffman = HuffmanTree(freq_table)
-huffman.build()
-codes = huffman.generate_codes()
-
-print("===== CÓDIGOS HUFFMAN OBTENIDOS =====\n")
-for char, code in codes.items():
-    print(f"{char}: {code}")
-
-# Dibujar y exportar PNG
-draw_huffman_tree(huffman)
+if __name__ == "__main__":
+    freq_table = {
+        "A": 5,
+        "B": 9,
+        "C": 12,
+        "D": 13,
+        "E": 16,
+        "F": 45
+    }
+
+    # Construcción
+    huffman = HuffmanTree(freq_table)
+    huffman.build()
+    codes = huffman.generate_codes()
+
+    print("===== CÓDIGOS HUFFMAN OBTENIDOS =====\n")
+    for char, code in codes.items():
+        print(f"{char}: {code}")
+
+    # Dibujar y exportar PNG
+    draw_huffman_tree(huffman)
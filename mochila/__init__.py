@@ -0,0 +1,68 @@
+# =======================================================
+#        MOCHILA 0/1 — paquete importable
+# =======================================================
+#
+# Importar el paquete no ejecuta demos ni carga networkx,
+# matplotlib ni NumPy: solo el núcleo (grafo.py) se importa
+# al inicio. Los demás motores se cargan al pedirlos:
+#
+#   from mochila import Item, Graph, KnapsackSolver
+#   from mochila import NumpyDPSolver      # importa NumPy aquí
+#   from mochila.dibujo import draw_graph  # importa networkx aquí
+#
+# Demo: python -m mochila
+
+from importlib import import_module
+
+from .grafo import (
+    Item, Node, Edge, Graph, KnapsackSolver, Stats, NotApplicable,
+    UNBOUNDED, split_quantities, join_quantities,
+)
+
+
+# -------------------------------------------------------
+# Motores cargados a demanda: nombre → submódulo
+# -------------------------------------------------------
+
+_LAZY = {
+    "BranchAndBoundSolver": "bb",
+    "dantzig_bound": "bb",
+    "CompactGraph": "soa",
+    "StreamingSolver": "stream",
+    "ParallelSolver": "paralelo",
+    "ParetoSolver": "pareto",
+    "SubsetSumSolver": "subsetsum",
+    "ResumableSolver": "reanudar",
+    "Planner": "planner",
+    "SolutionCache": "cache",
+    "BatchRunner": "lote",
+    "read_instances": "lote",
+    "SolveService": "servicio",
+    # NumPy
+    "NumpyDPSolver": "dp",
+    "IncrementalSolver": "incremental",
+    "MeetInTheMiddleSolver": "mitm",
+    "FPTASSolver": "fptas",
+    "MultiDimSolver": "multidim",
+    "CoreSolver": "nucleo",
+}
+
+# solo el núcleo: "from mochila import *" no carga ningún motor
+# perezoso (ni NumPy); esos se importan por su nombre
+__all__ = [
+    "Item", "Node", "Edge", "Graph", "KnapsackSolver", "Stats", "NotApplicable",
+    "UNBOUNDED", "split_quantities", "join_quantities",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
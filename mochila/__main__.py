@@ -0,0 +1,67 @@
+# =======================================================
+#     PRUEBA COMPLETA — STAR WARS (python -m mochila)
+# =======================================================
+#
+#   python -m mochila                     # solo texto
+#   python -m mochila --dibujo camino     # + camino óptimo
+#   python -m mochila --dibujo completo   # + grafo completo
+#   python -m mochila --dibujo jerarquico # + grafo por niveles (PNG)
+
+import argparse
+
+from .grafo import Item, Graph, KnapsackSolver
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mochila 0/1 — demo Star Wars")
+    parser.add_argument(
+        "--dibujo", choices=["camino", "completo", "jerarquico"], default=None
+    )
+    args = parser.parse_args(argv)
+
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    # Construcción del grafo
+    graph = Graph(items, capacity)
+    graph.build()
+
+    # Resolver
+    solver = KnapsackSolver(graph)
+    solution, total_priority = solver.solve()
+
+    # Imprimir resultados
+    print("\n===========================")
+    print("   SOLUCIÓN ÓPTIMA")
+    print("===========================\n")
+
+    for action, item in solution:
+        accion = "Tomar" if action == "take" else "Saltar"
+        print(f"{accion}: {item}")
+
+    print(f"\nPrioridad total lograda: {total_priority}")
+    print("===========================\n")
+
+    if args.dibujo is None:
+        return
+
+    # networkx y matplotlib solo se importan si se pide un dibujo
+    from . import dibujo
+
+    if args.dibujo == "completo":
+        dibujo.draw_full_graph(graph)
+    elif args.dibujo == "jerarquico":
+        dibujo.draw_full_graph_hierarchical(graph)
+
+    dibujo.draw_solution_path(graph, solution)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+# =======================================================
+#        BRANCH AND BOUND — MOCHILA 0/1 (PEREZOSO)
+# =======================================================
+
+import heapq
+import itertools
+import random
+import time
+from bisect import bisect_right
+
+from .grafo import (
+    Item, Node, Graph,
+    split_quantities, join_quantities, path_counts, require_single_resource,
+)
+
+
+# -------------------------------------------------------
+# Razón prioridad/peso (objetos de peso 0 van primero)
+# -------------------------------------------------------
+
+def ratio(item):
+    if item.weight == 0:
+        return float("inf")
+    return item.priority / item.weight
+
+
+# -------------------------------------------------------
+# Cota de Dantzig de una instancia completa (desde la raíz)
+# -------------------------------------------------------
+
+def dantzig_bound(items, capacity):
+    value = 0
+    room = capacity
+
+    for item in sorted(items, key=ratio, reverse=True):
+        if item.weight <= room:
+            value += item.priority
+            room -= item.weight
+        else:
+            return value + room * ratio(item)
+
+    return value
+
+
+# -------------------------------------------------------
+# Valor de la solución voraz (cota inferior del óptimo)
+# -------------------------------------------------------
+
+def greedy_value(items, capacity):
+    value = 0
+    room = capacity
+
+    for item in sorted(items, key=ratio, reverse=True):
+        if item.weight <= room:
+            value += item.priority
+            room -= item.weight
+
+    return value
+
+
+# =======================================================
+#                  Solver Branch and Bound
+# =======================================================
+
+class BranchAndBoundSolver:
+    def __init__(self, graph, order="best"):
+        if order not in ("best", "depth"):
+            raise ValueError(f"orden desconocido: {order!r} (usa 'best' o 'depth')")
+
+        require_single_resource(graph.items, graph.capacity)
+
+        # el grafo NO necesita build(): los nodos se crean bajo demanda
+        self.graph = graph
+        self.order = order
+
+        self.parts = split_quantities(graph.items, graph.capacity)
+
+        # fracción del plazo reservada a la búsqueda local (solo
+        # se usa si branch and bound no cierra la brecha antes)
+        self.local_search_share = 0.25
+
+        # estadísticas de la última búsqueda
+        self.explored = 0
+        self.pruned = 0
+
+        # cota superior del óptimo y brecha (0 si la búsqueda terminó)
+        self.upper_bound = None
+        self.gap = None
+
+    # -------------------------------------------------------
+    # deadline: segundos disponibles (None = hasta el óptimo).
+    # max_nodes: nodos explorados como mucho (acota la memoria).
+    # Con plazo, branch and bound parte de la voraz y tiene el
+    # plazo menos local_search_share; si lo agota sin cerrar la
+    # brecha, la búsqueda local mejora la incumbente con el
+    # tiempo que queda. Al final se devuelve la mejor
+    # encontrada (gap > 0 si no se probó el óptimo)
+    # -------------------------------------------------------
+    def solve(self, deadline=None, max_nodes=None):
+        stop = search_stop = None
+        if deadline is not None:
+            now = time.monotonic()
+            stop = now + deadline
+            search_stop = now + deadline * (1 - self.local_search_share)
+
+        self._prepare()
+
+        # incumbente inicial: solución voraz
+        best = [self._greedy()]
+
+        def accept(node):
+            # solo llegan hojas cuya prioridad supera el umbral
+            best[0] = node
+            return node.priority
+
+        remaining = self._search(best[0].priority, accept, search_stop, max_nodes)
+
+        # brecha abierta: el resto del plazo para la búsqueda local
+        if stop is not None and remaining > best[0].priority:
+            taken = self._local_search(self._positions(best[0]), stop)
+            best[0] = self._chain(taken)
+
+        self.upper_bound = max(best[0].priority, remaining)
+        self.gap = self.upper_bound - best[0].priority
+
+        return self._reconstruct(best[0]), best[0].priority
+
+    # -------------------------------------------------------
+    # Las k mejores soluciones: heap acotado con la k-ésima
+    # mejor prioridad como umbral de poda
+    # -------------------------------------------------------
+    def solve_top_k(self, k):
+        if k < 1:
+            raise ValueError(f"k debe ser >= 1: {k}")
+
+        self._prepare()
+
+        best = []
+        counter = itertools.count()
+
+        # con cantidades, varias combinaciones de partes dan las
+        # mismas unidades de cada objeto: solo cuenta la primera
+        seen = None if self.parts is self.graph.items else set()
+
+        def accept(node):
+            if seen is not None:
+                key = tuple(path_counts(self.graph.items, self._reconstruct(node)))
+                if key in seen:
+                    return best[0][0] if len(best) == k else float("-inf")
+                seen.add(key)
+
+            entry = (node.priority, next(counter), node)
+
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heappushpop(best, entry)
+
+            if len(best) < k:
+                return float("-inf")
+            return best[0][0]
+
+        self._search(float("-inf"), accept)
+
+        best.sort(reverse=True)
+        return [(self._reconstruct(node), priority) for priority, _, node in best]
+
+    def _prepare(self):
+        items = self.parts
+
+        self.explored = 0
+        self.pruned = 0
+
+        # objetos ordenados por prioridad/peso (mejores primero)
+        self.sorted_index = sorted(range(len(items)), key=lambda i: ratio(items[i]), reverse=True)
+        self.sorted_items = [items[i] for i in self.sorted_index]
+
+        # sumas prefijas para calcular la cota en O(log n)
+        self.prefix_weight = [0]
+        self.prefix_priority = [0]
+        for item in self.sorted_items:
+            self.prefix_weight.append(self.prefix_weight[-1] + item.weight)
+            self.prefix_priority.append(self.prefix_priority[-1] + item.priority)
+
+    # -------------------------------------------------------
+    # Búsqueda: heap (best-first) o pila (depth-first)
+    #   threshold: prioridad que un subárbol debe superar
+    #   accept(hoja) -> nuevo umbral
+    # Devuelve la mayor cota de lo que quedó sin explorar
+    # (-inf si la búsqueda terminó antes de stop/max_nodes)
+    # -------------------------------------------------------
+    def _search(self, threshold, accept, stop=None, max_nodes=None):
+        n = len(self.sorted_items)
+
+        # empates de cota: primero el nodo más profundo, para
+        # llegar pronto a una hoja (con razones iguales todas las
+        # cotas coinciden y el heap iría por niveles)
+        start = Node(0, 0, 0)
+        frontier = [(-self.bound(start), 0, 0, start)]
+        counter = 1
+
+        while frontier:
+            if (
+                (stop is not None and time.monotonic() > stop)
+                or (max_nodes is not None and self.explored >= max_nodes)
+            ):
+                # la frontera se suelta al volver: solo queda su cota
+                return self._frontier_bound(frontier)
+
+            if self.order == "best":
+                neg_bound, _, _, current = heapq.heappop(frontier)
+            else:
+                neg_bound, _, _, current = frontier.pop()
+
+            # el umbral pudo subir desde que se generó el nodo
+            if -neg_bound <= threshold:
+                self.pruned += 1
+                continue
+
+            self.explored += 1
+
+            if current.index == n:
+                threshold = accept(current)
+                continue
+
+            for child in self._children(current):
+                child_bound = self.bound(child)
+
+                # poda: el subárbol no puede superar el umbral
+                if child_bound <= threshold:
+                    self.pruned += 1
+                    continue
+
+                entry = (-child_bound, -child.index, counter, child)
+                counter += 1
+
+                if self.order == "best":
+                    heapq.heappush(frontier, entry)
+                else:
+                    frontier.append(entry)
+
+        return float("-inf")
+
+    def _frontier_bound(self, frontier):
+        # best-first: la cima del heap ya tiene la mayor cota
+        if self.order == "best":
+            return -frontier[0][0]
+        return max(-neg_bound for neg_bound, _, _, _ in frontier)
+
+    def _children(self, current):
+        item = self.sorted_items[current.index]
+        children = []
+
+        # NO TOMAR (skip)
+        skip_node = Node(current.index + 1, current.weight, current.priority)
+        skip_node.parent = current
+        skip_node.action = "skip"
+        children.append(skip_node)
+
+        # TOMAR (take) solo si cabe; en la pila se explora primero
+        if current.weight + item.weight <= self.graph.capacity:
+            take_node = Node(
+                current.index + 1,
+                current.weight + item.weight,
+                current.priority + item.priority
+            )
+            take_node.parent = current
+            take_node.action = "take"
+            children.append(take_node)
+
+        return children
+
+    # -------------------------------------------------------
+    # Estimación del tamaño del árbol podado (estimador de
+    # Knuth): descensos aleatorios multiplicando el número de
+    # hijos que sobreviven a la cota frente a la voraz
+    # -------------------------------------------------------
+    def estimate_nodes(self, probes=64, seed=0, cap=1e18):
+        self._prepare()
+
+        threshold = self._greedy().priority
+        n = len(self.sorted_items)
+        rng = random.Random(seed)
+        total = 0
+
+        for _ in range(probes):
+            node = Node(0, 0, 0)
+            width = 1
+            size = 1
+
+            while node.index < n:
+                children = [
+                    child for child in self._children(node)
+                    if self.bound(child) > threshold
+                ]
+                if not children:
+                    break
+
+                width *= len(children)
+                size += width
+
+                # más allá de cap ningún presupuesto alcanza (y
+                # total / probes desbordaría un float)
+                if size > cap:
+                    size = cap
+                    break
+
+                node = rng.choice(children)
+
+            total += size
+
+        return total / probes
+
+    # -------------------------------------------------------
+    # Cota de Dantzig (relajación fraccionaria)
+    # -------------------------------------------------------
+    def bound(self, node):
+        k = node.index
+        room = self.graph.capacity - node.weight
+
+        if k == len(self.sorted_items):
+            return node.priority
+
+        # último objeto que cabe entero a partir de k
+        j = bisect_right(self.prefix_weight, self.prefix_weight[k] + room) - 1
+
+        value = node.priority + self.prefix_priority[j] - self.prefix_priority[k]
+
+        # fracción del objeto de ruptura
+        if j < len(self.sorted_items):
+            left = room - (self.prefix_weight[j] - self.prefix_weight[k])
+            value += left * ratio(self.sorted_items[j])
+
+        return value
+
+    def _greedy(self):
+        taken = set()
+        weight = 0
+
+        for i, item in enumerate(self.sorted_items):
+            if weight + item.weight <= self.graph.capacity:
+                taken.add(i)
+                weight += item.weight
+
+        return self._chain(taken)
+
+    # -------------------------------------------------------
+    # Cadena de nodos (con parent) para un conjunto de
+    # posiciones tomadas, y el camino inverso
+    # -------------------------------------------------------
+    def _chain(self, taken):
+        node = Node(0, 0, 0)
+
+        for i, item in enumerate(self.sorted_items):
+            take = i in taken
+
+            child = Node(
+                node.index + 1,
+                node.weight + item.weight if take else node.weight,
+                node.priority + item.priority if take else node.priority
+            )
+            child.parent = node
+            child.action = "take" if take else "skip"
+            node = child
+
+        return node
+
+    def _positions(self, node):
+        taken = set()
+
+        while node.parent is not None:
+            if node.action == "take":
+                taken.add(node.parent.index)
+            node = node.parent
+
+        return taken
+
+    # -------------------------------------------------------
+    # Búsqueda local: intercambios 1-swap y luego 2-swap
+    # (sacar hasta k objetos y meter hasta k), primera mejora;
+    # acaba en cuanto no queda ningún intercambio que mejore
+    # -------------------------------------------------------
+    def _local_search(self, taken, stop):
+        items = self.sorted_items
+        taken = set(taken)
+
+        weight = sum(items[i].weight for i in taken)
+        priority = sum(items[i].priority for i in taken)
+
+        size = 1
+        while size <= 2 and time.monotonic() <= stop:
+            move = self._find_swap(taken, weight, priority, size, stop)
+
+            if move is None:
+                size += 1
+                continue
+
+            out, inn = move
+            taken.difference_update(out)
+            taken.update(inn)
+
+            weight = sum(items[i].weight for i in taken)
+            priority = sum(items[i].priority for i in taken)
+            size = 1
+
+        return taken
+
+    def _find_swap(self, taken, weight, priority, size, stop):
+        items = self.sorted_items
+        capacity = self.graph.capacity
+
+        inside = sorted(taken)
+        outside = [i for i in range(len(items)) if i not in taken]
+
+        for r_out in range(size + 1):
+            for out in itertools.combinations(inside, r_out):
+                out_weight = sum(items[i].weight for i in out)
+                out_priority = sum(items[i].priority for i in out)
+
+                for r_in in range(1, size + 1):
+                    for inn in itertools.combinations(outside, r_in):
+                        if time.monotonic() > stop:
+                            return None
+
+                        new_weight = weight - out_weight + sum(items[i].weight for i in inn)
+                        new_priority = priority - out_priority + sum(items[i].priority for i in inn)
+
+                        if new_weight <= capacity and new_priority > priority:
+                            return out, inn
+
+        return None
+
+    # -------------------------------------------------------
+    # Reconstrucción en el orden original de los objetos
+    # -------------------------------------------------------
+    def _reconstruct(self, best_node):
+        taken = set()
+        node = best_node
+
+        while node.parent is not None:
+            if node.action == "take":
+                taken.add(self.sorted_index[node.parent.index])
+            node = node.parent
+
+        path = [
+            ("take" if i in taken else "skip", item)
+            for i, item in enumerate(self.parts)
+        ]
+
+        path = join_quantities(self.graph.items, path)
+        return path
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    for order in ("best", "depth"):
+        solver = BranchAndBoundSolver(Graph(items, capacity), order=order)
+        solution, total_priority = solver.solve()
+
+        print(f"\n===== Branch and Bound ({order}) =====\n")
+
+        for action, item in solution:
+            print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+        print(f"\nPrioridad total: {total_priority}")
+        print(f"Nodos explorados: {solver.explored}, podados: {solver.pruned}")
+
+    print("\n===== Con plazo de 200 ms =====\n")
+
+    solver = BranchAndBoundSolver(Graph(items, capacity))
+    solution, total_priority = solver.solve(deadline=0.2)
+
+    print(f"Prioridad total: {total_priority} (brecha ≤ {solver.gap})")
+
+    print("\n===== Las 5 mejores mochilas =====\n")
+
+    solver = BranchAndBoundSolver(Graph(items, capacity))
+
+    for rank, (solution, total_priority) in enumerate(solver.solve_top_k(5), 1):
+        taken = [item.name for action, item in solution if action == "take"]
+        print(f"{rank}. {total_priority} → {taken}")
+
+    print(f"\nNodos explorados: {solver.explored}, podados: {solver.pruned}")
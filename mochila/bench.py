@@ -0,0 +1,329 @@
+# =======================================================
+#        BENCHMARK DE LOS MOTORES DE LA MOCHILA
+# =======================================================
+#
+#   python -m mochila.bench --n 20 40 --kinds uncorrelated strongly
+#   python -m mochila.bench --n 1000000 --repeat 1
+#
+# Cada medición se escribe como una línea JSON en --output
+# (por defecto bench_output.txt) para comparar versiones.
+
+import argparse
+import json
+import math
+import platform
+import random
+import signal
+import subprocess
+import time
+import tracemalloc
+
+from .grafo import Item, Graph, KnapsackSolver, NotApplicable
+from .bb import BranchAndBoundSolver, dantzig_bound
+from .dp import NumpyDPSolver
+from .fptas import FPTASSolver
+from .mitm import MeetInTheMiddleSolver
+from .nucleo import CoreSolver
+from .pareto import ParetoSolver
+from .planner import Planner
+from .stream import StreamingSolver
+from .subsetsum import SubsetSumSolver
+
+
+# =======================================================
+#     Generadores de instancias (estilo Pisinger)
+# =======================================================
+
+def generate(kind, n, R=1000, ratio=0.5, seed=0):
+    rng = random.Random(seed)
+    items = []
+
+    for i in range(n):
+        if kind == "uncorrelated":
+            weight = rng.randint(1, R)
+            priority = rng.randint(1, R)
+        elif kind == "weakly":
+            weight = rng.randint(1, R)
+            priority = max(1, rng.randint(weight - R // 10, weight + R // 10))
+        elif kind == "strongly":
+            weight = rng.randint(1, R)
+            priority = weight + R // 10
+        elif kind == "inverse":
+            priority = rng.randint(1, R)
+            weight = priority + R // 10
+        elif kind == "subset-sum":
+            weight = rng.randint(1, R)
+            priority = weight
+        else:
+            raise ValueError(f"tipo de instancia desconocido: {kind!r}")
+
+        items.append(Item(f"obj-{i}", weight, priority))
+
+    capacity = int(ratio * sum(item.weight for item in items))
+    return items, capacity
+
+
+KINDS = ("uncorrelated", "weakly", "strongly", "inverse", "subset-sum")
+
+
+# =======================================================
+#     Motores: (path, priority, nodos) y tamaño máximo
+# =======================================================
+
+def run_tree(items, capacity):
+    graph = Graph(items, capacity)
+    graph.build()
+    return KnapsackSolver(graph).solve() + (len(graph.nodes),)
+
+
+def run_dag(items, capacity):
+    graph = Graph(items, capacity)
+    graph.build(merge=True)
+    return KnapsackSolver(graph).solve() + (len(graph.nodes),)
+
+
+def run_stream(items, capacity):
+    solver = StreamingSolver(Graph(items, capacity), merge=True)
+    return solver.solve() + (solver.peak_frontier,)
+
+
+def run_bb(items, capacity):
+    solver = BranchAndBoundSolver(Graph(items, capacity))
+    return solver.solve() + (solver.explored,)
+
+
+def run_dp(items, capacity):
+    return NumpyDPSolver(items, capacity).solve() + (len(items) * (capacity + 1),)
+
+
+def run_mitm(items, capacity):
+    solver = MeetInTheMiddleSolver(items, capacity)
+    return solver.solve() + (sum(solver.half_sizes),)
+
+
+def run_pareto(items, capacity):
+    solver = ParetoSolver(items, capacity)
+    return solver.solve() + (solver.max_frontier,)
+
+
+def run_fptas(items, capacity):
+    return FPTASSolver(items, capacity, APPROXIMATE["fptas"]).solve() + (None,)
+
+
+def run_bitset(items, capacity):
+    solver = SubsetSumSolver(items, capacity)
+    return solver.solve() + (len(items) * (capacity // 64 + 1),)
+
+
+def run_core(items, capacity):
+    solver = CoreSolver(items, capacity)
+    return solver.solve() + (solver.max_states,)
+
+
+def run_planner(items, capacity):
+    planner = Planner(items, capacity)
+    return planner.solve() + (planner.choice.states,)
+
+
+ENGINES = {
+    "tree": (run_tree, 15),       # árbol completo: hasta 2^(n+1) nodos
+    "dag": (run_dag, 10_000),
+    "stream": (run_stream, 10_000),
+    "bb": (run_bb, 100_000),
+    "dp": (run_dp, None),
+    "mitm": (run_mitm, 44),
+    "pareto": (run_pareto, 100_000),
+    "fptas": (run_fptas, 5000),   # tabla n × 2n/ε bits: ~60 MiB en n=5000
+    "bitset": (run_bitset, None),
+    "core": (run_core, None),
+    "planner": (run_planner, None),
+}
+
+# Motores aproximados y su ε: basta con (1 - ε)·óptimo
+APPROXIMATE = {"fptas": 0.1}
+
+# Motores por capacidad: se saltan si n × (C + 1) supera esto
+CELL_LIMITED = ("dp", "bitset")
+MAX_CELLS = 4 * 10**9
+
+
+# =======================================================
+#                  Medición
+# =======================================================
+
+def _expire(signum, frame):
+    raise TimeoutError("presupuesto agotado")
+
+
+def measure(engine, items, capacity, repeat=3, budget=None):
+    run, _ = ENGINES[engine]
+
+    # la primera ejecución con tope de budget segundos (SIGALRM,
+    # solo POSIX): un motor exponencial en esta instancia lanza
+    # TimeoutError en vez de bloquear el benchmark
+    alarm = budget is not None and hasattr(signal, "setitimer")
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _expire)
+        signal.setitimer(signal.ITIMER_REAL, budget)
+
+    try:
+        start = time.perf_counter()
+        path, priority, nodes = run(items, capacity)
+        seconds = time.perf_counter() - start
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    # tiempo: la mejor de varias ejecuciones, sin tracemalloc
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        path, priority, nodes = run(items, capacity)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # memoria: una ejecución más bajo tracemalloc
+    tracemalloc.start()
+    try:
+        run(items, capacity)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    taken = [item for action, item in path if action == "take"]
+    feasible = sum(item.weight for item in taken) <= capacity
+    consistent = abs(sum(item.priority for item in taken) - priority) <= _tolerance(priority)
+
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak,
+        "nodes": nodes,
+        "priority": priority,
+        "feasible": feasible and consistent,
+    }
+
+
+# Holgura de redondeo al comparar prioridades (sumas en float)
+def _tolerance(value):
+    return 1e-9 * max(1.0, abs(value))
+
+
+# True: factible e igual a la referencia (o alcanza la cota); None:
+# sin verificar. Con epsilon (motor aproximado) basta llegar a
+# (1 - ε) de ellas. Una solución infactible nunca es correcta
+def check(priority, reference, bound, epsilon=0, feasible=True):
+    if not feasible:
+        return False
+
+    if reference is not None:
+        tolerance = _tolerance(reference)
+        if epsilon:
+            return (1 - epsilon) * reference - tolerance <= priority <= reference + tolerance
+        return abs(priority - reference) <= tolerance
+
+    tolerance = _tolerance(bound)
+    if priority > bound + tolerance:
+        return False
+    return True if priority >= (1 - epsilon) * bound - tolerance else None
+
+
+VERDICT = {True: "ok", False: "DIFERENTE", None: "sin verificar"}
+
+
+def git_version():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la mochila 0/1")
+    parser.add_argument("--n", type=int, nargs="+", default=[15, 40])
+    parser.add_argument("--range", type=int, default=1000, dest="R")
+    parser.add_argument("--capacity-ratio", type=float, default=0.5)
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--seeds", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=10.0,
+                        help="segundos para la primera ejecución de cada motor (0 = sin tope)")
+    parser.add_argument("--output", default="bench_output.txt")
+    args = parser.parse_args(argv)
+
+    version = git_version()
+
+    with open(args.output, "a", encoding="utf-8") as out:
+        for kind in args.kinds:
+            for n in args.n:
+                for seed in range(args.seeds):
+                    items, capacity = generate(kind, n, args.R, args.capacity_ratio, seed)
+
+                    # solución de referencia: DP exacta. Si la tabla no
+                    # cabe no hay referencia; la cota de Dantzig solo
+                    # certifica un resultado que la alcanza
+                    cells = n * (capacity + 1)
+                    if cells <= MAX_CELLS:
+                        reference = NumpyDPSolver(items, capacity).solve()[1]
+                        bound = None
+                    else:
+                        reference = None
+                        bound = math.floor(dantzig_bound(items, capacity))
+
+                    for engine in args.engines:
+                        record = {
+                            "version": version,
+                            "python": platform.python_version(),
+                            "kind": kind,
+                            "n": n,
+                            "capacity": capacity,
+                            "seed": seed,
+                            "engine": engine,
+                            "reference": reference,
+                        }
+                        if bound is not None:
+                            record["bound"] = bound
+
+                        max_n = ENGINES[engine][1]
+                        if max_n is not None and n > max_n:
+                            record["skipped"] = f"n > {max_n}"
+                        elif engine in CELL_LIMITED and cells > MAX_CELLS:
+                            record["skipped"] = f"n·(C+1) > {MAX_CELLS:.0e}"
+                        else:
+                            # motores especializados (bitset) rechazan otras
+                            # instancias con NotApplicable; cualquier otro
+                            # error es un fallo del motor y se propaga
+                            try:
+                                record.update(measure(
+                                    engine, items, capacity, args.repeat, args.budget or None
+                                ))
+                                record["correct"] = check(
+                                    record["priority"], reference, bound,
+                                    APPROXIMATE.get(engine, 0), record["feasible"]
+                                )
+                            except NotApplicable:
+                                record["skipped"] = "no aplica"
+                            except MemoryError:
+                                record["skipped"] = "sin memoria"
+                            except TimeoutError:
+                                record["skipped"] = f"más de {args.budget:g} s"
+
+                        out.write(json.dumps(record) + "\n")
+                        out.flush()
+
+                        print(
+                            f"{kind:12s} n={n:<5d} {engine:8s} "
+                            + (
+                                record.get("skipped")
+                                or f"{record['seconds'] * 1000:9.2f} ms  "
+                                   f"{record['peak_bytes'] / 1024:9.1f} KiB  "
+                                   f"{VERDICT[record['correct']]}"
+                            )
+                        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# =======================================================
+#    CACHÉ DE SOLUCIONES (LRU en memoria + sqlite)
+# =======================================================
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+
+from .grafo import Item, path_counts, path_from_counts, require_single_resource
+from .planner import Planner
+
+
+# -------------------------------------------------------
+# Forma canónica: pares (peso, prioridad) ordenados, así
+# que ni los nombres ni el orden de los objetos importan
+# -------------------------------------------------------
+
+def canonical_order(items):
+    return sorted(
+        range(len(items)),
+        key=lambda i: (items[i].weight, items[i].priority, items[i].quantity)
+    )
+
+
+def canonical_key(items, capacity, order=None):
+    if order is None:
+        order = canonical_order(items)
+
+    # la cantidad solo entra en la clave si no es 1: las claves
+    # de instancias 0/1 ya guardadas no cambian
+    pairs = [
+        (items[i].weight, items[i].priority) if items[i].quantity == 1
+        else (items[i].weight, items[i].priority, items[i].quantity)
+        for i in order
+    ]
+    data = json.dumps([capacity, pairs], separators=(",", ":"))
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def default_solver(items, capacity):
+    return Planner(items, capacity).solve()
+
+
+# =======================================================
+#                  Caché de soluciones
+# =======================================================
+
+class SolutionCache:
+    def __init__(self, solver=default_solver, maxsize=1024, path=None):
+        # solver(items, capacity) -> (path, priority)
+        self.solver = solver
+        self.maxsize = maxsize
+
+        # clave -> (prioridad, posiciones canónicas tomadas)
+        self.memory = OrderedDict()
+
+        # almacén en disco opcional, compartido entre procesos
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path, timeout=30)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                " key TEXT PRIMARY KEY,"
+                " priority TEXT NOT NULL,"
+                " taken TEXT NOT NULL)"
+            )
+            self.db.commit()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def solve(self, items, capacity):
+        # la clave canónica solo mira peso, prioridad y cantidad
+        require_single_resource(items, capacity)
+
+        order = canonical_order(items)
+        key = canonical_key(items, capacity, order)
+
+        entry = self._get(key)
+
+        if entry is None:
+            self.misses += 1
+            path, priority = self.solver(items, capacity)
+
+            # guardar las posiciones canónicas de los objetos tomados
+            # (repetidas una vez por unidad si hay cantidades)
+            position = {index: rank for rank, index in enumerate(order)}
+            taken = sorted(
+                position[i]
+                for i, count in enumerate(path_counts(items, path))
+                for _ in range(count)
+            )
+
+            entry = (priority, taken)
+            self._put(key, entry)
+            return path, priority
+
+        # traducir la solución canónica a los objetos del llamador
+        priority, taken = entry
+        counts = [0] * len(items)
+
+        for rank in taken:
+            counts[order[rank]] += 1
+
+        return path_from_counts(items, counts), priority
+
+    # -------------------------------------------------------
+    # LRU en memoria y, si no está, sqlite
+    # -------------------------------------------------------
+    def _get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+
+        if self.db is None:
+            return None
+
+        row = self.db.execute(
+            "SELECT priority, taken FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self.disk_hits += 1
+        entry = (json.loads(row[0]), json.loads(row[1]))
+        self._remember(key, entry)
+        return entry
+
+    def _put(self, key, entry):
+        self._remember(key, entry)
+
+        if self.db is not None:
+            priority, taken = entry
+            self.db.execute(
+                "INSERT OR REPLACE INTO solutions (key, priority, taken) VALUES (?, ?, ?)",
+                (key, json.dumps(priority), json.dumps(taken))
+            )
+            self.db.commit()
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+
+        while len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    cache = SolutionCache(maxsize=128)
+    cache.solve(items, capacity)
+
+    # mismo inventario con otros nombres y en otro orden: acierto
+    renamed = [Item(f"Caja {i}", item.weight, item.priority) for i, item in enumerate(reversed(items))]
+    solution, total_priority = cache.solve(renamed, capacity)
+
+    print("\n===== Caché de soluciones =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Aciertos: {cache.hits}, fallos: {cache.misses}")
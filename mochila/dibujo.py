@@ -0,0 +1,201 @@
+# =======================================================
+#       FUNCIONES DE DIBUJO (networkx + matplotlib)
+# =======================================================
+#
+# Este módulo no se importa desde mochila/__init__.py:
+# solo quien dibuja paga el coste de networkx y matplotlib.
+#
+#   from mochila.dibujo import draw_solution_path
+
+import networkx as nx
+import matplotlib.pyplot as plt
+
+from .grafo import path_counts
+
+
+# con cantidades hay una arista take por número de unidades
+def edge_label(edge):
+    count = edge.next_node.count
+    if edge.decision == "take" and count > 1:
+        return f"take ×{count}"
+    return edge.decision
+
+
+# ---------------- Grafo de decisiones -------------------
+
+def draw_graph(graph):
+    G = nx.DiGraph()
+
+    # Crear nodos con etiquetas
+    for node in graph.nodes:
+        label = f"(i={node.index}, W={node.weight}, P={node.priority})"
+        G.add_node(node, label=label)
+
+    # Crear aristas
+    for node in graph.nodes:
+        for edge in node.edges:
+            G.add_edge(
+                node, edge.next_node,
+                label=edge_label(edge)
+            )
+
+    pos = nx.spring_layout(G, seed=42)  # diseño automático agradable
+
+    plt.figure(figsize=(16, 10))
+
+    # Dibujar nodos
+    nx.draw_networkx_nodes(G, pos, node_size=1200, node_color="#90caf9")
+
+    # Dibujar aristas
+    nx.draw_networkx_edges(G, pos, arrowstyle='->', arrowsize=20)
+
+    # Dibujar etiquetas de nodos
+    labels = nx.get_node_attributes(G, 'label')
+    nx.draw_networkx_labels(G, pos, labels, font_size=8)
+
+    # Dibujar etiquetas de aristas
+    edge_labels = nx.get_edge_attributes(G, 'label')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_color='red')
+
+    plt.title("Grafo de decisiones — Problema de la Mochila (Star Wars)")
+    plt.axis('off')
+    plt.show()
+
+
+# ---------------- Grafo completo (todas las decisiones) -------------------
+
+def draw_full_graph(graph):
+    G = nx.DiGraph()
+
+    # añadir nodos
+    for node in graph.nodes:
+        label = f"(i={node.index}, W={node.weight}, P={node.priority})"
+        G.add_node(node, label=label)
+
+    # añadir aristas
+    for node in graph.nodes:
+        for edge in node.edges:
+            G.add_edge(node, edge.next_node, label=edge_label(edge))
+
+    pos = nx.spring_layout(G, seed=1, k=0.5)
+
+    plt.figure(figsize=(18, 10))
+    nx.draw(
+        G, pos,
+        with_labels=True,
+        labels=nx.get_node_attributes(G, 'label'),
+        node_size=1800,
+        node_color="#90caf9",
+        font_size=7,
+        arrowsize=20
+    )
+
+    edge_labels = nx.get_edge_attributes(G, 'label')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels, font_color='red')
+
+    plt.title("Grafo Completo — Todas las decisiones (take/skip)")
+    plt.axis("off")
+    plt.show()
+
+
+# ---------------- Hierarchical Layout (tipo árbol) -------------------
+
+def hierarchy_pos(G, root):
+
+    layers = {}
+    for node in G.nodes():
+        layers[node] = G.nodes[node]['level']
+
+    pos = {}
+
+    # grupos por nivel
+    levels = {}
+    for node, level in layers.items():
+        levels.setdefault(level, []).append(node)
+
+    # distribución horizontal
+    for level, nodes in levels.items():
+        spacing = 1 / (len(nodes) + 1)
+        for i, node in enumerate(nodes):
+            pos[node] = (i * spacing, -level)
+
+    return pos
+
+
+# ---------------- Grafo completo ORDENADO + export PNG -------------------
+
+def draw_full_graph_hierarchical(graph, export_filename="grafo_mochila.png"):
+
+    G = nx.DiGraph()
+
+    # añadir nodos con niveles
+    for node in graph.nodes:
+        label = f"(i={node.index}, W={node.weight}, P={node.priority})"
+        G.add_node(node, label=label, level=node.index)
+
+    # añadir aristas
+    for node in graph.nodes:
+        for edge in node.edges:
+            G.add_edge(node, edge.next_node, label=edge_label(edge))
+
+    # layout jerárquico
+    pos = hierarchy_pos(G, graph.start)
+
+    plt.figure(figsize=(20, 12))
+    nx.draw(
+        G, pos,
+        labels=nx.get_node_attributes(G, 'label'),
+        node_size=2000,
+        node_color="#90caf9",
+        font_size=8,
+        arrowsize=20
+    )
+
+    nx.draw_networkx_edge_labels(G, pos, nx.get_edge_attributes(G, 'label'), font_color='red')
+
+    plt.title("Grafo Completo del Problema de la Mochila (Star Wars)\nLayout Jerárquico")
+    plt.axis("off")
+
+    # ----------- EXPORTAR A PNG -----------
+    plt.savefig(export_filename, dpi=300, bbox_inches='tight')
+    print(f"\n✅ Grafo exportado como: {export_filename}\n")
+
+    plt.show()
+
+
+# ---------------------- Camino óptimo -----------------------------
+
+def draw_solution_path(graph, solution, seed=7):
+    G = nx.DiGraph()
+
+    current = graph.start
+    nodes = [current]
+
+    # reconstruir nodos usados en el camino: un nivel por objeto,
+    # y en él la arista con las unidades tomadas (skip si ninguna)
+    for count in path_counts(graph.items, solution):
+        for e in current.edges:
+            units = e.next_node.count if e.decision == "take" else 0
+            if units == count:
+                next_node = e.next_node
+                G.add_edge(current, next_node, label=edge_label(e))
+                nodes.append(next_node)
+                current = next_node
+                break
+
+    labels = {n: f"(i={n.index}, W={n.weight}, P={n.priority})" for n in nodes}
+
+    pos = nx.spring_layout(G, seed=seed)
+
+    plt.figure(figsize=(14, 7))
+    nx.draw(
+        G, pos, with_labels=True, labels=labels,
+        node_size=2500, node_color="#81c784",
+        arrowsize=25, font_size=9
+    )
+
+    nx.draw_networkx_edge_labels(G, pos, nx.get_edge_attributes(G, 'label'), font_color='blue')
+
+    plt.title("Camino Óptimo — Problema de la Mochila (Star Wars)")
+    plt.axis("off")
+    plt.show()
@@ -0,0 +1,174 @@
+# =======================================================
+#     PROGRAMACIÓN DINÁMICA VECTORIZADA (NumPy) — 0/1
+# =======================================================
+
+import numpy as np
+
+from .grafo import Item, UNBOUNDED, split_quantities, join_quantities, require_single_resource
+
+
+# =======================================================
+#                  Solver DP (NumPy)
+# =======================================================
+
+class NumpyDPSolver:
+    def __init__(self, items, capacity):
+        require_single_resource(items, capacity)
+
+        for item in items:
+            if item.weight < 0 or int(item.weight) != item.weight:
+                raise ValueError(f"peso no entero o negativo: {item!r}")
+
+        self.items = items
+        self.capacity = int(capacity)
+
+        # objetos con cantidad: una fila por potencia de dos,
+        # O(C·log q) en vez de q filas
+        self.parts = split_quantities(items, self.capacity)
+
+        # values[w] = mejor prioridad con peso <= w (última fila)
+        self.values = None
+
+        # choice[i] = bits empaquetados: 1 si se toma el objeto i
+        # cuando la capacidad restante es w  (n × (C+1) bits)
+        self.choice = None
+
+    def solve(self):
+        if self.values is None:
+            self.fill()
+        return self.reconstruct(self.capacity), self.best(self.capacity)
+
+    # -------------------------------------------------------
+    # Consultas para todas las capacidades 0..C en una pasada
+    # -------------------------------------------------------
+    def solve_all(self):
+        if self.values is None:
+            self.fill()
+        return self.values
+
+    def solution(self, capacity):
+        if not 0 <= capacity <= self.capacity:
+            raise ValueError(f"capacidad fuera de rango: {capacity} (máx. {self.capacity})")
+
+        # la tabla de decisiones sirve para cualquier capacidad <= C
+        if self.values is None:
+            self.fill()
+        return self.reconstruct(capacity), self.best(capacity)
+
+    # -------------------------------------------------------
+    # Tabla de valores: una fila por objeto
+    # -------------------------------------------------------
+    def fill(self):
+        C = self.capacity
+        n = len(self.parts)
+
+        integral = all(int(item.priority) == item.priority for item in self.parts)
+        dtype = np.int64 if integral else np.float64
+
+        values = np.zeros(C + 1, dtype=dtype)
+        choice = np.zeros((n, (C + 8) // 8), dtype=np.uint8)
+        take = np.zeros(C + 1, dtype=bool)
+
+        for i, item in enumerate(self.parts):
+            w = int(item.weight)
+
+            # no cabe en ninguna capacidad: fila de ceros
+            if w > C:
+                continue
+
+            # valor si se toma el objeto (calculado con la fila anterior)
+            candidate = values[:C + 1 - w] + item.priority
+
+            take[:w] = False
+            np.greater(candidate, values[w:], out=take[w:])
+            np.maximum(values[w:], candidate, out=values[w:])
+
+            choice[i] = np.packbits(take)
+
+        self.values = values
+        self.choice = choice
+        return values
+
+    def best(self, capacity):
+        value = self.values[capacity]
+        return value.item()
+
+    def taken(self, i, w):
+        # packbits usa orden big-endian dentro de cada byte
+        return (self.choice[i, w >> 3] >> (7 - (w & 7))) & 1
+
+    # -------------------------------------------------------
+    # Reconstrucción: recorrer la tabla de decisiones al revés
+    # -------------------------------------------------------
+    def reconstruct(self, capacity):
+        path = []
+        w = capacity
+
+        for i in range(len(self.parts) - 1, -1, -1):
+            item = self.parts[i]
+
+            if self.taken(i, w):
+                path.append(("take", item))
+                w -= int(item.weight)
+            else:
+                path.append(("skip", item))
+
+        path.reverse()
+
+        path = join_quantities(self.items, path)
+        return path
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = NumpyDPSolver(items, capacity)
+    solution, total_priority = solver.solve()
+
+    print("\n===== DP vectorizada (NumPy) =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Tabla de decisiones: {solver.choice.nbytes} bytes")
+
+    # barrido de capacidades con la misma tabla
+    print("\n===== Prioridad óptima por capacidad =====\n")
+
+    for w, value in enumerate(solver.solve_all()):
+        print(f"C={w:2d} → {value}")
+
+    solution, total_priority = solver.solution(7)
+    taken = [item.name for action, item in solution if action == "take"]
+    print(f"\nC=7: {taken} (prioridad {total_priority})")
+
+    # existencias: 500 holoproyectores y bláster sin límite
+    stock = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40, quantity=500),
+        Item("Bláster DL-44", 4, 70, quantity=UNBOUNDED)
+    ]
+
+    solver = NumpyDPSolver(stock, capacity)
+    solution, total_priority = solver.solve()
+
+    print("\n===== Con cantidades =====\n")
+
+    for item in stock:
+        units = sum(1 for action, taken in solution if taken is item and action == "take")
+        print(f"{units} × {item}")
+
+    print(f"\nPrioridad total: {total_priority} ({len(solver.parts)} filas)")
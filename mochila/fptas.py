@@ -0,0 +1,140 @@
+# =======================================================
+#       FPTAS — MOCHILA 0/1 APROXIMADA (1 - ε)
+# =======================================================
+
+import numpy as np
+
+from .grafo import Item, split_quantities, join_quantities, require_single_resource
+from .bb import dantzig_bound, greedy_value
+
+
+# =======================================================
+#                  Solver aproximado
+# =======================================================
+
+class FPTASSolver:
+    def __init__(self, items, capacity, epsilon=0.1):
+        if not 0 < epsilon < 1:
+            raise ValueError(f"epsilon debe estar en (0, 1): {epsilon}")
+
+        require_single_resource(items, capacity)
+
+        self.items = items
+        self.capacity = capacity
+        self.epsilon = epsilon
+
+        self.parts = split_quantities(items, capacity)
+
+        # cota superior certificada del óptimo y brecha máxima
+        self.upper_bound = None
+        self.gap = None
+
+    def solve(self):
+        # los objetos que no caben solos no pueden estar en ninguna solución
+        candidates = [
+            i for i, item in enumerate(self.parts)
+            if item.weight <= self.capacity and item.priority > 0
+        ]
+
+        if not candidates:
+            self.upper_bound = 0
+            self.gap = 0
+            return [("skip", item) for item in self.items], 0
+
+        # -----------------------------------------------
+        # Escalar y redondear prioridades: p' = floor(p / K)
+        # con K = ε·LB/n, LB = max(voraz, p_max) <= OPT.
+        # Ninguna solución pasa de la cota de Dantzig U,
+        # y U <= 2·LB: el eje de la DP llega a U/K <= 2n/ε
+        # (no a la suma de todas las prioridades escaladas)
+        # -----------------------------------------------
+        items = [self.parts[i] for i in candidates]
+        n = len(candidates)
+
+        lower = max(greedy_value(items, self.capacity), max(item.priority for item in items))
+        upper = dantzig_bound(items, self.capacity)
+        K = self.epsilon * lower / n
+
+        scaled = [int(item.priority // K) for item in items]
+        total = min(sum(scaled), int(upper // K))
+
+        # -----------------------------------------------
+        # DP indexada por prioridad escalada:
+        # min_weight[q] = menor peso que alcanza prioridad q
+        # -----------------------------------------------
+        min_weight = np.full(total + 1, np.inf)
+        min_weight[0] = 0
+
+        choice = np.zeros((n, (total + 8) // 8), dtype=np.uint8)
+        take = np.zeros(total + 1, dtype=bool)
+
+        for row, i in enumerate(candidates):
+            q = scaled[row]
+            if q > total:
+                continue
+
+            candidate = min_weight[:total + 1 - q] + self.parts[i].weight
+
+            take[:q] = False
+            np.less(candidate, min_weight[q:], out=take[q:])
+            np.minimum(min_weight[q:], candidate, out=min_weight[q:])
+
+            choice[row] = np.packbits(take)
+
+        best_q = int(np.flatnonzero(min_weight <= self.capacity)[-1])
+
+        # reconstrucción sobre la tabla de decisiones
+        taken = set()
+        q = best_q
+
+        for row in range(n - 1, -1, -1):
+            if (choice[row, q >> 3] >> (7 - (q & 7))) & 1:
+                taken.add(candidates[row])
+                q -= scaled[row]
+
+        path = [
+            ("take" if i in taken else "skip", item)
+            for i, item in enumerate(self.parts)
+        ]
+
+        path = join_quantities(self.items, path)
+        priority = sum(self.parts[i].priority for i in taken)
+
+        # -----------------------------------------------
+        # Certificado: el redondeo pierde menos de K por
+        # objeto, así que OPT <= prioridad + n·K, que es
+        # prioridad + ε·LB <= prioridad + ε·OPT; la cota
+        # de Dantzig también acota el óptimo
+        # -----------------------------------------------
+        self.upper_bound = min(priority + n * K, upper)
+        self.gap = self.upper_bound - priority
+
+        return path, priority
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    for epsilon in (0.5, 0.1):
+        solver = FPTASSolver(items, capacity, epsilon)
+        solution, total_priority = solver.solve()
+
+        print(f"\n===== FPTAS (ε = {epsilon}) =====\n")
+
+        for action, item in solution:
+            print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+        print(f"\nPrioridad total: {total_priority}")
+        print(f"Cota superior del óptimo: {solver.upper_bound:.1f} (brecha ≤ {solver.gap:.1f})")
@@ -0,0 +1,573 @@
+import numbers
+import time
+from collections import deque
+
+# cantidad de un objeto sin límite de existencias
+UNBOUNDED = float("inf")
+
+
+# -------------------------------------------------------
+# TDA: Item (objeto de Star Wars)
+# -------------------------------------------------------
+
+class Item:
+    def __init__(self, name, weight, priority, costs=(), quantity=1):
+        self.name = name
+        self.weight = weight
+        self.priority = priority
+
+        # otros recursos además del peso (volumen, energía, ...)
+        self.costs = tuple(costs)
+
+        # unidades disponibles (1 = mochila 0/1, UNBOUNDED = sin límite)
+        if quantity != UNBOUNDED and (quantity < 0 or int(quantity) != quantity):
+            raise ValueError(f"cantidad no entera o negativa: {quantity!r}")
+        self.quantity = quantity
+
+    def resources(self):
+        return (self.weight,) + self.costs
+
+    def units(self, capacity):
+        # unidades que caben en capacity (como mucho quantity); con
+        # un vector de capacidades manda el recurso más escaso
+        if hasattr(capacity, "__len__"):
+            limits = [c // r for r, c in zip(self.resources(), capacity) if r > 0]
+        elif self.weight > 0:
+            limits = [capacity // self.weight]
+        else:
+            limits = []
+
+        if not limits:
+            if self.quantity == UNBOUNDED:
+                raise ValueError(f"objeto sin peso y sin límite de unidades: {self!r}")
+            return int(self.quantity)
+        return int(min(self.quantity, *limits))
+
+    def __repr__(self):
+        if self.quantity == 1:
+            count = ""
+        elif self.quantity == UNBOUNDED:
+            count = " ×∞"
+        else:
+            count = f" ×{self.quantity}"
+
+        if self.costs:
+            return f"{self.name}{count} (W:{self.weight}, R:{self.costs}, P:{self.priority})"
+        return f"{self.name}{count} (W:{self.weight}, P:{self.priority})"
+
+
+# -------------------------------------------------------
+# Cantidades: un camino lleva un ("take", item) por unidad
+# tomada, o un solo ("skip", item) si no se toma ninguna.
+#
+# Los motores 0/1 reciben objetos con cantidad partidos en
+# potencias de dos (1, 2, 4, ..., resto): q unidades son
+# O(log q) objetos 0/1 y cualquier cantidad 0..q se puede
+# formar con ellos. Cada motor hace
+#
+#   self.parts = split_quantities(items, capacity)
+#   ...resolver sobre self.parts...
+#   path = join_quantities(items, path)
+#
+# y ambas son la identidad si todos los objetos son 0/1
+# -------------------------------------------------------
+
+def split_quantities(items, capacity):
+    # sin cantidades: la misma lista (nada que partir)
+    if all(item.quantity == 1 for item in items):
+        return items
+
+    parts = []
+
+    for item in items:
+        if item.quantity == 1:
+            parts.append(item)
+            continue
+
+        remaining = item.units(capacity)
+        size = 1
+
+        while remaining > 0:
+            units = min(size, remaining)
+
+            part = Item(
+                item.name,
+                units * item.weight,
+                units * item.priority,
+                tuple(units * c for c in item.costs)
+            )
+            part.source = item
+            part.count = units
+            parts.append(part)
+
+            remaining -= units
+            size *= 2
+
+    return parts
+
+
+# -------------------------------------------------------
+# Solo MultiDimSolver mira los costs: el resto de motores
+# compara el peso con una capacidad escalar y rechaza
+# objetos con otros recursos o capacidades vectoriales.
+# capacity=None es sin límite (la frontera de ParetoSolver)
+# -------------------------------------------------------
+
+class NotApplicable(ValueError):
+    # la instancia no es del tipo que el motor resuelve (p. ej.
+    # subset-sum con priority != weight): no es un fallo del
+    # motor, quien compara motores la salta
+    pass
+
+
+def require_single_resource(items, capacity):
+    if isinstance(capacity, (list, tuple)):
+        raise ValueError(
+            f"capacidad con varios recursos: {capacity!r} "
+            f"(usa MultiDimSolver con este tipo de instancia)"
+        )
+
+    if capacity is not None and (
+        isinstance(capacity, bool) or not isinstance(capacity, numbers.Real)
+    ):
+        raise TypeError(f"capacidad no numérica: {capacity!r}")
+
+    for item in items:
+        if item.costs:
+            raise ValueError(
+                f"objeto con otros recursos además del peso: {item!r} "
+                f"(usa MultiDimSolver con este tipo de instancia)"
+            )
+
+
+def path_counts(items, path):
+    # unidades tomadas de cada objeto de items, en su orden
+    counts = [0] * len(items)
+    i = 0
+
+    for action, item in path:
+        source = getattr(item, "source", item)
+
+        while items[i] is not source:
+            i += 1
+
+        if action == "take":
+            counts[i] += getattr(item, "count", 1)
+
+        # objeto 0/1 ya decidido: el siguiente puede ser el mismo objeto
+        if source is item and (action == "skip" or counts[i] == item.quantity):
+            i += 1
+
+    return counts
+
+
+def path_from_counts(items, counts):
+    path = []
+
+    for item, count in zip(items, counts):
+        if count:
+            path.extend([("take", item)] * count)
+        else:
+            path.append(("skip", item))
+
+    return path
+
+
+def join_quantities(items, path):
+    # camino sobre split_quantities(items) → camino sobre items
+    # (sin cantidades las partes son los propios objetos)
+    if all(item.quantity == 1 for item in items):
+        return path
+    return path_from_counts(items, path_counts(items, path))
+
+
+# -------------------------------------------------------
+# TDA: Node del grafo
+# -------------------------------------------------------
+
+class Node:
+    def __init__(self, index, weight, priority):
+        self.index = index        # índice del objeto considerado
+        self.weight = weight      # peso acumulado
+        self.priority = priority  # prioridad acumulada
+        
+        self.edges = []           # aristas hacia nodos hijos
+
+        # Datos para reconstrucción elegante
+        self.parent = None        # nodo padre
+        self.action = None        # "take" o "skip"
+        self.count = 1            # unidades tomadas (1 si es skip)
+
+    def add_edge(self, edge):
+        self.edges.append(edge)
+
+
+# -------------------------------------------------------
+# TDA: Edge (transición entre nodos)
+# -------------------------------------------------------
+
+class Edge:
+    def __init__(self, next_node, decision):
+        self.next_node = next_node
+        self.decision = decision  # "take" o "skip"
+
+
+# -------------------------------------------------------
+# TDA: Grafo completo (grafo de decisiones)
+# -------------------------------------------------------
+
+class Graph:
+    def __init__(self, items, capacity):
+        self.items = items
+        self.capacity = capacity
+        self.start = Node(0, 0, 0)
+        self.nodes = [self.start]
+
+    def build(self, merge=False, stats=None):
+        require_single_resource(self.items, self.capacity)
+
+        queue = deque([self.start])
+
+        # con merge=True los nodos se identifican por (index, weight):
+        # dos estados con el mismo índice y peso son equivalentes, así
+        # que se guarda uno solo con el padre de mayor prioridad
+        # (DAG de a lo sumo n·(C+1) nodos en vez de árbol de 2^n)
+        merged = {} if merge else None
+
+        if stats is not None:
+            stats.start_build()
+
+        while queue:
+            current = queue.popleft()
+
+            if stats is not None:
+                stats.expand(current.index, len(queue) + 1, len(self.nodes))
+
+            # si ya consideramos todos los objetos, no expandimos más
+            if current.index == len(self.items):
+                continue
+
+            item = self.items[current.index]
+
+            # ----------------------------------------------------
+            # Árbol de objetos 0/1 (el caso por defecto): los dos
+            # hijos se crean aquí mismo, sin merge ni bucle de
+            # unidades
+            # ----------------------------------------------------
+            if merged is None and item.quantity == 1:
+                skip_node = Node(current.index + 1, current.weight, current.priority)
+                skip_node.parent = current
+                skip_node.action = "skip"
+
+                self.nodes.append(skip_node)
+                current.add_edge(Edge(skip_node, "skip"))
+                queue.append(skip_node)
+
+                new_weight = current.weight + item.weight
+
+                if new_weight <= self.capacity:
+                    take_node = Node(current.index + 1, new_weight, current.priority + item.priority)
+                    take_node.parent = current
+                    take_node.action = "take"
+
+                    self.nodes.append(take_node)
+                    current.add_edge(Edge(take_node, "take"))
+                    queue.append(take_node)
+                elif stats is not None:
+                    stats.reject()
+                continue
+
+            # ----------------------------------------------------
+            # DAG con cantidad: el nivel entero a la vez, sobre las
+            # partes 1, 2, 4, ... del objeto (O(C·log q) en vez de
+            # un hijo por unidad, O(C·q))
+            # ----------------------------------------------------
+            if merged is not None and item.quantity != 1:
+                level = [current]
+
+                # en la cola FIFO el resto del nivel va delante
+                while queue and queue[0].index == current.index:
+                    if stats is not None:
+                        stats.expand(current.index, len(queue), len(self.nodes))
+                    level.append(queue.popleft())
+
+                self._add_units(level, item, queue, merged, stats)
+                continue
+
+            # ----------------------------------------------------
+            # Opción 1: NO TOMAR (skip)
+            # ----------------------------------------------------
+            self._add_child(
+                current,
+                current.weight,
+                current.priority,
+                "skip", queue, merged, stats=stats
+            )
+
+            # ----------------------------------------------------
+            # Opción 2: TOMAR (take) si el peso lo permite; en el
+            # árbol con cantidad, un hijo por número de unidades que
+            # caben (un solo nivel por objeto, no uno por unidad)
+            # ----------------------------------------------------
+            if item.quantity == 1:
+                units = 1 if current.weight + item.weight <= self.capacity else 0
+            else:
+                units = item.units(self.capacity - current.weight)
+
+            for count in range(1, units + 1):
+                self._add_child(
+                    current,
+                    current.weight + count * item.weight,
+                    current.priority + count * item.priority,
+                    "take", queue, merged, count, stats
+                )
+
+            if units == 0 and stats is not None:
+                stats.reject()
+
+        if stats is not None:
+            stats.finish_build(len(self.nodes))
+
+    def _add_units(self, level, item, queue, merged, stats):
+        # peso -> (prioridad, padre, unidades), empezando por el
+        # skip de cada nodo del nivel
+        best = {}
+
+        for node in level:
+            kept = best.get(node.weight)
+            if kept is not None and stats is not None:
+                stats.merge()
+            if kept is None or node.priority > kept[0]:
+                best[node.weight] = (node.priority, node, 0)
+
+            if stats is not None and node.weight + item.weight > self.capacity:
+                stats.reject()
+
+        # cada parte se toma o no (0/1 sobre una copia de best):
+        # cualquier número de unidades 0..q sale de las partes
+        for part in split_quantities([item], self.capacity):
+            for weight, (priority, parent, count) in list(best.items()):
+                new_weight = weight + part.weight
+                if new_weight > self.capacity:
+                    continue
+
+                new_priority = priority + part.priority
+                kept = best.get(new_weight)
+                if kept is not None and stats is not None:
+                    stats.merge()
+
+                if kept is None or new_priority > kept[0]:
+                    best[new_weight] = (new_priority, parent, count + part.count)
+
+        for weight, (priority, parent, count) in best.items():
+            if count:
+                self._add_child(parent, weight, priority, "take", queue, merged, count)
+            else:
+                self._add_child(parent, weight, priority, "skip", queue, merged)
+
+    def _add_child(self, current, weight, priority, action, queue, merged, count=1, stats=None):
+        key = (current.index + 1, weight)
+
+        # estado ya visto: solo nos quedamos con el mejor padre
+        if merged is not None and key in merged:
+            node = merged[key]
+
+            if stats is not None:
+                stats.merge()
+
+            if priority > node.priority:
+                old = node.parent
+                old.edges = [e for e in old.edges if e.next_node is not node]
+
+                node.priority = priority
+                node.parent = current
+                node.action = action
+                node.count = count
+                current.add_edge(Edge(node, action))
+            return
+
+        node = Node(current.index + 1, weight, priority)
+
+        node.parent = current
+        node.action = action
+        node.count = count
+
+        self.nodes.append(node)
+        current.add_edge(Edge(node, action))
+        queue.append(node)
+
+        if merged is not None:
+            merged[key] = node
+
+
+# -------------------------------------------------------
+# Solucionador de la mochila mediante grafo
+# -------------------------------------------------------
+
+class KnapsackSolver:
+    def __init__(self, graph):
+        require_single_resource(graph.items, graph.capacity)
+
+        self.graph = graph
+
+    def solve(self, stats=None):
+
+        best_node = None
+        best_priority = -1
+
+        stack = [self.graph.start]
+
+        if stats is not None:
+            start = time.perf_counter()
+
+        # -----------------------------------------------
+        # Buscar el nodo con mayor prioridad
+        # -----------------------------------------------
+        while stack:
+            if stats is not None:
+                stats.visit(len(stack))
+
+            current = stack.pop()
+
+            # nodo terminal
+            if current.index == len(self.graph.items):
+                if current.priority > best_priority:
+                    best_priority = current.priority
+                    best_node = current
+
+            for edge in current.edges:
+                stack.append(edge.next_node)
+
+        # -----------------------------------------------
+        # ⭐ Reconstrucción elegante mediante parent
+        # -----------------------------------------------
+        path = []
+        node = best_node
+
+        while node.parent is not None:
+            item_index = node.parent.index
+            item = self.graph.items[item_index]
+
+            path.extend([(node.action, item)] * node.count)
+            node = node.parent
+
+        path.reverse()
+
+        if stats is not None:
+            stats.solve_seconds = time.perf_counter() - start
+
+        return path, best_priority
+
+
+# -------------------------------------------------------
+# Estadísticas opcionales de build/solve (sin coste si no
+# se pasan): nodos por nivel, takes rechazados por peso,
+# estados fusionados con merge=True, picos de cola/pila,
+# tiempo y memoria por nivel
+# -------------------------------------------------------
+
+class Stats:
+    def __init__(self, memory=False):
+        # memory=True mide bytes asignados por nivel con tracemalloc
+        self.memory = memory
+
+        # un dict por nivel expandido de Graph.build
+        self.levels = []
+
+        self.rejected = 0
+        self.merged = 0
+        self.peak_queue = 0
+        self.build_seconds = 0
+
+        self.visited = 0
+        self.peak_stack = 0
+        self.solve_seconds = 0
+
+        self._level = None
+
+    # json y tracemalloc solo se importan si se usan: importar
+    # el paquete queda en la biblioteca mínima
+    def start_build(self):
+        import tracemalloc
+
+        self._tracing = self.memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        self._build_start = time.perf_counter()
+
+    def expand(self, level, queue_length, node_count):
+        if level != self._level:
+            self._close_level(node_count)
+            self._open_level(level, node_count)
+
+        if queue_length > self.peak_queue:
+            self.peak_queue = queue_length
+
+    def reject(self):
+        self.rejected += 1
+        self._current["rejected"] += 1
+
+    def merge(self):
+        self.merged += 1
+        self._current["merged"] += 1
+
+    def finish_build(self, node_count):
+        self._close_level(node_count)
+        self.build_seconds = time.perf_counter() - self._build_start
+
+        if self._tracing:
+            import tracemalloc
+            tracemalloc.stop()
+
+    def visit(self, stack_length):
+        self.visited += 1
+        if stack_length > self.peak_stack:
+            self.peak_stack = stack_length
+
+    def _open_level(self, level, node_count):
+        self._level = level
+        self._current = {"level": level, "created": 0, "rejected": 0, "merged": 0}
+        self._level_nodes = node_count
+        self._level_start = time.perf_counter()
+
+        if self.memory:
+            import tracemalloc
+            self._level_bytes = tracemalloc.get_traced_memory()[0]
+
+    def _close_level(self, node_count):
+        if self._level is None:
+            return
+
+        # nodos creados al expandir este nivel (hijos en level + 1)
+        self._current["created"] = node_count - self._level_nodes
+        self._current["seconds"] = time.perf_counter() - self._level_start
+
+        if self.memory:
+            import tracemalloc
+            self._current["bytes"] = tracemalloc.get_traced_memory()[0] - self._level_bytes
+
+        self.levels.append(self._current)
+        self._level = None
+
+    def to_dict(self):
+        return {
+            "levels": self.levels,
+            "rejected": self.rejected,
+            "merged": self.merged,
+            "peak_queue": self.peak_queue,
+            "build_seconds": self.build_seconds,
+            "visited": self.visited,
+            "peak_stack": self.peak_stack,
+            "solve_seconds": self.solve_seconds,
+        }
+
+    def to_json(self, path=None):
+        import json
+
+        trace = json.dumps(self.to_dict(), indent=2)
+
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(trace)
+
+        return trace
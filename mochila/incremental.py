@@ -0,0 +1,207 @@
+# =======================================================
+#      MOCHILA INCREMENTAL (reutiliza filas de DP)
+# =======================================================
+
+import numpy as np
+
+from .grafo import Item, UNBOUNDED, split_quantities, require_single_resource
+
+
+# =======================================================
+#                  Solver incremental
+# =======================================================
+
+class IncrementalSolver:
+    def __init__(self, items=(), capacity=0):
+        require_single_resource(items, capacity)
+
+        self.items = []
+        self.capacity = int(capacity)
+        self.dtype = np.int64
+
+        # rows[k] = mejores prioridades (capacidades 0..C) usando
+        # solo los k primeros objetos; un cambio en la posición j
+        # invalida únicamente las filas posteriores a j. Un objeto
+        # con cantidad sigue ocupando una sola fila
+        self.rows = [np.zeros(self.capacity + 1, dtype=self.dtype)]
+
+        # units[k] = unidades del objeto k tomadas con cada capacidad
+        # 0..C (None si es 0/1): se guardan al recalcular su fila para
+        # que solution() no rehaga las filas de sus partes
+        self.units = []
+
+        # filas recalculadas en la última operación
+        self.recomputed = 0
+
+        for item in items:
+            self._check(item)
+            self.items.append(item)
+        self._refresh(0)
+
+    # -------------------------------------------------------
+    # Operaciones: cada una devuelve (path, priority)
+    # -------------------------------------------------------
+    def add_item(self, item, index=None):
+        self._check(item)
+
+        if index is None:
+            index = len(self.items)
+
+        self.items.insert(index, item)
+        return self._refresh(index)
+
+    def remove_item(self, item):
+        index = self._position(item)
+        del self.items[index]
+        return self._refresh(index)
+
+    def update_item(self, item, new_item):
+        self._check(new_item)
+
+        index = self._position(item)
+        self.items[index] = new_item
+        return self._refresh(index)
+
+    def set_capacity(self, capacity):
+        require_single_resource((), capacity)
+        capacity = int(capacity)
+
+        # al reducir la capacidad, el prefijo de cada fila sigue valiendo
+        if capacity <= self.capacity:
+            self.rows = [row[:capacity + 1].copy() for row in self.rows]
+            self.units = [None if u is None else u[:capacity + 1].copy() for u in self.units]
+            self.capacity = capacity
+            self.recomputed = 0
+            return self.solution()
+
+        self.capacity = capacity
+        self.rows = [np.zeros(capacity + 1, dtype=self.dtype)]
+        self.units = []
+        return self._refresh(0)
+
+    # -------------------------------------------------------
+    # Recalcular solo las filas desde la posición cambiada
+    # -------------------------------------------------------
+    def _refresh(self, index):
+        del self.rows[index + 1:]
+        del self.units[index:]
+
+        for item in self.items[index:]:
+            if item.quantity == 1:
+                self.rows.append(self._apply(self.rows[-1], item))
+                self.units.append(None)
+                continue
+
+            # con cantidad: las partes 1, 2, 4, ... una tras otra
+            parts = split_quantities([item], self.capacity)
+            rows = [self.rows[-1]]
+            for part in parts:
+                rows.append(self._apply(rows[-1], part))
+
+            self.rows.append(rows[-1])
+            self.units.append(self._units_taken(parts, rows))
+
+        self.recomputed = len(self.items) - index
+        return self.solution()
+
+    def _apply(self, prev, item):
+        C = self.capacity
+        row = prev.copy()
+        w = int(item.weight)
+
+        if w <= C:
+            np.maximum(row[w:], prev[:C + 1 - w] + item.priority, out=row[w:])
+
+        return row
+
+    def solution(self):
+        path = []
+        w = self.capacity
+
+        for i in range(len(self.items) - 1, -1, -1):
+            item = self.items[i]
+
+            if item.quantity != 1:
+                count = int(self.units[i][w])
+                w -= count * int(item.weight)
+
+                if count:
+                    path.extend([("take", item)] * count)
+                else:
+                    path.append(("skip", item))
+                continue
+
+            # si la fila cambió en w, tomar el objeto fue estrictamente mejor
+            if self.rows[i + 1][w] != self.rows[i][w]:
+                path.append(("take", item))
+                w -= int(item.weight)
+            else:
+                path.append(("skip", item))
+
+        path.reverse()
+        return path, self.rows[-1][self.capacity].item()
+
+    # -------------------------------------------------------
+    # Unidades tomadas de un objeto con cada capacidad: las
+    # filas de sus partes se recorren al revés como las de los
+    # objetos 0/1, para todas las capacidades a la vez
+    # -------------------------------------------------------
+    def _units_taken(self, parts, rows):
+        w = np.arange(self.capacity + 1)
+        count = np.zeros(self.capacity + 1, dtype=np.int64)
+
+        for j in range(len(parts) - 1, -1, -1):
+            taken = rows[j + 1][w] != rows[j][w]
+            count += taken * parts[j].count
+            w -= taken * int(parts[j].weight)
+
+        return count
+
+    def _position(self, item):
+        for index, current in enumerate(self.items):
+            if current is item:
+                return index
+        raise ValueError(f"objeto no encontrado: {item!r}")
+
+    def _check(self, item):
+        require_single_resource([item], self.capacity)
+
+        if item.weight < 0 or int(item.weight) != item.weight:
+            raise ValueError(f"peso no entero o negativo: {item!r}")
+        if item.weight == 0 and item.quantity == UNBOUNDED:
+            raise ValueError(f"objeto sin peso y sin límite de unidades: {item!r}")
+
+        # prioridades no enteras: pasar todas las filas a float
+        if self.dtype is np.int64 and int(item.priority) != item.priority:
+            self.dtype = np.float64
+            self.rows = [row.astype(np.float64) for row in self.rows]
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+    ]
+
+    solver = IncrementalSolver(items, 15)
+
+    def show(title, result):
+        solution, total_priority = result
+        taken = [item.name for action, item in solution if action == "take"]
+        print(f"{title}: {taken} → {total_priority} ({solver.recomputed} filas recalculadas)")
+
+    print("\n===== Mochila incremental =====\n")
+
+    show("inicial", solver.solution())
+
+    dron = Item("Mini-dron de reconocimiento", 6, 85)
+    show("añadir dron", solver.add_item(dron))
+    show("quitar sable", solver.remove_item(items[0]))
+    show("dron más ligero", solver.update_item(dron, Item(dron.name, 4, 85)))
+    show("capacidad 8", solver.set_capacity(8))
@@ -0,0 +1,395 @@
+# =======================================================
+#   LOTES: MUCHAS INSTANCIAS DESDE CSV / JSON LINES
+# =======================================================
+#
+#   python -m mochila.lote noche.jsonl resultados.jsonl --workers 8
+#   python -m mochila.lote noche.jsonl resultados.jsonl --resume
+#
+# JSON Lines: una instancia por línea
+#   {"id": "a1", "capacity": 15,
+#    "items": [{"name": "Sable de luz", "weight": 5, "priority": 90}, ...]}
+#   (los objetos también pueden ser listas [name, weight, priority])
+#   "quantity" (o un cuarto valor en la lista) da las unidades en stock
+#
+# CSV: una fila por objeto, filas de una misma instancia seguidas
+#   id,capacity,name,weight,priority[,quantity]
+#   a1,15,Sable de luz,5,90
+#
+# La salida es JSON Lines en el orden de la entrada, una línea por
+# instancia con su id. Tras cada bloque escrito se guarda en
+# <salida>.offset el byte de la entrada y el de la salida ya
+# confirmados; --resume continúa desde ahí.
+
+import argparse
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .grafo import Item, Graph, KnapsackSolver
+
+
+# =======================================================
+#            Lectura en streaming de instancias
+# =======================================================
+
+class InvalidRecord(ValueError):
+    # registro que no se pudo leer: va en lugar de los objetos y
+    # se escribe como error de esa instancia, sin parar el lote
+    pass
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _read_jsonl(f):
+    # una línea = una instancia; el offset es el final de la línea
+    while True:
+        line = f.readline()
+        if not line:
+            return
+        if not line.strip():
+            continue
+
+        key = None
+        try:
+            record = json.loads(line)
+            key = record.get("id")
+            items = tuple(
+                (o["name"], o["weight"], o["priority"], o.get("quantity", 1))
+                if isinstance(o, dict) else tuple(o)
+                for o in record["items"]
+            )
+            capacity = record["capacity"]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            yield f.tell(), key, InvalidRecord(f"{type(e).__name__}: {e}"), None
+            continue
+
+        yield f.tell(), key, items, capacity
+
+
+def _read_row(f):
+    # una fila CSV ocupa varias líneas si un campo entre comillas
+    # lleva saltos de línea: leer hasta que las comillas queden
+    # emparejadas (la comilla escapada "" cuenta dos)
+    row = f.readline()
+    while row.count(b'"') % 2:
+        line = f.readline()
+        if not line:
+            break
+        row += line
+    return row
+
+
+def _read_csv(f, header):
+    columns = {name: i for i, name in enumerate(header)}
+    current = None
+    items = []
+    error = None
+    start = f.tell()
+
+    # fila a fila en binario para poder guardar f.tell()
+    while True:
+        line = _read_row(f)
+        if not line.strip():
+            if not line:
+                break
+            start = f.tell()
+            continue
+
+        try:
+            row = next(csv.reader([line.decode("utf-8")]))
+            key = row[columns["id"]]
+        except (ValueError, IndexError, csv.Error) as e:
+            # sin id legible (o fila que csv no sabe partir): la
+            # fila es su propia instancia errónea
+            if current is not None:
+                yield start, current[0], error or tuple(items), current[1]
+                items, current, error = [], None, None
+            start = f.tell()
+            yield start, None, InvalidRecord(f"{type(e).__name__}: {e}"), None
+            continue
+
+        # empieza otra instancia: la anterior acaba justo antes
+        if current is not None and key != current[0]:
+            yield start, current[0], error or tuple(items), current[1]
+            items, current, error = [], None, None
+
+        # una celda mala invalida su instancia, no el lote
+        try:
+            if current is None:
+                current = (key, _number(row[columns["capacity"]]))
+
+            items.append((
+                row[columns["name"]],
+                _number(row[columns["weight"]]),
+                _number(row[columns["priority"]]),
+                _number(row[columns["quantity"]]) if "quantity" in columns else 1
+            ))
+        except (ValueError, IndexError) as e:
+            if current is None:
+                current = (key, None)
+            error = error or InvalidRecord(f"{type(e).__name__}: {e}")
+        start = f.tell()
+
+    if current is not None:
+        yield start, current[0], error or tuple(items), current[1]
+
+
+def read_instances(path, offset=0):
+    # genera (offset tras la instancia, id, objetos, capacidad)
+    # sin cargar el fichero: memoria constante. Un registro
+    # ilegible llega con un InvalidRecord en lugar de los objetos
+    with open(path, "rb") as f:
+        if path.endswith(".csv"):
+            header = next(csv.reader([_read_row(f).decode("utf-8-sig")]))
+            f.seek(max(offset, f.tell()))
+            yield from _read_csv(f, header)
+        else:
+            f.seek(offset)
+            yield from _read_jsonl(f)
+
+
+# =======================================================
+#          Trabajador: resolver un bloque entero
+# =======================================================
+
+def _solve_planner(items, capacity):
+    from .planner import Planner
+    return Planner(items, capacity).solve()
+
+
+def _solve_dag(items, capacity):
+    graph = Graph(items, capacity)
+    graph.build(merge=True)
+    return KnapsackSolver(graph).solve()
+
+
+def _solve_bb(items, capacity):
+    from .bb import BranchAndBoundSolver
+    return BranchAndBoundSolver(Graph(items, capacity)).solve()
+
+
+def _solve_dp(items, capacity):
+    from .dp import NumpyDPSolver
+    return NumpyDPSolver(items, capacity).solve()
+
+
+ENGINES = {
+    "planner": _solve_planner,
+    "dag": _solve_dag,
+    "bb": _solve_bb,
+    "dp": _solve_dp,
+}
+
+# caché de soluciones por proceso (instancias repetidas)
+_cache = None
+
+
+def _init_worker(engine, cache_size):
+    global _cache
+    _cache = None
+
+    if cache_size:
+        from .cache import SolutionCache
+        _cache = SolutionCache(ENGINES[engine], maxsize=cache_size)
+
+
+def _solve_chunk(engine, chunk):
+    solve = _cache.solve if _cache is not None else ENGINES[engine]
+    results = []
+
+    for key, raw_items, capacity in chunk:
+        start = time.perf_counter()
+
+        # un error en una instancia no tira el lote entero
+        try:
+            if isinstance(raw_items, InvalidRecord):
+                raise raw_items
+
+            items = [
+                Item(name, weight, priority, quantity=quantity[0] if quantity else 1)
+                for name, weight, priority, *quantity in raw_items
+            ]
+            path, priority = solve(items, capacity)
+        except Exception as e:
+            results.append({"id": key, "error": f"{type(e).__name__}: {e}"})
+            continue
+
+        results.append({
+            "id": key,
+            "taken": [item.name for action, item in path if action == "take"],
+            "priority": priority,
+            "seconds": time.perf_counter() - start,
+        })
+
+    return results
+
+
+# =======================================================
+#                 Ejecutor de lotes
+# =======================================================
+
+class BatchRunner:
+    def __init__(self, input_path, output_path, engine="planner",
+                 chunk_size=256, max_workers=None, max_pending=None,
+                 cache_size=1024):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.engine = engine
+        self.chunk_size = chunk_size
+
+        # max_workers=0: todo en este proceso, sin pool
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+
+        # bloques en vuelo como máximo: acota la memoria
+        self.max_pending = max_pending or 2 * max(1, self.max_workers)
+        self.cache_size = cache_size
+
+        self.progress_path = output_path + ".offset"
+        self.solved = 0
+        self.errors = 0
+
+    # -------------------------------------------------------
+    # Bloques de chunk_size instancias: (offset final, bloque)
+    # -------------------------------------------------------
+    def chunks(self, offset=0):
+        chunk = []
+        end = offset
+
+        for end, key, items, capacity in read_instances(self.input_path, offset):
+            chunk.append((key, items, capacity))
+
+            if len(chunk) == self.chunk_size:
+                yield end, chunk
+                chunk = []
+
+        if chunk:
+            yield end, chunk
+
+    # -------------------------------------------------------
+    # Progreso confirmado: offsets de entrada y salida
+    # -------------------------------------------------------
+    def load_progress(self):
+        try:
+            with open(self.progress_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"input": 0, "output": 0, "solved": 0, "errors": 0}
+
+    def _commit(self, out, input_offset):
+        out.flush()
+        os.fsync(out.fileno())
+
+        progress = {
+            "input": input_offset, "output": out.tell(),
+            "solved": self.solved, "errors": self.errors,
+        }
+
+        # escribir y renombrar: el fichero nunca queda a medias
+        tmp = self.progress_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(progress, f)
+        os.replace(tmp, self.progress_path)
+
+    def _write(self, out, results):
+        for result in results:
+            if "error" in result:
+                self.errors += 1
+            self.solved += 1
+            out.write((json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def run(self, resume=False):
+        resume = resume and os.path.exists(self.output_path)
+        progress = self.load_progress() if resume else {"input": 0, "output": 0, "solved": 0, "errors": 0}
+        self.solved = progress["solved"]
+        # progreso de versiones anteriores: sin contador de errores
+        self.errors = progress.get("errors", 0)
+
+        out = open(self.output_path, "r+b" if resume else "wb")
+
+        # descartar lo escrito tras el último commit
+        out.truncate(progress["output"])
+        out.seek(progress["output"])
+
+        chunks = self.chunks(progress["input"])
+
+        try:
+            if self.max_workers == 0:
+                _init_worker(self.engine, self.cache_size)
+                for end, chunk in chunks:
+                    self._write(out, _solve_chunk(self.engine, chunk))
+                    self._commit(out, end)
+                return self.solved
+
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.engine, self.cache_size)
+            ) as pool:
+                pending = deque()
+
+                for end, chunk in chunks:
+                    pending.append((end, pool.submit(_solve_chunk, self.engine, chunk)))
+
+                    # ventana llena: escribir el bloque más antiguo
+                    if len(pending) >= self.max_pending:
+                        end, future = pending.popleft()
+                        self._write(out, future.result())
+                        self._commit(out, end)
+
+                while pending:
+                    end, future = pending.popleft()
+                    self._write(out, future.result())
+                    self._commit(out, end)
+        finally:
+            out.close()
+
+        return self.solved
+
+
+# =======================================================
+#                   Línea de comandos
+# =======================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolver instancias de la mochila en lote")
+    parser.add_argument("input", help="instancias en .csv o .jsonl")
+    parser.add_argument("output", help="resultados en JSON Lines")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="planner")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos (0 = sin pool); por defecto os.cpu_count()")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="soluciones en caché por proceso (0 = sin caché)")
+    parser.add_argument("--resume", action="store_true",
+                        help="seguir desde el último offset confirmado")
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(
+        args.input, args.output,
+        engine=args.engine,
+        chunk_size=args.chunk_size,
+        max_workers=args.workers,
+        cache_size=args.cache_size
+    )
+
+    start = time.perf_counter()
+    solved = runner.run(resume=args.resume)
+
+    print(
+        f"{solved} instancias resueltas ({runner.errors} con error) "
+        f"en {time.perf_counter() - start:.2f} s → {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
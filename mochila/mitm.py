@@ -0,0 +1,149 @@
+# =======================================================
+#     MEET-IN-THE-MIDDLE (Horowitz–Sahni) — MOCHILA 0/1
+# =======================================================
+
+import numpy as np
+
+from .grafo import (
+    Item, NotApplicable, split_quantities, join_quantities, require_single_resource,
+)
+
+
+# -------------------------------------------------------
+# dtype entero si todos los valores lo son (pesos enormes
+# como 10^9 caben sin error de redondeo en int64)
+# -------------------------------------------------------
+
+def _dtype(values):
+    if all(int(v) == v for v in values):
+        return np.int64
+    return np.float64
+
+
+# =======================================================
+#      Mitad: subconjuntos no dominados ordenados
+# =======================================================
+
+def enumerate_half(items, capacity, weight_dtype, priority_dtype):
+    if len(items) > 62:
+        raise NotApplicable("demasiados objetos por mitad (máx. 62)")
+
+    weight = np.zeros(1, dtype=weight_dtype)
+    priority = np.zeros(1, dtype=priority_dtype)
+    mask = np.zeros(1, dtype=np.int64)
+
+    for j, item in enumerate(items):
+        # take: la misma lista desplazada por el objeto j. Los pesos
+        # están ordenados, así que los que siguen cabiendo son un prefijo
+        m = int(np.searchsorted(weight, capacity - item.weight, side="right"))
+
+        # mezcla de las dos listas ya ordenadas (skip y take): el
+        # orden estable (timsort) detecta las dos rachas y las mezcla
+        # en O(m), sin ordenar de nuevo; a igual peso, skip primero
+        merged = np.concatenate((weight, weight[:m] + item.weight))
+        order = np.argsort(merged, kind="stable")
+        weight = merged[order]
+        del merged
+
+        priority = np.concatenate((priority, priority[:m] + item.priority))[order]
+        mask = np.concatenate((mask, mask[:m] | (1 << j)))[order]
+        del order
+
+        # poda de dominados: solo sobrevive quien supera en
+        # prioridad a todos los subconjuntos más ligeros, y a
+        # igual peso solo el último (el de mayor prioridad)
+        # (cada lista tiene pesos distintos: a lo sumo dos por peso)
+        better = np.empty(len(weight), dtype=bool)
+        better[0] = True
+        better[1:] = priority[1:] > np.maximum.accumulate(priority)[:-1]
+
+        keep = better.copy()
+        keep[:-1] &= ~((weight[:-1] == weight[1:]) & better[1:])
+        del better
+
+        if not keep.all():
+            weight, priority, mask = weight[keep], priority[keep], mask[keep]
+
+    return weight, priority, mask
+
+
+# =======================================================
+#                  Solver Meet-in-the-middle
+# =======================================================
+
+class MeetInTheMiddleSolver:
+    def __init__(self, items, capacity):
+        require_single_resource(items, capacity)
+
+        self.items = items
+        self.capacity = capacity
+
+        self.parts = split_quantities(items, capacity)
+
+        # tamaño de las listas no dominadas de cada mitad
+        self.half_sizes = (0, 0)
+
+    def solve(self):
+        items = self.parts
+        half = len(items) // 2
+
+        weight_dtype = _dtype([item.weight for item in items] + [self.capacity])
+        priority_dtype = _dtype([item.priority for item in items])
+
+        a_weight, a_priority, a_mask = enumerate_half(
+            items[:half], self.capacity, weight_dtype, priority_dtype
+        )
+        b_weight, b_priority, b_mask = enumerate_half(
+            items[half:], self.capacity, weight_dtype, priority_dtype
+        )
+        self.half_sizes = (len(a_weight), len(b_weight))
+
+        # -----------------------------------------------
+        # Combinar: para cada subconjunto de A, el mejor de B
+        # que quepa (B no dominada => el más pesado que cabe)
+        # -----------------------------------------------
+        j = np.searchsorted(b_weight, self.capacity - a_weight, side="right") - 1
+
+        total = a_priority + b_priority[j]
+        best = int(np.argmax(total))
+
+        left = int(a_mask[best])
+        right = int(b_mask[j[best]])
+
+        path = []
+        for i, item in enumerate(items):
+            if i < half:
+                taken = left >> i & 1
+            else:
+                taken = right >> (i - half) & 1
+            path.append(("take" if taken else "skip", item))
+
+        path = join_quantities(self.items, path)
+        return path, total[best].item()
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = MeetInTheMiddleSolver(items, capacity)
+    solution, total_priority = solver.solve()
+
+    print("\n===== Meet-in-the-middle =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Subconjuntos no dominados por mitad: {solver.half_sizes}")
@@ -0,0 +1,350 @@
+# =======================================================
+#   MOCHILA MULTIDIMENSIONAL (peso, volumen, energía...)
+# =======================================================
+
+import numpy as np
+
+from .grafo import Item, Graph, split_quantities, join_quantities
+
+
+# =======================================================
+#     Branch and Bound por niveles con arrays NumPy
+# =======================================================
+
+class MultiDimSolver:
+    def __init__(self, graph):
+        # graph.capacity puede ser un vector: (peso, recurso 1, ...)
+        # cada Item aporta item.resources() = (weight,) + costs
+        self.graph = graph
+
+        capacity = graph.capacity
+        if np.isscalar(capacity):
+            capacity = (capacity,)
+        self.capacity = np.asarray(capacity, dtype=np.float64)
+
+        for item in graph.items:
+            if len(item.resources()) != len(self.capacity):
+                raise ValueError(
+                    f"{item!r} tiene {len(item.resources())} recursos, "
+                    f"la capacidad tiene {len(self.capacity)}"
+                )
+
+        # tantas unidades como permita el recurso más escaso
+        self.parts = split_quantities(graph.items, self.capacity)
+
+        # estados completados de forma voraz en cada nivel y
+        # tamaño de bloque para la comparación de dominancia
+        self.greedy_width = 8
+        self.block_elements = 1 << 22
+
+        # pasos de subgradiente para los multiplicadores subrogados
+        self.surrogate_steps = 100
+
+        # estadísticas de la última búsqueda
+        self.explored = 0
+        self.pruned = 0
+        self.dominated = 0
+        self.peak_frontier = 0
+
+    def solve(self):
+        items = self.parts
+        n = len(items)
+        m = len(self.capacity)
+
+        self.explored = 0
+        self.pruned = 0
+        self.dominated = 0
+        self.peak_frontier = 1
+
+        costs = np.array([item.resources() for item in items], dtype=np.float64).reshape(n, m)
+        priorities = np.array([item.priority for item in items], dtype=np.float64)
+
+        # -----------------------------------------------
+        # Relajación subrogada: una sola restricción con
+        # multiplicadores ajustados en la raíz (la cota
+        # vale con cualquier u >= 0; la más baja poda más)
+        # -----------------------------------------------
+        self.multipliers = self._multipliers(costs, priorities)
+        surrogate = costs @ self.multipliers
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(surrogate > 0, priorities / surrogate, np.inf)
+
+        # orden de ramificación: mejor razón subrogada primero
+        order = np.argsort(-ratios, kind="stable")
+        self.order = order
+
+        self.costs = costs[order]
+        self.priorities = priorities[order]
+
+        # columnas para las cotas: restricción subrogada + cada recurso
+        self.columns = np.column_stack((surrogate[order], self.costs))
+
+        # frontera: una fila por estado (recursos usados, prioridad)
+        used = np.zeros((1, m))
+        value = np.zeros(1)
+
+        # back-pointers por nivel: índice del padre y bit take
+        self.parents = []
+        self.takes = []
+
+        # incumbente inicial: voraz desde la raíz
+        gain, added = self._greedy(0, used)
+        best_priority = gain[0].item()
+        best_taken = {int(order[r]) for r in np.flatnonzero(added[0])}
+
+        for k in range(n):
+            # -------------------------------------------
+            # Expandir el nivel completo: skip + take
+            # (chequeo de factibilidad vectorizado)
+            # -------------------------------------------
+            take_used = used + self.costs[k]
+            fits = np.all(take_used <= self.capacity, axis=1)
+
+            parent = np.concatenate((np.arange(len(value)), np.flatnonzero(fits)))
+            take = np.concatenate((np.zeros(len(value), dtype=bool), np.ones(fits.sum(), dtype=bool)))
+            used = np.concatenate((used, take_used[fits]))
+            value = np.concatenate((value, value[fits] + self.priorities[k]))
+
+            self.explored += len(value)
+
+            # -------------------------------------------
+            # Mejorar la incumbente completando de forma
+            # voraz los estados más prometedores (solo los
+            # que la cota aún deja mejorar)
+            # -------------------------------------------
+            bound = self.bound(k + 1, used, value)
+
+            top = np.argsort(-bound)[:self.greedy_width]
+            top = top[bound[top] > best_priority]
+
+            if len(top):
+                gain, added = self._greedy(k + 1, used[top])
+                total = value[top] + gain
+                g = int(np.argmax(total))
+
+                if total[g] > best_priority:
+                    best_priority = total[g].item()
+                    best_taken = self._taken(k - 1, parent[top[g]]) | {
+                        int(order[r]) for r in k + 1 + np.flatnonzero(added[g])
+                    }
+                    if take[top[g]]:
+                        best_taken.add(int(order[k]))
+
+            # -------------------------------------------
+            # Poda por cota antes que la de dominancia: la
+            # comparación por pares solo ve los estados que
+            # aún pueden mejorar la incumbente
+            # -------------------------------------------
+            alive = bound > best_priority + 1e-9 * max(1.0, abs(best_priority))
+            self.pruned += len(value) - int(alive.sum())
+
+            if not alive.any():
+                break
+
+            used, value, parent, take = used[alive], value[alive], parent[alive], take[alive]
+
+            keep = self._non_dominated(used, value)
+            used, value, parent, take = used[keep], value[keep], parent[keep], take[keep]
+
+            # los back-pointers del nivel siguiente apuntan a la
+            # frontera ya filtrada
+            self.parents.append(parent)
+            self.takes.append(take)
+
+            self.peak_frontier = max(self.peak_frontier, len(value))
+
+        path = [
+            ("take" if i in best_taken else "skip", item)
+            for i, item in enumerate(items)
+        ]
+        priority = sum(items[i].priority for i in best_taken)
+
+        path = join_quantities(self.graph.items, path)
+        return path, priority
+
+    # -------------------------------------------------------
+    # Multiplicadores subrogados: desde u_d = 1 / C_d (uso
+    # relativo), pasos de subgradiente multiplicativos hacia
+    # la cota de Dantzig subrogada más baja en la raíz. Sube
+    # u_d si la solución fraccionaria se pasa en el recurso d
+    # -------------------------------------------------------
+    def _multipliers(self, costs, priorities):
+        capacity = np.maximum(self.capacity, 1)
+        u = 1 / capacity
+
+        # un solo recurso: la escala de u no cambia la cota
+        if len(capacity) == 1:
+            return u
+
+        best, best_u = np.inf, u
+
+        for step in range(self.surrogate_steps):
+            weights = costs @ u
+            room = capacity @ u
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = np.where(weights > 0, priorities / weights, np.inf)
+
+            o = np.argsort(-ratios, kind="stable")
+            prefix_weight = np.cumsum(weights[o])
+            j = int(np.searchsorted(prefix_weight, room, side="right"))
+
+            # solución fraccionaria de Dantzig
+            x = np.zeros(len(priorities))
+            x[o[:j]] = 1
+            if j < len(o):
+                x[o[j]] = (room - (prefix_weight[j - 1] if j else 0.0)) / weights[o[j]]
+
+            bound = x @ priorities
+            if bound < best:
+                best, best_u = bound, u
+
+            excess = (x @ costs - capacity) / capacity
+            u = np.maximum(u * (1 + 0.5 * excess / np.sqrt(step + 1)), 1e-9 / capacity)
+            u = u / (u @ capacity)
+
+        return best_u
+
+    # -------------------------------------------------------
+    # Cota: mínimo de las cotas de Dantzig de la restricción
+    # subrogada y de cada recurso por separado, para todos
+    # los estados de la frontera a la vez
+    # -------------------------------------------------------
+    def bound(self, k, used, value):
+        if k == len(self.priorities):
+            return value
+
+        free = self.capacity - used
+        rooms = np.column_stack((free @ self.multipliers, free))
+
+        priorities = self.priorities[k:]
+        bound = np.full(len(value), np.inf)
+
+        for c in range(self.columns.shape[1]):
+            weights = self.columns[k:, c]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = np.where(weights > 0, priorities / weights, np.inf)
+
+            o = np.argsort(-ratios, kind="stable")
+            prefix_weight = np.concatenate(([0.0], np.cumsum(weights[o])))
+            prefix_priority = np.concatenate(([0.0], np.cumsum(priorities[o])))
+
+            room = rooms[:, c]
+            j = np.searchsorted(prefix_weight, room, side="right") - 1
+
+            column_bound = value + prefix_priority[j]
+
+            partial = j < len(o)
+            left = room[partial] - prefix_weight[j[partial]]
+            column_bound[partial] += left * ratios[o][j[partial]]
+
+            np.minimum(bound, column_bound, out=bound)
+
+        return bound
+
+    # -------------------------------------------------------
+    # Completado voraz de varios estados a la vez: una sola
+    # pasada por los objetos k.. con todas las filas
+    # -------------------------------------------------------
+    def _greedy(self, k, used):
+        free = self.capacity - used
+        gain = np.zeros(len(used))
+        added = np.zeros((len(used), len(self.priorities) - k), dtype=bool)
+
+        for r in range(k, len(self.priorities)):
+            fits = np.all(self.costs[r] <= free, axis=1)
+
+            free[fits] -= self.costs[r]
+            gain[fits] += self.priorities[r]
+            added[:, r - k] = fits
+
+        return gain, added
+
+    # -------------------------------------------------------
+    # Poda de dominancia en todas las dimensiones: un estado
+    # sobra si otro usa <= en cada recurso y rinde >=.
+    # Orden lexicográfico (prioridad decreciente, luego los
+    # recursos) y barrido: cada bloque solo se compara con
+    # los estados ya conservados y con los anteriores del
+    # propio bloque
+    # -------------------------------------------------------
+    def _non_dominated(self, used, value):
+        # solo un estado anterior en este orden puede dominar
+        order = np.lexsort((*used.T[::-1], -value))
+        ranked = used[order]
+
+        size, m = ranked.shape
+        dominated = np.zeros(size, dtype=bool)
+
+        if m == 1:
+            # un solo recurso: basta el más ligero de los anteriores
+            lightest = np.minimum.accumulate(ranked[:, 0])
+            dominated[1:] = lightest[:-1] <= ranked[1:, 0]
+        else:
+            block = max(1, int((self.block_elements // m) ** 0.5))
+            kept = ranked[:0]
+
+            for a in range(0, size, block):
+                chunk = ranked[a:a + block]
+
+                hit = np.tril(self._covers(chunk, chunk), k=-1).any(axis=1)
+                for c in range(0, len(kept), block):
+                    hit |= self._covers(kept[c:c + block], chunk).any(axis=1)
+
+                dominated[a:a + len(chunk)] = hit
+                kept = np.concatenate((kept, chunk[~hit]))
+
+        self.dominated += int(dominated.sum())
+        return np.sort(order[~dominated])
+
+    @staticmethod
+    def _covers(rows, states):
+        # covers[i, j]: rows[j] usa <= que states[i] en cada recurso
+        # (un recurso cada vez: sin el eje de recursos en memoria)
+        covers = rows[None, :, 0] <= states[:, None, 0]
+        for d in range(1, rows.shape[1]):
+            covers &= rows[None, :, d] <= states[:, None, d]
+        return covers
+
+    def _taken(self, level, i):
+        taken = set()
+
+        for k in range(level, -1, -1):
+            if self.takes[k][i]:
+                taken.add(int(self.order[k]))
+            i = self.parents[k][i]
+
+        return taken
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    # recursos: (peso, volumen, energía)
+    items = [
+        Item("Sable de luz", 5, 90, costs=(2, 3)),
+        Item("Holoproyector", 2, 40, costs=(4, 1)),
+        Item("Bláster DL-44", 4, 70, costs=(3, 4)),
+        Item("Herramientas de reparación", 3, 50, costs=(5, 0)),
+        Item("Mini-dron de reconocimiento", 6, 85, costs=(2, 5))
+    ]
+
+    capacity = (15, 10, 9)
+
+    solver = MultiDimSolver(Graph(items, capacity))
+    solution, total_priority = solver.solve()
+
+    print("\n===== Mochila multidimensional =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(
+        f"Estados: {solver.explored}, podados por cota: {solver.pruned}, "
+        f"dominados: {solver.dominated}"
+    )
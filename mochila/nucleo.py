@@ -0,0 +1,422 @@
+# =======================================================
+#   NÚCLEO EXPANSIBLE (estilo Pisinger) — MILLONES DE OBJETOS
+# =======================================================
+#
+# En instancias grandes casi todos los objetos se deciden
+# solos: los de razón prioridad/peso muy alta se toman y los
+# de razón muy baja se saltan. Solo un "núcleo" alrededor del
+# objeto de ruptura (el primero que no cabe en el orden voraz)
+# necesita programación dinámica.
+#
+#   1. Objeto de ruptura en tiempo lineal: selección por
+#      mediana ponderada con np.partition, sin ordenar.
+#   2. Reducción (Dembo–Hammer): con r = razón de ruptura,
+#      cambiar el objeto j respecto a la solución voraz da como
+#      mucho  U_LP - |p_j - r·w_j|. Si eso no supera la mejor
+#      solución conocida, j queda fijo.
+#   3. DP de Pareto con cotas sobre el núcleo (los objetos de
+#      menor |p_j - r·w_j|), sin depender de la capacidad.
+#   4. Si algún objeto fuera del núcleo no se puede fijar, el
+#      núcleo se duplica y se repite desde 3.
+
+import numpy as np
+
+from .grafo import Item, split_quantities, join_quantities, require_single_resource
+
+
+# =======================================================
+#                  Solver de núcleo
+# =======================================================
+
+class CoreSolver:
+    def __init__(self, items, capacity, core_size=64):
+        require_single_resource(items, capacity)
+
+        self.items = items
+        self.capacity = capacity
+        self.core_size = core_size
+
+        self.parts = split_quantities(items, capacity)
+
+        # estadísticas de la última resolución
+        self.break_index = None
+        self.upper_bound = None
+        self.core_sizes = []      # tamaño del núcleo en cada expansión
+        self.max_states = 0       # estados de la DP más grande
+        self.fixed = 0            # objetos fijados por reducción
+
+    # -------------------------------------------------------
+    # Arrays de pesos y prioridades
+    # -------------------------------------------------------
+    def _arrays(self):
+        n = len(self.parts)
+        weights = np.fromiter((item.weight for item in self.parts), np.float64, n)
+        priorities = np.fromiter((item.priority for item in self.parts), np.float64, n)
+
+        # enteros exactos si se puede (sumas de hasta 2^63)
+        self.integral = bool(
+            np.all(weights == np.floor(weights)) and np.all(priorities == np.floor(priorities))
+        )
+        if self.integral:
+            weights = weights.astype(np.int64)
+            priorities = priorities.astype(np.int64)
+
+        return weights, priorities
+
+    def _ratios(self, weights, priorities):
+        # objetos de peso 0 primero (razón infinita)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(weights > 0, priorities / np.maximum(weights, 1e-300), np.inf)
+
+    # -------------------------------------------------------
+    # Objetos idénticos (mismo peso y prioridad) son
+    # intercambiables: se agrupan como un objeto con cantidad
+    # y se parten en 1, 2, 4, ... unidades. En instancias
+    # fuertemente correlacionadas un millón de objetos queda
+    # en unos pocos miles de partes
+    # -------------------------------------------------------
+    def _group(self, weights, priorities):
+        n = len(weights)
+
+        if not self.integral or n == 0 or weights.min() < 0 or priorities.min() < 0:
+            return None
+        if weights.max() >= 1 << 31 or priorities.max() >= 1 << 31:
+            return None
+
+        keys, inverse, counts = np.unique(
+            (weights << 32) | priorities, return_inverse=True, return_counts=True
+        )
+
+        # agrupar solo compensa si hay muchos repetidos
+        if 2 * len(keys) > n:
+            return None
+
+        group_w = keys >> 32
+        group_p = keys & 0xFFFFFFFF
+
+        # unidades útiles: las que caben en la mochila
+        remaining = np.where(
+            group_w > 0, np.minimum(counts, self.capacity // np.maximum(group_w, 1)), counts
+        )
+
+        # nada cabe: la ruta sin agrupar ya lo resuelve
+        if not remaining.any():
+            return None
+
+        parts_w, parts_p, parts_units, parts_group = [], [], [], []
+        size = 1
+
+        while remaining.any():
+            units = np.minimum(size, remaining)
+            active = np.flatnonzero(units)
+
+            parts_w.append(group_w[active] * units[active])
+            parts_p.append(group_p[active] * units[active])
+            parts_units.append(units[active])
+            parts_group.append(active)
+
+            remaining = remaining - units
+            size *= 2
+
+        return (
+            np.concatenate(parts_w), np.concatenate(parts_p),
+            np.concatenate(parts_units), np.concatenate(parts_group),
+            inverse.ravel(), counts
+        )
+
+    # -------------------------------------------------------
+    # Objeto de ruptura por mediana ponderada: cada vuelta
+    # parte los candidatos por la mediana de sus razones y se
+    # queda con la mitad donde está la ruptura (O(n) en total)
+    # -------------------------------------------------------
+    def _break_item(self, weights, ratios, candidates, room):
+        taken = []
+
+        while len(candidates) > 32:
+            r = ratios[candidates]
+            median = np.partition(r, len(r) // 2)[len(r) // 2]
+
+            high = candidates[r > median]
+            equal = candidates[r == median]
+
+            high_weight = weights[high].sum()
+            if high_weight > room:
+                candidates = high
+                continue
+
+            equal_weight = weights[equal].sum()
+            if high_weight + equal_weight <= room:
+                taken.append(high)
+                taken.append(equal)
+                room -= high_weight + equal_weight
+                candidates = candidates[r < median]
+                continue
+
+            # la ruptura cae entre razones iguales
+            taken.append(high)
+            room -= high_weight
+            candidates = equal
+            break
+
+        # pocos candidatos (o razones iguales): orden voraz directo
+        order = candidates[np.argsort(-ratios[candidates], kind="stable")]
+        cumulative = np.cumsum(weights[order])
+        k = int(np.searchsorted(cumulative, room, side="right"))
+
+        taken.append(order[:k])
+        if k:
+            room -= cumulative[k - 1]
+
+        if k == len(order):
+            return np.concatenate(taken), None, room
+        return np.concatenate(taken), int(order[k]), room
+
+    # -------------------------------------------------------
+    # DP de Pareto con cotas sobre el núcleo: estados (peso,
+    # prioridad) no dominados, podados si su cota de Dantzig
+    # no mejora la mejor solución del núcleo
+    # -------------------------------------------------------
+    def _solve_core(self, core, weights, priorities, ratios, capacity, incumbent):
+        order = core[np.argsort(-ratios[core], kind="stable")]
+        cw = weights[order]
+        cp = priorities[order]
+        cr = ratios[order]
+        m = len(order)
+
+        # sumas prefijas para la cota de los objetos restantes
+        W = np.concatenate(([0], np.cumsum(cw)))
+        P = np.concatenate(([0], np.cumsum(cp)))
+
+        state_w = np.zeros(1, dtype=cw.dtype)
+        state_p = np.zeros(1, dtype=cp.dtype)
+
+        # la cota es float (fracción del objeto de ruptura): misma
+        # holgura que la reducción para no podar el óptimo por redondeo
+        tolerance = 1e-9 * (abs(incumbent) + abs(P[-1].item()) + 1)
+
+        best = incumbent
+        best_at = None
+        back = []
+
+        for k in range(m):
+            # skip: los mismos estados; take: los que siguen cabiendo
+            fits = state_w + cw[k] <= capacity
+            new_w = np.concatenate((state_w, state_w[fits] + cw[k]))
+            new_p = np.concatenate((state_p, state_p[fits] + cp[k]))
+            parent = np.concatenate((np.arange(len(state_w)), np.flatnonzero(fits)))
+            take = np.concatenate((np.zeros(len(state_w), bool), np.ones(int(fits.sum()), bool)))
+
+            # peso creciente, y a igual peso la mayor prioridad primero
+            sort = np.lexsort((-new_p, new_w))
+            new_w, new_p, parent, take = new_w[sort], new_p[sort], parent[sort], take[sort]
+
+            # dominancia: solo sobreviven los que superan a todos los más ligeros
+            previous = np.maximum.accumulate(new_p)
+            keep = np.empty(len(new_p), bool)
+            keep[0] = True
+            keep[1:] = new_p[1:] > previous[:-1]
+
+            new_w, new_p, parent, take = new_w[keep], new_p[keep], parent[keep], take[keep]
+
+            # cota de Dantzig con los objetos k+1.. del núcleo
+            room = capacity - new_w
+            target = W[k + 1] + room
+            j = np.searchsorted(W, target, side="right") - 1
+            bound = new_p + (P[j] - P[k + 1])
+            partial = j < m
+            bound = bound + np.where(
+                partial, (target - W[j]) * cr[np.minimum(j, m - 1)], 0
+            )
+
+            # todo estado es factible (lo que queda se salta)
+            top = int(np.argmax(new_p))
+            if new_p[top] > best:
+                best = new_p[top].item()
+                best_at = (k, top)
+
+            if self.integral:
+                alive = bound >= best + 1 - tolerance
+            else:
+                alive = bound > best - tolerance
+            alive[top] |= best_at == (k, top)
+
+            # reindexar los padres de la siguiente capa
+            index = np.full(len(new_w), -1)
+            index[alive] = np.arange(int(alive.sum()))
+            if best_at is not None and best_at[0] == k:
+                best_at = (k, int(index[best_at[1]]))
+
+            back.append((parent[alive], take[alive]))
+            state_w, state_p = new_w[alive], new_p[alive]
+            self.max_states = max(self.max_states, len(state_w))
+
+            if not len(state_w):
+                break
+
+        if best_at is None:
+            return best, None
+
+        # reconstrucción: padres desde la capa donde se logró el mejor
+        chosen = []
+        k, i = best_at
+
+        while k >= 0:
+            parents, takes = back[k]
+            if takes[i]:
+                chosen.append(order[k])
+            i = parents[i]
+            k -= 1
+
+        return best, np.array(chosen, dtype=np.int64)
+
+    # -------------------------------------------------------
+    # Bucle principal: ruptura, núcleo, reducción, expansión
+    # -------------------------------------------------------
+    def solve(self):
+        weights, priorities = self._arrays()
+        grouped = self._group(weights, priorities)
+
+        self.core_sizes = []
+        self.max_states = 0
+
+        if grouped is None:
+            x, z = self._solve_arrays(weights, priorities)
+            return self._path(x), z
+
+        parts_w, parts_p, units, group, inverse, counts = grouped
+        taken, z = self._solve_arrays(parts_w, parts_p)
+
+        # unidades tomadas de cada grupo → los primeros objetos del grupo
+        per_group = np.bincount(group, weights=units * taken, minlength=len(counts))
+
+        order = np.argsort(inverse, kind="stable")
+        starts = np.cumsum(counts) - counts
+        rank = np.empty(len(inverse), dtype=np.int64)
+        rank[order] = np.arange(len(inverse)) - starts[inverse[order]]
+
+        return self._path(rank < per_group[inverse]), z
+
+    def _solve_arrays(self, weights, priorities):
+        ratios = self._ratios(weights, priorities)
+        n = len(weights)
+        C = self.capacity
+
+        # fuera de juego: objetos que no caben solos
+        eligible = np.flatnonzero((weights <= C) & (priorities > 0))
+
+        taken, b, room = self._break_item(weights, ratios, eligible, C)
+        self.break_index = b
+
+        x = np.zeros(n, dtype=bool)
+        x[taken] = True
+        z = priorities[taken].sum().item()
+
+        # todo cabe: la solución voraz es óptima
+        if b is None:
+            self.upper_bound = z
+            self.fixed = n
+            return x, z
+
+        r = ratios[b]
+        upper = z + room * r
+        self.upper_bound = upper
+
+        # |p_j - r·w_j|: lo que se pierde al cambiar j de la solución voraz
+        loss = np.abs(priorities[eligible] - r * weights[eligible])
+        greedy = x[eligible]
+        tolerance = 1e-9 * (abs(upper) + 1)
+
+        size = min(self.core_size, len(eligible))
+
+        while True:
+            if size < len(eligible):
+                inside = np.argpartition(loss, size - 1)[:size]
+            else:
+                inside = np.arange(len(eligible))
+
+            core = eligible[inside]
+            self.core_sizes.append(len(core))
+
+            # fuera del núcleo: valor voraz fijo
+            outside = np.ones(len(eligible), bool)
+            outside[inside] = False
+            fixed_taken = eligible[outside & greedy]
+
+            base_p = priorities[fixed_taken].sum().item()
+            base_w = weights[fixed_taken].sum().item()
+
+            value, chosen = self._solve_core(
+                core, weights, priorities, ratios, C - base_w, z - base_p
+            )
+
+            if chosen is not None:
+                z = base_p + value
+                x[:] = False
+                x[fixed_taken] = True
+                x[chosen] = True
+
+            # reducción con la nueva cota inferior z
+            if self.integral:
+                free = upper - loss >= z + 1 - tolerance
+            else:
+                free = upper - loss > z - tolerance
+
+            if not (free & outside).any() or size == len(eligible):
+                self.fixed = n - len(core)
+                return x, z
+
+            size = min(len(eligible), 2 * size)
+
+    def _path(self, x):
+        path = [
+            ("take" if taken else "skip", item)
+            for taken, item in zip(x.tolist(), self.parts)
+        ]
+
+        path = join_quantities(self.items, path)
+        return path
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = CoreSolver(items, capacity)
+    solution, total_priority = solver.solve()
+
+    print("\n===== Núcleo expansible =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+
+    # catálogo grande: un millón de repuestos
+    rng = random.Random(0)
+    catalog = [
+        Item(f"Repuesto {i}", rng.randint(1, 1000), rng.randint(1, 1000))
+        for i in range(1_000_000)
+    ]
+    capacity = sum(item.weight for item in catalog) // 2
+
+    start = time.perf_counter()
+    solver = CoreSolver(catalog, capacity)
+    solution, total_priority = solver.solve()
+
+    print(f"\n1 000 000 objetos: prioridad {total_priority} en {time.perf_counter() - start:.2f} s")
+    print(f"Cota superior: {solver.upper_bound:.1f}")
+    print(f"Núcleos: {solver.core_sizes}, estados máx.: {solver.max_states}")
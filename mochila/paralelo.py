@@ -0,0 +1,168 @@
+# =======================================================
+#   ENUMERACIÓN EXHAUSTIVA EN PARALELO (por subárboles)
+# =======================================================
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .grafo import Item, Graph, split_quantities, join_quantities, require_single_resource
+
+
+# =======================================================
+#          Trabajador: resolver un subárbol completo
+# =======================================================
+
+# datos del problema, cargados una vez por proceso
+_weights = ()
+_priorities = ()
+_capacity = 0
+
+
+def _init_worker(weights, priorities, capacity):
+    global _weights, _priorities, _capacity
+    _weights = weights
+    _priorities = priorities
+    _capacity = capacity
+
+
+def _explore(index, weight, priority):
+    # devuelve (mejor prioridad, máscara de objetos tomados, nodos)
+    if index == len(_weights):
+        return priority, 0, 1
+
+    # NO TOMAR (skip)
+    best, mask, count = _explore(index + 1, weight, priority)
+
+    # TOMAR (take) solo si cabe
+    if weight + _weights[index] <= _capacity:
+        take_best, take_mask, take_count = _explore(
+            index + 1,
+            weight + _weights[index],
+            priority + _priorities[index]
+        )
+        count += take_count
+
+        if take_best > best:
+            best = take_best
+            mask = take_mask | (1 << index)
+
+    return best, mask, count + 1
+
+
+def _solve_prefix(prefix):
+    # resultado compacto: solo tres enteros viajan de vuelta
+    index, weight, priority, prefix_mask = prefix
+    best, mask, count = _explore(index, weight, priority)
+    return best, mask | prefix_mask, count
+
+
+# =======================================================
+#                  Solver en paralelo
+# =======================================================
+
+class ParallelSolver:
+    def __init__(self, graph, split_depth=None, max_workers=None):
+        require_single_resource(graph.items, graph.capacity)
+
+        self.graph = graph
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        # cada parte es un bit de la máscara
+        self.parts = split_quantities(graph.items, graph.capacity)
+
+        # por defecto ~4 prefijos por proceso para repartir la carga
+        if split_depth is None:
+            split_depth = math.ceil(math.log2(4 * self.max_workers))
+        self.split_depth = min(split_depth, len(self.parts))
+
+        # nodos del árbol completo (igual que len(graph.nodes) tras
+        # build si no hay cantidades; con ellas, el árbol de las partes)
+        self.node_count = 0
+
+    # -------------------------------------------------------
+    # Expandir las primeras k decisiones en el proceso padre
+    # -------------------------------------------------------
+    def prefixes(self):
+        frontier = [(0, 0, 0, 0)]
+        self.node_count = 0
+
+        for i in range(self.split_depth):
+            item = self.parts[i]
+            next_level = []
+
+            for index, weight, priority, mask in frontier:
+                next_level.append((index + 1, weight, priority, mask))
+
+                if weight + item.weight <= self.graph.capacity:
+                    next_level.append((
+                        index + 1,
+                        weight + item.weight,
+                        priority + item.priority,
+                        mask | (1 << i)
+                    ))
+
+            self.node_count += len(frontier)
+            frontier = next_level
+
+        return frontier
+
+    def solve(self):
+        items = self.parts
+        prefixes = self.prefixes()
+
+        weights = tuple(item.weight for item in items)
+        priorities = tuple(item.priority for item in items)
+
+        best_priority = -1
+        best_mask = 0
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(weights, priorities, self.graph.capacity)
+        ) as pool:
+            chunksize = max(1, len(prefixes) // (4 * self.max_workers))
+
+            # fusionar solo el mejor resultado y los contadores
+            for best, mask, count in pool.map(_solve_prefix, prefixes, chunksize=chunksize):
+                self.node_count += count
+
+                if best > best_priority:
+                    best_priority = best
+                    best_mask = mask
+
+        path = [
+            ("take" if best_mask >> i & 1 else "skip", item)
+            for i, item in enumerate(items)
+        ]
+
+        path = join_quantities(self.graph.items, path)
+        return path, best_priority
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = ParallelSolver(Graph(items, capacity), split_depth=2)
+    solution, total_priority = solver.solve()
+
+    print("\n===== Enumeración en paralelo =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Nodos enumerados: {solver.node_count}")
@@ -0,0 +1,163 @@
+# =======================================================
+#   FRONTERA DE PARETO (Nemhauser–Ullmann) — MOCHILA 0/1
+# =======================================================
+
+from array import array
+from bisect import bisect_right
+
+from .grafo import Item, UNBOUNDED, split_quantities, join_quantities, require_single_resource
+
+
+# =======================================================
+#                  Solver de Pareto
+# =======================================================
+
+class ParetoSolver:
+    def __init__(self, items, capacity=None):
+        require_single_resource(items, capacity)
+
+        # capacity=None: sin límite (frontera eficiente completa)
+        self.items = items
+        self.capacity = capacity
+
+        # sin capacidad caben todas las unidades de cada objeto
+        if capacity is None:
+            for item in items:
+                if item.quantity == UNBOUNDED:
+                    raise ValueError(f"objeto sin límite de unidades y sin capacidad: {item!r}")
+            capacity = sum(item.weight * item.quantity for item in items)
+        self.parts = split_quantities(items, capacity)
+
+        # última frontera: pesos crecientes, prioridades crecientes
+        self.weights = []
+        self.priorities = []
+
+        # back[i][k] = (índice en la frontera anterior << 1) | take
+        self.back = []
+
+        # tamaño de la frontera más grande
+        self.max_frontier = 0
+
+    def build(self):
+        weights = [0]
+        priorities = [0]
+        self.back = []
+        self.max_frontier = 1
+
+        for item in self.parts:
+            weights, priorities, back = self._merge(weights, priorities, item)
+            self.back.append(back)
+            self.max_frontier = max(self.max_frontier, len(weights))
+
+        self.weights = weights
+        self.priorities = priorities
+
+    # -------------------------------------------------------
+    # Mezcla lineal de la frontera anterior (skip) con la
+    # misma frontera desplazada por el objeto (take),
+    # descartando los puntos dominados
+    # -------------------------------------------------------
+    def _merge(self, weights, priorities, item):
+        n = len(weights)
+
+        # solo se desplazan los puntos que siguen cabiendo
+        if self.capacity is None:
+            m = n
+        else:
+            m = bisect_right(weights, self.capacity - item.weight)
+
+        out_weights = []
+        out_priorities = []
+        back = array("q")
+
+        i = j = 0
+        while i < n or j < m:
+            if j < m:
+                take_weight = weights[j] + item.weight
+                take_priority = priorities[j] + item.priority
+
+            use_skip = j >= m or (
+                i < n and (
+                    weights[i] < take_weight
+                    or (weights[i] == take_weight and priorities[i] >= take_priority)
+                )
+            )
+
+            if use_skip:
+                weight, priority, pointer = weights[i], priorities[i], i << 1
+                i += 1
+            else:
+                weight, priority, pointer = take_weight, take_priority, j << 1 | 1
+                j += 1
+
+            # dominado: otro punto igual o más ligero ya rinde lo mismo
+            if out_priorities and priority <= out_priorities[-1]:
+                continue
+
+            out_weights.append(weight)
+            out_priorities.append(priority)
+            back.append(pointer)
+
+        return out_weights, out_priorities, back
+
+    def solve(self):
+        self.build()
+
+        # todos los puntos caben: el último es el de mayor prioridad
+        k = len(self.weights) - 1
+        return self.path(k), self.priorities[k]
+
+    def frontier(self):
+        if not self.weights:
+            self.build()
+        return list(zip(self.weights, self.priorities))
+
+    # -------------------------------------------------------
+    # Reconstrucción del punto k siguiendo los back-pointers
+    # -------------------------------------------------------
+    def path(self, k):
+        path = []
+
+        for level in range(len(self.parts) - 1, -1, -1):
+            pointer = self.back[level][k]
+            action = "take" if pointer & 1 else "skip"
+
+            path.append((action, self.parts[level]))
+            k = pointer >> 1
+
+        path.reverse()
+
+        path = join_quantities(self.items, path)
+        return path
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = ParetoSolver(items, capacity)
+    solution, total_priority = solver.solve()
+
+    print("\n===== Frontera de Pareto =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+
+    print("\n----- Frontera eficiente (peso, prioridad) -----\n")
+
+    for k, (weight, priority) in enumerate(solver.frontier()):
+        taken = [item.name for action, item in solver.path(k) if action == "take"]
+        print(f"W={weight:2d}, P={priority:3d} → {taken}")
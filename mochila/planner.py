@@ -0,0 +1,328 @@
+# =======================================================
+#   PLANIFICADOR: ESTIMAR TAMAÑO Y ELEGIR EL MOTOR
+# =======================================================
+
+import math
+import random
+from functools import reduce
+from importlib.util import find_spec
+
+from .grafo import (
+    Item, Graph, KnapsackSolver,
+    split_quantities, join_quantities, require_single_resource,
+)
+from .bb import BranchAndBoundSolver
+
+# Los motores dp, mitm y core usan NumPy: se importan solo al elegirlos
+HAS_NUMPY = find_spec("numpy") is not None
+
+
+# -------------------------------------------------------
+# Costes aproximados por estado (medidos en CPython 3.11)
+# -------------------------------------------------------
+
+NODE_BYTES = 300           # Node + Edge + listas (Graph.build)
+MERGED_NODE_BYTES = 400    # lo anterior + entrada del diccionario
+BB_NODE_BYTES = 200        # Node + entrada del heap
+MITM_ENTRY_BYTES = 96      # (peso, prioridad, máscara) + temporales
+
+NODE_SECONDS = 1.5e-6
+MERGED_NODE_SECONDS = 2e-6
+BB_NODE_SECONDS = 4e-6
+DP_CELL_SECONDS = 2e-9
+MITM_ENTRY_SECONDS = 1e-7
+BITSET_WORD_SECONDS = 1e-8    # por palabra de 64 bits y objeto
+CORE_ITEM_BYTES = 96          # arrays por objeto + temporales de la selección
+CORE_ITEM_SECONDS = 2e-6      # leer el Item + selección lineal de la ruptura
+# DP del núcleo: de 5 ms a ~1 s en las instancias Pisinger de
+# bench.py (n = 100..10^4, peor en strongly/inverse/subset-sum);
+# con un valor medio-pesimista la DP gana hasta unos cientos
+CORE_SOLVE_SECONDS = 0.2
+
+# Sondeos de Knuth: cada uno recorre hasta n niveles, así que se
+# reparten PROBE_STEPS niveles (como mucho PROBES sondeos, y al
+# menos uno); con más de PROBE_LIMIT objetos no se sondea bb
+PROBES = 64
+PROBE_STEPS = 20_000
+PROBE_LIMIT = 10_000
+TREE_NODES_CAP = 1e18         # más allá, ningún presupuesto alcanza
+
+
+# =======================================================
+#           Estimación de una estrategia
+# =======================================================
+
+class Estimate:
+    def __init__(self, name, states, memory, seconds, reason=None):
+        self.name = name
+        self.states = states
+        self.memory = memory      # bytes
+        self.seconds = seconds
+        self.reason = reason      # por qué no se puede usar (o None)
+
+    def available(self):
+        return self.reason is None
+
+    def __repr__(self):
+        if self.reason:
+            return f"{self.name}: no disponible ({self.reason})"
+        return (
+            f"{self.name}: ~{self.states:.3g} estados, "
+            f"~{self.memory / 2**20:.3g} MiB, ~{self.seconds:.3g} s"
+        )
+
+
+# -------------------------------------------------------
+# Tamaño del árbol completo (estimador de Knuth): el take
+# solo se poda por capacidad
+# -------------------------------------------------------
+
+def estimate_tree_nodes(items, capacity, probes=PROBES, seed=0):
+    rng = random.Random(seed)
+    total = 0
+
+    for _ in range(probes):
+        weight = 0
+        width = 1
+        size = 1
+
+        for item in items:
+            fits = weight + item.weight <= capacity
+            children = 2 if fits else 1
+
+            width *= children
+            size += width
+
+            if size > TREE_NODES_CAP:
+                return TREE_NODES_CAP
+
+            if fits and rng.random() < 0.5:
+                weight += item.weight
+
+        total += size
+
+    return total / probes
+
+
+def knuth_probes(n):
+    return max(1, min(PROBES, PROBE_STEPS // max(1, n)))
+
+
+def weight_gcd(items, capacity):
+    values = [item.weight for item in items] + [capacity]
+
+    if not all(isinstance(v, int) or float(v).is_integer() for v in values):
+        return None
+    return reduce(math.gcd, (int(v) for v in values)) or 1
+
+
+# =======================================================
+#                  Planificador
+# =======================================================
+
+class Planner:
+    def __init__(self, items, capacity, memory_budget=1 << 30):
+        require_single_resource(items, capacity)
+
+        self.items = items
+        self.capacity = capacity
+        self.memory_budget = memory_budget
+
+        # objetos con cantidad: todos los motores ven las partes 0/1
+        self.parts = split_quantities(items, capacity)
+
+        self.estimates = []
+        self.ranking = []
+        self.choice = None
+
+    def estimate(self):
+        n = len(self.parts)
+        C = self.capacity
+        g = weight_gcd(self.parts, C)
+
+        estimates = []
+
+        # árbol completo de Graph.build
+        probes = knuth_probes(n)
+        tree = estimate_tree_nodes(self.parts, C, probes=probes)
+        estimates.append(Estimate(
+            "tree", tree, tree * NODE_BYTES, tree * NODE_SECONDS
+        ))
+
+        # DAG fusionado por (index, weight): pesos múltiplos de g
+        if g is None:
+            merged = tree
+        else:
+            merged = min(tree, n * (C // g + 1) + 1)
+        estimates.append(Estimate(
+            "dag", merged, merged * MERGED_NODE_BYTES, merged * MERGED_NODE_SECONDS
+        ))
+
+        # DP por capacidad (NumPy): n × (C/g + 1) celdas
+        if not HAS_NUMPY:
+            estimates.append(Estimate("dp", 0, 0, 0, "NumPy no instalado"))
+        elif g is None:
+            estimates.append(Estimate("dp", 0, 0, 0, "pesos no enteros"))
+        else:
+            cells = n * (C // g + 1)
+            memory = cells / 8 + 3 * 8 * (C // g + 1)
+            estimates.append(Estimate("dp", cells, memory, cells * DP_CELL_SECONDS))
+
+        # meet-in-the-middle: 2 · 2^(n/2) subconjuntos como máximo
+        if not HAS_NUMPY:
+            estimates.append(Estimate("mitm", 0, 0, 0, "NumPy no instalado"))
+        elif (n + 1) // 2 > 62:
+            estimates.append(Estimate("mitm", 0, 0, 0, "más de 62 objetos por mitad"))
+        else:
+            entries = 2 * 2 ** ((n + 1) // 2)
+            estimates.append(Estimate(
+                "mitm", entries, entries * MITM_ENTRY_BYTES,
+                entries * math.log2(entries + 1) * MITM_ENTRY_SECONDS
+            ))
+
+        # subset-sum con bitsets: solo si prioridad == peso
+        if g is None or any(item.priority != item.weight for item in self.parts):
+            estimates.append(Estimate("bitset", 0, 0, 0, "prioridad distinta del peso"))
+        else:
+            words = n * (C // 64 + 1)
+            rows = 2 * math.isqrt(n) + 1
+            estimates.append(Estimate(
+                "bitset", words, rows * (C / 8 + 32), words * BITSET_WORD_SECONDS
+            ))
+
+        # núcleo expansible: lineal en n más una DP pequeña
+        if not HAS_NUMPY:
+            estimates.append(Estimate("core", 0, 0, 0, "NumPy no instalado"))
+        else:
+            estimates.append(Estimate(
+                "core", n, n * CORE_ITEM_BYTES, n * CORE_ITEM_SECONDS + CORE_SOLVE_SECONDS
+            ))
+
+        # branch and bound: estimador de Knuth sobre el árbol podado
+        if n > PROBE_LIMIT:
+            estimates.append(Estimate("bb", 0, 0, 0, f"más de {PROBE_LIMIT} objetos"))
+        else:
+            nodes = BranchAndBoundSolver(Graph(self.parts, C)).estimate_nodes(
+                probes=probes, cap=TREE_NODES_CAP
+            )
+            estimates.append(Estimate(
+                "bb", nodes, nodes * BB_NODE_BYTES, nodes * BB_NODE_SECONDS
+            ))
+
+        self.estimates = estimates
+        return estimates
+
+    # -------------------------------------------------------
+    # Estrategias que caben en el presupuesto, de la más rápida
+    # a la más lenta. La estimación de bb (sondeos de Knuth
+    # contra la voraz) puede fallar por órdenes de magnitud:
+    # nunca va por delante de una DP exacta que cabe (dp o el
+    # núcleo, acotadas por n × C en el peor caso)
+    # -------------------------------------------------------
+    def plan(self):
+        if not self.estimates:
+            self.estimate()
+
+        candidates = [
+            e for e in self.estimates
+            if e.available() and e.memory <= self.memory_budget
+        ]
+        if not candidates:
+            raise MemoryError(
+                f"ninguna estrategia cabe en {self.memory_budget} bytes: {self.estimates}"
+            )
+
+        has_dp = any(e.name in ("dp", "core") for e in candidates)
+        self.ranking = sorted(candidates, key=lambda e: (e.name == "bb" and has_dp, e.seconds))
+
+        self.choice = self.ranking[0]
+        return self.choice
+
+    # -------------------------------------------------------
+    # bb corre con tope de nodos (el presupuesto de memoria);
+    # si lo agota sin cerrar la brecha se pasa a la siguiente
+    # -------------------------------------------------------
+    def solve(self):
+        self.plan()
+
+        for choice in self.ranking:
+            self.choice = choice
+            result = self._solve_parts(choice)
+            if result is not None:
+                break
+        else:
+            raise MemoryError(
+                f"bb agotó {self.memory_budget} bytes sin probar el óptimo "
+                f"y no quedan otras estrategias: {self.estimates}"
+            )
+
+        path, priority = result
+        path = join_quantities(self.items, path)
+        return path, priority
+
+    def _solve_parts(self, choice):
+        items = self.parts
+        C = self.capacity
+
+        if choice.name in ("tree", "dag"):
+            graph = Graph(items, C)
+            graph.build(merge=choice.name == "dag")
+            return KnapsackSolver(graph).solve()
+
+        if choice.name == "dp":
+            from .dp import NumpyDPSolver
+
+            # dividir pesos y capacidad por su mcd
+            g = weight_gcd(items, C)
+            scaled = [Item(item.name, int(item.weight) // g, item.priority) for item in items]
+
+            path, priority = NumpyDPSolver(scaled, int(C) // g).solve()
+            return [(action, items[i]) for i, (action, _) in enumerate(path)], priority
+
+        if choice.name == "mitm":
+            from .mitm import MeetInTheMiddleSolver
+            return MeetInTheMiddleSolver(items, C).solve()
+
+        if choice.name == "bitset":
+            from .subsetsum import SubsetSumSolver
+            return SubsetSumSolver(items, C).solve()
+
+        if choice.name == "core":
+            from .nucleo import CoreSolver
+            return CoreSolver(items, C).solve()
+
+        # cada nodo explorado crea hasta dos hijos que quedan vivos
+        solver = BranchAndBoundSolver(Graph(items, C))
+        result = solver.solve(max_nodes=self.memory_budget // (2 * BB_NODE_BYTES))
+        return result if solver.gap == 0 else None
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    planner = Planner(items, capacity)
+    solution, total_priority = planner.solve()
+
+    print("\n===== Planificador =====\n")
+
+    for estimate in planner.estimates:
+        print(estimate)
+
+    print(f"\nElegido: {planner.choice.name}")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
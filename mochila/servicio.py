@@ -0,0 +1,446 @@
+# =======================================================
+#   SERVICIO ASYNCIO: JSON LINES POR SOCKET LOCAL
+# =======================================================
+#
+#   python -m mochila.servicio --socket /tmp/mochila.sock
+#   python -m mochila.servicio --port 8765 --workers 4
+#
+# Una petición por línea (mismo formato de objetos que lote):
+#   {"id": 1, "capacity": 15, "deadline": 2.5,
+#    "items": [{"name": "Sable de luz", "weight": 5, "priority": 90}, ...]}
+#
+# Una respuesta por línea con el mismo id, en el orden en que
+# terminan (no en el de llegada):
+#   {"id": 1, "taken": [...], "priority": 265, "seconds": 0.01, "coalesced": false}
+#   {"id": 2, "error": "deadline"}
+#
+# Peticiones con la misma forma canónica (cache.canonical_key:
+# ni nombres ni orden importan) que ya están en vuelo se unen
+# a ese cálculo. Los cálculos van a un pool de procesos: el
+# bucle de eventos solo lee, agrupa y escribe.
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import numbers
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .grafo import Item, path_counts, path_from_counts
+from .cache import canonical_order, canonical_key
+from .lote import ENGINES
+
+
+# longitud máxima de una línea de petición (el límite por
+# defecto de asyncio, 64 KiB, no llega a 2000 objetos)
+LINE_LIMIT = 64 * 2**20
+
+
+# -------------------------------------------------------
+# Trabajador: resuelve la instancia canónica (objetos en
+# orden canónico) y devuelve las posiciones tomadas, una
+# por unidad, para que cada petición la traduzca a los suyos.
+#
+# Con limit, SIGALRM corta el cálculo en el propio proceso:
+# un trabajo que ya nadie espera no ocupa el pool para siempre
+# -------------------------------------------------------
+
+def _expire(signum, frame):
+    raise TimeoutError("deadline")
+
+
+def _init_worker():
+    # Ctrl-C llega a todo el grupo de procesos: solo el servidor
+    # lo atiende y cierra el pool ordenadamente
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _solve_canonical(engine, rows, capacity, limit=None):
+    items = [
+        Item(str(rank), weight, priority, quantity=quantity)
+        for rank, (weight, priority, quantity) in enumerate(rows)
+    ]
+
+    # solo en POSIX y en el hilo principal (no con max_workers=0)
+    alarm = (
+        limit is not None and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if alarm:
+        signal.signal(signal.SIGALRM, _expire)
+        signal.setitimer(signal.ITIMER_REAL, limit)
+
+    try:
+        path, priority = ENGINES[engine](items, capacity)
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    taken = [
+        rank
+        for rank, count in enumerate(path_counts(items, path))
+        for _ in range(count)
+    ]
+    return priority, taken
+
+
+def _number(value, what):
+    # bool es int para isinstance, pero no un peso válido
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        raise TypeError(f"{what} no numérico: {value!r}")
+    return value
+
+
+def _parse_item(o):
+    # objeto como dict o como lista [name, weight, priority(, quantity)]
+    if isinstance(o, dict):
+        name, weight, priority = o["name"], o["weight"], o["priority"]
+        quantity = o.get("quantity", 1)
+    else:
+        name, weight, priority = o[0], o[1], o[2]
+        quantity = o[3] if len(o) > 3 else 1
+
+    return Item(
+        name, _number(weight, "weight"), _number(priority, "priority"),
+        quantity=_number(quantity, "quantity")
+    )
+
+
+def _parse_items(raw):
+    return [_parse_item(o) for o in raw]
+
+
+# =======================================================
+#                  Servicio de resolución
+# =======================================================
+
+class SolveService:
+    def __init__(self, engine="planner", max_workers=None, deadline=None,
+                 line_limit=LINE_LIMIT, max_pending=256):
+        self.engine = engine
+        self.line_limit = line_limit
+
+        # peticiones en curso por conexión como mucho: al llegar al
+        # tope se deja de leer el socket (acota tareas y memoria)
+        self.max_pending = max_pending
+
+        # max_workers=0: sin pool (executor por defecto del bucle,
+        # hilos; útil para depurar)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.pool = None
+
+        # segundos por petición si no trae "deadline" (None = sin límite)
+        self.deadline = deadline
+
+        # clave canónica -> [resultado, peticiones esperando,
+        # fin (monotonic), cálculo en curso]
+        self.inflight = {}
+
+        self.requests = 0
+        self.computed = 0
+        self.coalesced = 0
+        self.expired = 0
+        self.errors = 0
+
+    def start(self):
+        # spawn, no fork: el pool crea procesos a demanda y con fork
+        # heredarían los sockets de los clientes abiertos en ese
+        # momento (la conexión no se cerraría hasta que muriese el
+        # trabajador)
+        if self.max_workers and self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    # -------------------------------------------------------
+    # Un cálculo por clave canónica: las peticiones iguales
+    # que llegan mientras está en vuelo esperan el mismo
+    # resultado, salvo que el cálculo vaya a cortarse antes de
+    # su deadline. Entonces se lanza otro con el deadline más
+    # largo y se cancela el anterior: todas las peticiones
+    # esperan el nuevo (un cálculo ya empezado en un proceso no
+    # se puede parar, pero su alarma lo corta y se ignora)
+    # -------------------------------------------------------
+    def _computation(self, key, rows, capacity, deadline):
+        loop = asyncio.get_running_loop()
+        end = None if deadline is None else loop.time() + deadline
+
+        entry = self.inflight.get(key)
+
+        if entry is not None and (entry[2] is None or (end is not None and end <= entry[2])):
+            entry[1] += 1
+            self.coalesced += 1
+            return entry[0], True
+
+        job = loop.run_in_executor(
+            self.pool, _solve_canonical, self.engine, rows, capacity, deadline
+        )
+        self.computed += 1
+
+        if entry is None:
+            entry = self.inflight[key] = [loop.create_future(), 1, end, job]
+        else:
+            replaced = entry[3]
+            entry[1] += 1
+            entry[2] = end
+            entry[3] = job
+            replaced.cancel()
+
+        def finish(job):
+            result = entry[0]
+
+            # cancelado o sustituido: el resultado es del siguiente
+            if result.done() or job is not entry[3] or job.cancelled():
+                return
+
+            if self.inflight.get(key) is entry:
+                del self.inflight[key]
+
+            error = job.exception()
+            if error is None:
+                result.set_result(job.result())
+            else:
+                result.set_exception(error)
+
+        job.add_done_callback(finish)
+        return entry[0], False
+
+    def _leave(self, key, result):
+        # la petición deja de esperar; sin nadie más, se cancela
+        # el cálculo (solo surte efecto si aún no empezó)
+        entry = self.inflight.get(key)
+        if entry is None or entry[0] is not result:
+            return
+
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self.inflight[key]
+            entry[3].cancel()
+            result.cancel()
+
+    async def solve(self, request):
+        self.requests += 1
+        start = time.perf_counter()
+
+        if not isinstance(request, dict):
+            self.errors += 1
+            return {"id": None, "error": "la petición debe ser un objeto JSON"}
+        key_id = request.get("id")
+
+        try:
+            items = _parse_items(request["items"])
+            capacity = _number(request["capacity"], "capacity")
+
+            deadline = request.get("deadline", self.deadline)
+            if deadline is not None and (
+                isinstance(deadline, bool)
+                or not isinstance(deadline, (int, float))
+                or not 0 < deadline < float("inf")
+            ):
+                raise ValueError(f"deadline no válido: {deadline!r}")
+
+            # dentro del try: la respuesta de error conserva el id
+            order = canonical_order(items)
+            key = canonical_key(items, capacity, order)
+            rows = [(items[i].weight, items[i].priority, items[i].quantity) for i in order]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            self.errors += 1
+            return {"id": key_id, "error": f"{type(e).__name__}: {e}"}
+
+        future, coalesced = self._computation(key, rows, capacity, deadline)
+
+        # shield: si esta petición expira, las demás siguen esperando
+        try:
+            priority, taken = await asyncio.wait_for(asyncio.shield(future), deadline)
+        except asyncio.TimeoutError:
+            self._leave(key, future)
+            self.expired += 1
+            return {"id": key_id, "error": "deadline"}
+        except asyncio.CancelledError:
+            self._leave(key, future)
+            raise
+        except Exception as e:
+            self.errors += 1
+            return {"id": key_id, "error": f"{type(e).__name__}: {e}"}
+
+        # traducir la solución canónica a los objetos de la petición
+        counts = [0] * len(items)
+        for rank in taken:
+            counts[order[rank]] += 1
+
+        path = path_from_counts(items, counts)
+
+        return {
+            "id": key_id,
+            "taken": [item.name for action, item in path if action == "take"],
+            "priority": priority,
+            "seconds": time.perf_counter() - start,
+            "coalesced": coalesced,
+        }
+
+    # -------------------------------------------------------
+    # Conexión: cada línea se atiende en su propia tarea, así
+    # una petición lenta no retiene a las siguientes; con
+    # max_pending tareas abiertas se espera a que acabe una
+    # -------------------------------------------------------
+    async def handle(self, reader, writer):
+        lock = asyncio.Lock()
+        slots = asyncio.Semaphore(self.max_pending)
+        tasks = set()
+
+        async def reply(response):
+            data = (json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8")
+            async with lock:
+                writer.write(data)
+                await writer.drain()
+
+        async def answer(line):
+            try:
+                request = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                self.errors += 1
+                response = {"id": None, "error": f"{type(e).__name__}: {e}"}
+            else:
+                # cualquier fallo (p. ej. un pool roto) se contesta
+                try:
+                    response = await self.solve(request)
+                except Exception as e:
+                    self.errors += 1
+                    response = {"id": None, "error": f"{type(e).__name__}: {e}"}
+
+            await reply(response)
+
+        try:
+            while True:
+                line, error = await self._read_line(reader)
+
+                if error is not None:
+                    self.errors += 1
+                    await reply({"id": None, "error": error})
+                    continue
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                await slots.acquire()
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda task: slots.release())
+
+            # el cliente cerró su lado: terminar lo pendiente
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            for task in tasks:
+                task.cancel()
+        finally:
+            writer.close()
+
+    async def _read_line(self, reader):
+        # (línea, None); (b"", None) al final; (None, error) si la
+        # línea pasa de line_limit, que se descarta hasta su \n
+        try:
+            return await reader.readuntil(b"\n"), None
+        except asyncio.IncompleteReadError as e:
+            return e.partial, None
+        except asyncio.LimitOverrunError:
+            pass
+
+        while True:
+            try:
+                await reader.readuntil(b"\n")
+                break
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                break
+
+        return None, f"línea de más de {self.line_limit} bytes"
+
+    async def serve(self, path=None, host="127.0.0.1", port=0):
+        self.start()
+
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle, path, limit=self.line_limit)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, limit=self.line_limit)
+
+        return server
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "computed": self.computed,
+            "coalesced": self.coalesced,
+            "expired": self.expired,
+            "errors": self.errors,
+            "inflight": len(self.inflight),
+        }
+
+
+# =======================================================
+#                   Línea de comandos
+# =======================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio de la mochila (JSON Lines)")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument("--socket", default=None, help="ruta del socket Unix")
+    transport.add_argument("--port", type=int, default=8765, help="puerto TCP en --host")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="planner")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos (0 = hilos del bucle); por defecto os.cpu_count()")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="segundos por petición si no trae 'deadline'")
+    parser.add_argument("--max-line", type=int, default=LINE_LIMIT,
+                        help="bytes por línea de petición como mucho")
+    parser.add_argument("--max-pending", type=int, default=256,
+                        help="peticiones en curso por conexión como mucho")
+    args = parser.parse_args(argv)
+
+    service = SolveService(
+        args.engine, args.workers, args.deadline, args.max_line, args.max_pending
+    )
+
+    async def run():
+        server = await service.serve(args.socket, args.host, args.port)
+        where = args.socket or ", ".join(
+            f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets
+        )
+        print(f"Escuchando en {where} (motor {args.engine})")
+
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # un segundo Ctrl-C no debe dejar el pool a medio cerrar
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        service.close()
+        if args.socket is not None and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+        print(f"\n{service.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+# =======================================================
+#     GRAFO COMPACTO (struct-of-arrays) — MOCHILA 0/1
+# =======================================================
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .grafo import Item, Edge, KnapsackSolver, require_single_resource
+
+
+# =======================================================
+#           Vista de solo lectura de un nodo
+# =======================================================
+
+class NodeView:
+    __slots__ = ("graph", "id")
+
+    def __init__(self, graph, node_id):
+        self.graph = graph
+        self.id = node_id
+
+    @property
+    def index(self):
+        return self.graph.index[self.id]
+
+    @property
+    def weight(self):
+        return self.graph.weight[self.id]
+
+    @property
+    def priority(self):
+        return self.graph.priority[self.id]
+
+    @property
+    def parent(self):
+        parent_id = self.graph.parent[self.id]
+        if parent_id < 0:
+            return None
+        return NodeView(self.graph, parent_id)
+
+    @property
+    def action(self):
+        if self.graph.parent[self.id] < 0:
+            return None
+        return "take" if self.graph.is_take(self.id) else "skip"
+
+    # unidades tomadas (1 si es skip o si no hay cantidades)
+    @property
+    def count(self):
+        if self.graph.counts is None or not self.graph.is_take(self.id):
+            return 1
+        return self.graph.counts[self.id]
+
+    # las aristas no se guardan: se derivan de los ids de los padres
+    @property
+    def edges(self):
+        return [
+            Edge(NodeView(self.graph, child), self.graph.action_of(child))
+            for child in self.graph.children(self.id)
+        ]
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, NodeView)
+            and self.graph is other.graph
+            and self.id == other.id
+        )
+
+    def __hash__(self):
+        return hash((id(self.graph), self.id))
+
+    def __repr__(self):
+        return f"NodeView(i={self.index}, W={self.weight}, P={self.priority})"
+
+
+# -------------------------------------------------------
+# Secuencia perezosa de nodos (como graph.nodes)
+# -------------------------------------------------------
+
+class NodeList:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        return len(self.graph.index)
+
+    def __getitem__(self, node_id):
+        if node_id < 0:
+            node_id += len(self)
+        if not 0 <= node_id < len(self):
+            raise IndexError(node_id)
+        return NodeView(self.graph, node_id)
+
+    def __iter__(self):
+        for node_id in range(len(self)):
+            yield NodeView(self.graph, node_id)
+
+
+# =======================================================
+#            TDA: CompactGraph (mismo API que Graph)
+# =======================================================
+
+class CompactGraph:
+    def __init__(self, items, capacity):
+        require_single_resource(items, capacity)
+
+        self.items = items
+        self.capacity = capacity
+
+        integral = all(
+            int(item.weight) == item.weight and int(item.priority) == item.priority
+            for item in items
+        )
+        code = "q" if integral else "d"
+
+        # un array tipado por campo
+        # (un árbol completo nunca llega a 65535 niveles: 2 bytes bastan)
+        self.index = array("H", [0])
+        self.weight = array(code, [0])
+        self.priority = array(code, [0])
+        self.parent = array("q", [-1])
+
+        # acción de cada nodo: 1 bit (1 = take, 0 = skip)
+        self.actions = bytearray(1)
+
+        # unidades tomadas por nodo, solo si algún objeto tiene cantidad
+        self.counts = None
+        if any(item.quantity != 1 for item in items):
+            self.counts = array("Q", [0])
+
+        self.start = NodeView(self, 0)
+        self.nodes = NodeList(self)
+
+    def build(self):
+        n = len(self.items)
+        current = 0
+
+        # los nodos se añaden en orden BFS: el propio array es la cola
+        while current < len(self.index):
+            i = self.index[current]
+
+            if i == n:
+                current += 1
+                continue
+
+            item = self.items[i]
+            weight = self.weight[current]
+            priority = self.priority[current]
+
+            # NO TOMAR (skip)
+            self._append(i + 1, weight, priority, current, False)
+
+            # TOMAR (take) si cabe; con cantidad, un hijo por
+            # número de unidades que caben (igual que Graph.build)
+            if item.quantity == 1:
+                units = 1 if weight + item.weight <= self.capacity else 0
+            else:
+                units = item.units(self.capacity - weight)
+
+            for count in range(1, units + 1):
+                self._append(
+                    i + 1,
+                    weight + count * item.weight,
+                    priority + count * item.priority,
+                    current, True, count
+                )
+
+            current += 1
+
+    def _append(self, index, weight, priority, parent, take, count=1):
+        node_id = len(self.index)
+
+        self.index.append(index)
+        self.weight.append(weight)
+        self.priority.append(priority)
+        self.parent.append(parent)
+
+        if self.counts is not None:
+            self.counts.append(count if take else 0)
+
+        if node_id % 8 == 0:
+            self.actions.append(0)
+        if take:
+            self.actions[node_id >> 3] |= 1 << (node_id & 7)
+
+    def is_take(self, node_id):
+        return (self.actions[node_id >> 3] >> (node_id & 7)) & 1
+
+    def action_of(self, node_id):
+        return "take" if self.is_take(node_id) else "skip"
+
+    # -------------------------------------------------------
+    # Hijos de un nodo: en orden BFS los ids de los padres
+    # quedan ordenados, así que basta una búsqueda binaria
+    # -------------------------------------------------------
+    def children(self, node_id):
+        lo = bisect_left(self.parent, node_id, node_id + 1)
+        hi = bisect_right(self.parent, node_id, lo)
+        return range(lo, hi)
+
+    def nbytes(self):
+        buffers = [self.index, self.weight, self.priority, self.parent]
+        if self.counts is not None:
+            buffers.append(self.counts)
+
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers) + len(self.actions)
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    graph = CompactGraph(items, capacity)
+    graph.build()
+
+    solution, total_priority = KnapsackSolver(graph).solve()
+
+    print("\n===== Grafo compacto (struct-of-arrays) =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Nodos: {len(graph.nodes)}, bytes por nodo: {graph.nbytes() / len(graph.nodes):.1f}")
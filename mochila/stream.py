@@ -0,0 +1,154 @@
+# =======================================================
+#    CONSTRUIR Y RESOLVER EN STREAMING (nivel a nivel)
+# =======================================================
+
+from array import array
+
+from .grafo import Item, Graph, split_quantities, join_quantities, require_single_resource
+
+
+# =======================================================
+#                  Solver en streaming
+# =======================================================
+
+class StreamingSolver:
+    def __init__(self, graph, merge=False):
+        require_single_resource(graph.items, graph.capacity)
+
+        # el grafo NO se construye: graph.nodes nunca se llena
+        self.graph = graph
+        self.merge = merge
+
+        self.parts = split_quantities(graph.items, graph.capacity)
+
+        integral = all(
+            int(item.weight) == item.weight and int(item.priority) == item.priority
+            for item in self.parts
+        )
+        self.code = "q" if integral else "d"
+
+        # tamaño de la frontera más ancha de la última búsqueda
+        self.peak_frontier = 0
+
+    # -------------------------------------------------------
+    # Hijos de un nivel: arrays de pesos y prioridades y la
+    # máscara de decisiones de cada estado (bit i = se tomó la
+    # parte i, como en paralelo.py). Sin Node ni back-pointers:
+    # el nivel anterior se suelta entero
+    # -------------------------------------------------------
+    def expand(self, level, i, item):
+        weights, priorities, masks = level
+        capacity = self.graph.capacity
+        bit = 1 << i
+
+        child_weights = array(self.code)
+        child_priorities = array(self.code)
+        child_masks = []
+
+        for weight, priority, mask in zip(weights, priorities, masks):
+
+            # NO TOMAR (skip)
+            child_weights.append(weight)
+            child_priorities.append(priority)
+            child_masks.append(mask)
+
+            # TOMAR (take) solo si cabe
+            if weight + item.weight <= capacity:
+                child_weights.append(weight + item.weight)
+                child_priorities.append(priority + item.priority)
+                child_masks.append(mask | bit)
+
+        if self.merge:
+            return self._merge(child_weights, child_priorities, child_masks)
+        return child_weights, child_priorities, child_masks
+
+    def _merge(self, weights, priorities, masks):
+        # un estado por peso: el de mayor prioridad
+        best = {}
+        for j, weight in enumerate(weights):
+            kept = best.get(weight)
+            if kept is None or priorities[j] > priorities[kept]:
+                best[weight] = j
+
+        keep = best.values()
+        return (
+            array(self.code, (weights[j] for j in keep)),
+            array(self.code, (priorities[j] for j in keep)),
+            [masks[j] for j in keep]
+        )
+
+    # -------------------------------------------------------
+    # Fronteras sucesivas: cada nivel se suelta al crear el
+    # siguiente (la memoria sigue a la frontera más ancha)
+    # -------------------------------------------------------
+    def levels(self):
+        level = (array(self.code, [0]), array(self.code, [0]), [0])
+        yield level
+
+        for i, item in enumerate(self.parts[:-1]):
+            level = self.expand(level, i, item)
+            yield level
+
+    def solve(self):
+        items = self.parts
+
+        self.peak_frontier = 0
+        level = None
+
+        for level in self.levels():
+            self.peak_frontier = max(self.peak_frontier, len(level[0]))
+
+        if not items:
+            return [("skip", item) for item in self.graph.items], 0
+
+        # último nivel: los estados terminales se evalúan al vuelo
+        last = len(items) - 1
+        item = items[last]
+
+        best_priority = -1
+        best_mask = 0
+
+        for weight, priority, mask in zip(*level):
+            if priority > best_priority:
+                best_priority = priority
+                best_mask = mask
+
+            if weight + item.weight <= self.graph.capacity and priority + item.priority > best_priority:
+                best_priority = priority + item.priority
+                best_mask = mask | 1 << last
+
+        # reconstrucción desde la máscara del estado ganador
+        path = [
+            ("take" if best_mask >> i & 1 else "skip", part)
+            for i, part in enumerate(items)
+        ]
+
+        path = join_quantities(self.graph.items, path)
+        return path, best_priority
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85)
+    ]
+
+    capacity = 15
+
+    solver = StreamingSolver(Graph(items, capacity))
+    solution, total_priority = solver.solve()
+
+    print("\n===== Streaming (nivel a nivel) =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPrioridad total: {total_priority}")
+    print(f"Frontera máxima: {solver.peak_frontier} nodos")
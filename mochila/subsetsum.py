@@ -0,0 +1,175 @@
+# =======================================================
+#   SUBSET-SUM CON BITSETS (pesos alcanzables, shift-or)
+# =======================================================
+#
+# El bit w de un entero de Python indica si algún subconjunto
+# pesa exactamente w. Añadir un objeto de peso p es un solo
+# desplazamiento y un OR sobre C+1 bits:
+#
+#   reachable |= reachable << p
+#
+# CPython lo hace por palabras de 30-64 bits, así que cada objeto
+# cuesta O(C/64) operaciones en vez de un nodo por estado.
+
+import math
+
+from .grafo import (
+    Item, NotApplicable, split_quantities, join_quantities, require_single_resource,
+)
+
+
+# =======================================================
+#                Solver de subset-sum
+# =======================================================
+
+class SubsetSumSolver:
+    def __init__(self, items, capacity):
+        require_single_resource(items, capacity)
+
+        for item in items:
+            if item.weight < 0 or int(item.weight) != item.weight:
+                raise ValueError(f"peso no entero o negativo: {item!r}")
+
+        self.items = items
+        self.capacity = int(capacity)
+
+        self.parts = split_quantities(items, self.capacity)
+
+        # para los testigos se guarda la fila de pesos alcanzables
+        # cada stride partes (√n filas de C+1 bits en vez de n) y
+        # el resto se recalcula por bloques al reconstruir
+        self.stride = max(1, math.isqrt(len(self.parts)))
+        self.checkpoints = None
+        self.reachable_set = None
+
+    def _add(self, reachable, item, mask):
+        w = int(item.weight)
+        if w > self.capacity:
+            return reachable
+        return reachable | ((reachable << w) & mask)
+
+    def build(self):
+        mask = (1 << (self.capacity + 1)) - 1
+        reachable = 1   # peso 0: subconjunto vacío
+        checkpoints = []
+
+        for i, item in enumerate(self.parts):
+            if i % self.stride == 0:
+                checkpoints.append(reachable)
+            reachable = self._add(reachable, item, mask)
+
+        self.checkpoints = checkpoints
+        self.reachable_set = reachable
+        return reachable
+
+    def _block_rows(self, start, end):
+        # filas antes de cada parte start..end-1, desde su checkpoint
+        mask = (1 << (self.capacity + 1)) - 1
+        row = self.checkpoints[start // self.stride]
+        rows = []
+
+        for i in range(start, end):
+            rows.append(row)
+            row = self._add(row, self.parts[i], mask)
+
+        return rows
+
+    # -------------------------------------------------------
+    # Consultas de factibilidad
+    # -------------------------------------------------------
+    def reachable(self, weight):
+        if self.reachable_set is None:
+            self.build()
+        return 0 <= weight <= self.capacity and bool(self.reachable_set >> weight & 1)
+
+    def weights(self):
+        if self.reachable_set is None:
+            self.build()
+
+        # bits de menor a mayor: bin() invertido
+        bits = bin(self.reachable_set)[:1:-1]
+        return [w for w, bit in enumerate(bits) if bit == "1"]
+
+    def best(self, capacity=None):
+        # mayor peso alcanzable <= capacity
+        if self.reachable_set is None:
+            self.build()
+        if capacity is None:
+            capacity = self.capacity
+
+        capacity = min(capacity, self.capacity)
+        if capacity < 0:
+            return None
+        return (self.reachable_set & ((1 << (capacity + 1)) - 1)).bit_length() - 1
+
+    # -------------------------------------------------------
+    # Testigo: recorrer las filas al revés; si el peso ya era
+    # alcanzable sin la parte i, se salta, si no se toma
+    # -------------------------------------------------------
+    def witness(self, weight):
+        if not self.reachable(weight):
+            return None
+
+        path = []
+        target = weight
+        n = len(self.parts)
+
+        for start in reversed(range(0, n, self.stride)):
+            end = min(start + self.stride, n)
+            rows = self._block_rows(start, end)
+
+            for i in range(end - 1, start - 1, -1):
+                item = self.parts[i]
+
+                if rows[i - start] >> target & 1:
+                    path.append(("skip", item))
+                else:
+                    path.append(("take", item))
+                    target -= int(item.weight)
+
+        path.reverse()
+
+        path = join_quantities(self.items, path)
+        return path
+
+    def solve(self):
+        # mochila con prioridad == peso: el óptimo es el mayor peso alcanzable
+        for item in self.items:
+            if item.priority != item.weight:
+                raise NotApplicable(f"subset-sum necesita priority == weight: {item!r}")
+
+        weight = self.best()
+        return self.witness(weight), weight
+
+
+# =======================================================
+#                     PRUEBA FINAL
+# =======================================================
+
+if __name__ == "__main__":
+    items = [
+        Item("Sable de luz", 5, 5),
+        Item("Holoproyector", 2, 2),
+        Item("Bláster DL-44", 4, 4),
+        Item("Herramientas de reparación", 3, 3),
+        Item("Mini-dron de reconocimiento", 6, 6)
+    ]
+
+    capacity = 15
+
+    solver = SubsetSumSolver(items, capacity)
+    solution, total_weight = solver.solve()
+
+    print("\n===== Subset-sum con bitsets =====\n")
+
+    for action, item in solution:
+        print(f"{'Tomar' if action == 'take' else 'Saltar'} → {item}")
+
+    print(f"\nPeso total: {total_weight}")
+    print(f"Pesos alcanzables: {solver.weights()}")
+
+    # ¿se puede llenar exactamente la capacidad 1?
+    print(f"¿Peso 1 alcanzable?: {solver.reachable(1)}")
+
+    taken = [item.name for action, item in solver.witness(12) if action == "take"]
+    print(f"Testigo para peso 12: {taken}")
@@ -0,0 +1,77 @@
+# =======================================================
+#   FUERZA BRUTA COMPARTIDA POR LAS PRUEBAS DE MOTORES
+# =======================================================
+#
+#   from fuerza_bruta import QUANTITIES, check_engine, optimum, ...
+
+import itertools
+import random
+
+import pytest
+
+from mochila import Item, UNBOUNDED
+from mochila.grafo import path_counts
+
+
+# -------------------------------------------------------
+# Fuerza bruta: todas las combinaciones de unidades
+# -------------------------------------------------------
+
+def solutions(items, capacity):
+    # {unidades de cada objeto: prioridad} de las que caben
+    result = {}
+
+    for counts in itertools.product(*(range(item.units(capacity) + 1) for item in items)):
+        if sum(c * item.weight for c, item in zip(counts, items)) <= capacity:
+            result[counts] = sum(c * item.priority for c, item in zip(counts, items))
+
+    return result
+
+
+def optimum(items, capacity):
+    return max(solutions(items, capacity).values())
+
+
+def instance(seed, quantities=False):
+    # pesos 0 incluidos; con quantities, stock 0, varios o sin límite
+    rng = random.Random(seed)
+    items = []
+
+    for i in range(rng.randint(0, 6)):
+        weight = rng.randint(0, 8)
+        quantity = rng.choice((1, 1, 0, 2, 3, 5, UNBOUNDED)) if quantities else 1
+
+        # sin peso y sin límite no tiene óptimo
+        if weight == 0 and quantity == UNBOUNDED:
+            weight = 1
+
+        items.append(Item(f"obj-{i}", weight, rng.randint(0, 20), quantity=quantity))
+
+    return items, rng.randint(0, 20)
+
+
+def check_path(items, capacity, path, priority):
+    # el camino recorre los objetos en orden y su valor es el devuelto
+    counts = path_counts(items, path)
+
+    assert all(c <= item.quantity for c, item in zip(counts, items))
+    assert sum(c * item.weight for c, item in zip(counts, items)) <= capacity
+    assert sum(c * item.priority for c, item in zip(counts, items)) == priority
+
+
+# -------------------------------------------------------
+# Un motor (items, capacity) -> (path, priority) contra el
+# óptimo en 60 instancias, con objetos 0/1 o con cantidades
+# -------------------------------------------------------
+
+QUANTITIES = pytest.mark.parametrize("quantities", [False, True], ids=["0/1", "cantidades"])
+
+
+def check_engine(solve, quantities, seeds=range(60)):
+    for seed in seeds:
+        items, capacity = instance(seed, quantities)
+
+        path, priority = solve(items, capacity)
+
+        assert priority == optimum(items, capacity), (seed, items, capacity)
+        check_path(items, capacity, path, priority)
@@ -0,0 +1,97 @@
+# =======================================================
+#   BRANCH AND BOUND CONTRA FUERZA BRUTA
+# =======================================================
+
+import pytest
+
+from fuerza_bruta import QUANTITIES, solutions, instance, check_engine, check_path
+
+from mochila import Graph
+from mochila.grafo import path_counts
+from mochila.bb import BranchAndBoundSolver, greedy_value
+from mochila.subsetsum import SubsetSumSolver
+
+
+@QUANTITIES
+@pytest.mark.parametrize("order", ["best", "depth"])
+def test_bb_matches_brute_force(order, quantities):
+    check_engine(
+        lambda items, capacity: BranchAndBoundSolver(Graph(items, capacity), order).solve(),
+        quantities
+    )
+
+
+@QUANTITIES
+def test_bb_deadline_matches_brute_force(quantities):
+    # plazo holgado: en instancias pequeñas la búsqueda termina
+    check_engine(
+        lambda items, capacity: BranchAndBoundSolver(Graph(items, capacity)).solve(deadline=5),
+        quantities
+    )
+
+
+# -------------------------------------------------------
+# Branch and bound en subset-sum: todas las cotas empatan
+# y sin desempate por profundidad la búsqueda iba por niveles
+# -------------------------------------------------------
+
+@pytest.mark.parametrize("n", [24, 40])
+def test_bb_dives_on_equal_bounds(n):
+    from mochila.bench import generate
+
+    items, capacity = generate("subset-sum", n, seed=0)
+
+    solver = BranchAndBoundSolver(Graph(items, capacity))
+    path, priority = solver.solve()
+
+    assert priority == SubsetSumSolver(items, capacity).solve()[1]
+    assert solver.explored < 10_000
+    check_path(items, capacity, path, priority)
+
+
+# -------------------------------------------------------
+# Top-k: las k mejores prioridades, sin soluciones repetidas
+# -------------------------------------------------------
+
+@QUANTITIES
+def test_top_k_matches_brute_force(quantities):
+    for seed in range(60):
+        items, capacity = instance(seed, quantities)
+
+        top = BranchAndBoundSolver(Graph(items, capacity)).solve_top_k(5)
+        expected = sorted(solutions(items, capacity).values(), reverse=True)[:5]
+
+        assert [priority for _, priority in top] == expected
+        assert len({tuple(path_counts(items, path)) for path, _ in top}) == len(top)
+
+        for path, priority in top:
+            check_path(items, capacity, path, priority)
+
+
+# -------------------------------------------------------
+# Modo anytime: instancias Pisinger difíciles cortadas por
+# plazo o por nodos; la incumbente es factible, no peor que
+# la voraz, y la cota superior no baja del óptimo
+# -------------------------------------------------------
+
+@pytest.mark.parametrize("limit", [{"deadline": 1e-4}, {"max_nodes": 50}], ids=["deadline", "max_nodes"])
+@pytest.mark.parametrize("kind", ["strongly", "inverse"])
+def test_anytime_cut_off_bounds_the_optimum(kind, limit):
+    pytest.importorskip("numpy")
+    from mochila.bench import generate
+    from mochila.dp import NumpyDPSolver
+
+    items, capacity = generate(kind, 200, seed=0)
+    best = NumpyDPSolver(items, capacity).solve()[1]
+
+    solver = BranchAndBoundSolver(Graph(items, capacity))
+    path, priority = solver.solve(**limit)
+
+    # cortada antes de probar el óptimo
+    assert solver.gap > 0
+    assert "max_nodes" not in limit or solver.explored <= limit["max_nodes"]
+
+    check_path(items, capacity, path, priority)
+    assert greedy_value(items, capacity) <= priority <= best
+    assert solver.upper_bound >= best
+    assert solver.gap == solver.upper_bound - priority
@@ -0,0 +1,33 @@
+# =======================================================
+#   BENCHMARK: VEREDICTO DE check() Y RECHAZOS EXPLÍCITOS
+# =======================================================
+
+import pytest
+
+from mochila import Item, NotApplicable
+from mochila.bench import check
+from mochila.subsetsum import SubsetSumSolver
+
+
+def test_infeasible_is_never_correct():
+    assert check(100, 100, None) is True
+    assert check(100, 100, None, feasible=False) is False
+    assert check(95, 100, None, epsilon=0.1, feasible=False) is False
+    assert check(100, None, 100, feasible=False) is False
+
+
+def test_float_priorities_within_tolerance():
+    assert check(0.1 + 0.2, 0.3, None) is True
+    assert check(0.31, 0.3, None) is False
+
+    # sin referencia: la cota de Dantzig solo certifica si se alcanza
+    assert check(0.1 + 0.2, None, 0.3) is True
+    assert check(0.2, None, 0.3) is None
+    assert check(0.4, None, 0.3) is False
+
+
+def test_engine_refusal_is_not_applicable():
+    solver = SubsetSumSolver([Item("a", 2, 3)], 5)
+
+    with pytest.raises(NotApplicable):
+        solver.solve()
@@ -0,0 +1,146 @@
+# =======================================================
+#   CACHÉ: ACIERTOS CON OBJETOS PERMUTADOS Y RENOMBRADOS,
+#   EXPULSIÓN LRU Y PERSISTENCIA EN SQLITE
+# =======================================================
+
+import random
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, UNBOUNDED
+from mochila.cache import SolutionCache, canonical_key, default_solver
+from mochila.grafo import path_counts
+
+
+def random_instance(rng):
+    items = []
+
+    for i in range(rng.randint(1, 7)):
+        quantity = rng.choice((1, 1, 0, 2, 3, UNBOUNDED))
+        weight = rng.randint(1 if quantity == UNBOUNDED else 0, 9)
+        items.append(Item(f"obj-{i}", weight, rng.randint(0, 30), quantity=quantity))
+
+    return items, rng.randint(0, 25)
+
+
+def equivalent(rng, items):
+    # mismos objetos con otros nombres y en otro orden
+    renamed = [
+        Item(f"caja-{i}", item.weight, item.priority, quantity=item.quantity)
+        for i, item in enumerate(items)
+    ]
+    rng.shuffle(renamed)
+    return renamed
+
+
+def counting_solver():
+    calls = []
+
+    def solver(items, capacity):
+        calls.append(capacity)
+        return default_solver(items, capacity)
+
+    return solver, calls
+
+
+def never_called(items, capacity):
+    raise AssertionError("la caché debía acertar")
+
+
+def check_path(items, capacity, path, priority):
+    counts = path_counts(items, path)
+
+    assert [item for action, item in path if action == "skip"] == [
+        item for item, c in zip(items, counts) if c == 0
+    ]
+    assert all(c <= item.quantity for c, item in zip(counts, items))
+    assert sum(c * item.weight for c, item in zip(counts, items)) <= capacity
+    assert sum(c * item.priority for c, item in zip(counts, items)) == priority
+
+
+def test_hit_remaps_to_permuted_renamed_items():
+    rng = random.Random(0)
+
+    for _ in range(40):
+        items, capacity = random_instance(rng)
+        solver, calls = counting_solver()
+        cache = SolutionCache(solver)
+
+        _, priority = cache.solve(items, capacity)
+
+        other = equivalent(rng, items)
+        path, hit_priority = cache.solve(other, capacity)
+
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert hit_priority == priority
+        check_path(other, capacity, path, hit_priority)
+
+
+def test_different_capacity_is_a_miss():
+    items = [Item("a", 3, 10), Item("b", 4, 12)]
+    cache = SolutionCache()
+
+    cache.solve(items, 7)
+    cache.solve(items, 6)
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_lru_evicts_least_recently_used():
+    a = ([Item("a", 1, 1)], 5)
+    b = ([Item("b", 2, 2)], 5)
+    c = ([Item("c", 3, 3)], 5)
+
+    solver, calls = counting_solver()
+    cache = SolutionCache(solver, maxsize=2)
+
+    cache.solve(*a)
+    cache.solve(*b)
+    cache.solve(*a)   # a pasa a ser el más reciente
+    cache.solve(*c)   # expulsa b
+
+    assert len(cache.memory) == 2
+    assert len(calls) == 3
+
+    cache.solve(*a)
+    assert len(calls) == 3
+
+    cache.solve(*b)
+    assert len(calls) == 4
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_sqlite_persists_between_caches(tmp_path):
+    path = tmp_path / "soluciones.db"
+    rng = random.Random(1)
+    instances = [random_instance(rng) for _ in range(10)]
+
+    first = SolutionCache(path=str(path))
+    expected = [first.solve(items, capacity)[1] for items, capacity in instances]
+    first.close()
+
+    # otra caché sobre el mismo fichero: todo sale del disco,
+    # con los objetos permutados y renombrados
+    second = SolutionCache(never_called, path=str(path))
+
+    for (items, capacity), priority in zip(instances, expected):
+        other = equivalent(rng, items)
+        path_, hit_priority = second.solve(other, capacity)
+
+        assert hit_priority == priority
+        check_path(other, capacity, path_, hit_priority)
+
+    keys = {canonical_key(items, capacity) for items, capacity in instances}
+    assert second.disk_hits == len(keys)
+    assert second.misses == 0
+
+    # la segunda vez ya está en memoria
+    second.solve(*instances[0])
+    assert second.hits == 1
+    second.close()
+
+
+@QUANTITIES
+def test_cache_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: SolutionCache().solve(items, capacity), quantities)
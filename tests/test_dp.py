@@ -0,0 +1,75 @@
+# =======================================================
+#   DP: FUERZA BRUTA Y CONSULTAS POR CAPACIDAD CONTRA
+#   RESOLVER DE CERO
+# =======================================================
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, UNBOUNDED
+from mochila.grafo import path_counts
+from mochila.dp import NumpyDPSolver
+
+
+def random_instance(rng):
+    items = []
+
+    for i in range(rng.randint(0, 8)):
+        quantity = rng.choice((1, 1, 1, 0, 2, 3, UNBOUNDED))
+        weight = rng.randint(1 if quantity == UNBOUNDED else 0, 9)
+        items.append(Item(f"obj-{i}", weight, rng.randint(0, 30), quantity=quantity))
+
+    return items, rng.randint(0, 40)
+
+
+@QUANTITIES
+def test_dp_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: NumpyDPSolver(items, capacity).solve(), quantities)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_every_capacity_matches_fresh_solve(seed):
+    items, capacity = random_instance(random.Random(seed))
+
+    solver = NumpyDPSolver(items, capacity)
+    values = solver.solve_all()
+
+    assert len(values) == capacity + 1
+
+    for c in sorted({0, capacity // 3, capacity // 2, capacity}):
+        path, priority = solver.solution(c)
+        fresh = NumpyDPSolver(items, c).solve()[1]
+
+        assert priority == fresh == values[c]
+
+        counts = path_counts(items, path)
+        assert all(n <= item.quantity for n, item in zip(counts, items))
+        assert sum(n * item.weight for n, item in zip(counts, items)) <= c
+        assert sum(n * item.priority for n, item in zip(counts, items)) == priority
+
+    # una sola tabla: solution() y solve() no la rehacen
+    assert solver.solve_all() is values
+    assert solver.solve() == solver.solution(capacity)
+
+
+def test_values_never_decrease_with_capacity():
+    items, capacity = random_instance(random.Random(7))
+
+    values = NumpyDPSolver(items, capacity).solve_all()
+
+    assert (np.diff(values) >= 0).all()
+
+
+def test_capacity_out_of_range():
+    solver = NumpyDPSolver([Item("a", 2, 5)], 10)
+
+    with pytest.raises(ValueError):
+        solver.solution(11)
+
+    with pytest.raises(ValueError):
+        solver.solution(-1)
@@ -0,0 +1,24 @@
+# =======================================================
+#   FPTAS: DENTRO DE (1 - ε) DEL ÓPTIMO DE FUERZA BRUTA
+# =======================================================
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from fuerza_bruta import optimum, instance, check_path
+
+from mochila.fptas import FPTASSolver
+
+
+def test_fptas_within_epsilon():
+    for seed in range(60):
+        items, capacity = instance(seed, quantities=True)
+        solver = FPTASSolver(items, capacity, epsilon=0.2)
+
+        path, priority = solver.solve()
+        best = optimum(items, capacity)
+
+        check_path(items, capacity, path, priority)
+        assert (1 - 0.2) * best <= priority <= best
+        assert solver.upper_bound >= best - 1e-9
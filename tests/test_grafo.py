@@ -0,0 +1,55 @@
+# =======================================================
+#   ÁRBOL Y DAG CONTRA FUERZA BRUTA (instancias pequeñas)
+# =======================================================
+#
+#   python -m pytest -q
+
+import pytest
+
+from fuerza_bruta import QUANTITIES, optimum, instance, check_path
+
+from mochila import Item, Graph, KnapsackSolver
+
+
+def solve_tree(items, capacity, merge=False):
+    graph = Graph(items, capacity)
+    graph.build(merge=merge)
+    return KnapsackSolver(graph).solve()
+
+
+ENGINES = {
+    "tree": solve_tree,
+    "dag": lambda items, capacity: solve_tree(items, capacity, merge=True),
+}
+
+
+@QUANTITIES
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_engine_matches_brute_force(engine, quantities):
+    for seed in range(60):
+        items, capacity = instance(seed, quantities)
+
+        path, priority = ENGINES[engine](items, capacity)
+
+        assert priority == optimum(items, capacity), (seed, items, capacity)
+        check_path(items, capacity, path, priority)
+
+
+# -------------------------------------------------------
+# DAG con cantidades grandes: un nodo por (nivel, peso), no
+# un hijo por unidad
+# -------------------------------------------------------
+
+def test_dag_large_quantity_node_count():
+    capacity = 10**4
+    items = [Item("a", 1, 3, quantity=10**4), Item("b", 2, 5, quantity=10)]
+
+    graph = Graph(items, capacity)
+    graph.build(merge=True)
+    path, priority = KnapsackSolver(graph).solve()
+
+    # raíz y todos los pesos 0..C en cada uno de los dos niveles
+    assert len(graph.nodes) == 1 + 2 * (capacity + 1)
+    assert priority == 3 * 10**4
+    check_path(items, capacity, path, priority)
+
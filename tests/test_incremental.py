@@ -0,0 +1,129 @@
+# =======================================================
+#   INCREMENTAL: OPERACIONES ALEATORIAS CONTRA RESOLVER
+#   DE CERO TRAS CADA PASO
+# =======================================================
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, UNBOUNDED
+from mochila.grafo import path_counts
+from mochila.dp import NumpyDPSolver
+from mochila.incremental import IncrementalSolver
+
+
+def random_item(rng, i):
+    quantity = rng.choice((1, 1, 1, 0, 2, 3, UNBOUNDED))
+    weight = rng.randint(1 if quantity == UNBOUNDED else 0, 9)
+    return Item(f"obj-{i}", weight, rng.randint(0, 30), quantity=quantity)
+
+
+def check_against_fresh_solve(solver, result):
+    path, priority = result
+    items, capacity = solver.items, solver.capacity
+
+    assert result == solver.solution()
+    assert priority == NumpyDPSolver(items, capacity).solve()[1]
+
+    counts = path_counts(items, path)
+    assert all(c <= item.quantity for c, item in zip(counts, items))
+    assert sum(c * item.weight for c, item in zip(counts, items)) <= capacity
+    assert sum(c * item.priority for c, item in zip(counts, items)) == priority
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_operations_match_fresh_solve(seed):
+    rng = random.Random(seed)
+    created = 0
+
+    items = [random_item(rng, created + i) for i in range(3)]
+    created += len(items)
+    solver = IncrementalSolver(items, rng.randint(0, 25))
+
+    assert solver.recomputed == 3
+
+    for _ in range(60):
+        operation = rng.choice(("add", "add-at", "remove", "update", "capacity"))
+        n = len(solver.items)
+
+        if operation == "add":
+            result = solver.add_item(random_item(rng, created))
+            created += 1
+            assert solver.recomputed == 1
+
+        elif operation == "add-at":
+            index = rng.randint(0, n)
+            new_item = random_item(rng, created)
+            created += 1
+
+            result = solver.add_item(new_item, index)
+            assert solver.items[index] is new_item
+            assert solver.recomputed == n + 1 - index
+
+        elif operation == "remove" and n:
+            index = rng.randrange(n)
+            old = solver.items[index]
+
+            result = solver.remove_item(old)
+            assert all(item is not old for item in solver.items)
+            assert solver.recomputed == n - 1 - index
+
+        elif operation == "update" and n:
+            index = rng.randrange(n)
+            new_item = random_item(rng, created)
+            created += 1
+
+            result = solver.update_item(solver.items[index], new_item)
+            assert solver.items[index] is new_item
+            assert solver.recomputed == n - index
+
+        else:
+            capacity = rng.randint(0, 25)
+            lower = capacity <= solver.capacity
+
+            result = solver.set_capacity(capacity)
+            assert solver.capacity == capacity
+            assert solver.recomputed == (0 if lower else n)
+
+        assert len(solver.rows) == len(solver.items) + 1
+        assert len(solver.units) == len(solver.items)
+        check_against_fresh_solve(solver, result)
+
+
+def test_units_kept_for_untouched_prefix():
+    items = [Item("a", 2, 3, quantity=5), Item("b", 3, 4), Item("c", 1, 1, quantity=UNBOUNDED)]
+    solver = IncrementalSolver(items, 12)
+    before = list(solver.units)
+
+    assert before[1] is None
+
+    # cambiar c deja intactas las unidades guardadas de a
+    solver.update_item(items[2], Item("c", 1, 2, quantity=UNBOUNDED))
+
+    assert solver.recomputed == 1
+    assert solver.units[0] is before[0]
+    assert solver.units[2] is not before[2]
+
+
+def test_unknown_item_and_bad_weight():
+    item = Item("a", 2, 5)
+    solver = IncrementalSolver([item], 10)
+
+    with pytest.raises(ValueError):
+        solver.remove_item(Item("a", 2, 5))
+
+    with pytest.raises(ValueError):
+        solver.add_item(Item("b", 1.5, 5))
+
+    with pytest.raises(ValueError):
+        solver.update_item(item, Item("c", 0, 5, quantity=UNBOUNDED))
+
+
+@QUANTITIES
+def test_incremental_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: IncrementalSolver(items, capacity).solution(), quantities)
@@ -0,0 +1,197 @@
+# =======================================================
+#   LOTES: LECTURA CSV/JSONL Y REANUDACIÓN TRAS UN CORTE
+# =======================================================
+
+import json
+import random
+
+import pytest
+
+from mochila import lote
+from mochila.lote import BatchRunner, read_instances
+
+
+def write_jsonl(path, count=11):
+    rng = random.Random(0)
+
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            items = [
+                {"name": f"obj-{j}", "weight": rng.randint(1, 9), "priority": rng.randint(1, 50)}
+                for j in range(rng.randint(1, 8))
+            ]
+            f.write(json.dumps({"id": f"i{i}", "capacity": rng.randint(0, 20), "items": items}) + "\n")
+
+        # un registro roto no para el lote
+        f.write('{"id": "roto", "capacity": 10}\n')
+
+
+def results(path):
+    with open(path, encoding="utf-8") as f:
+        return [
+            {k: v for k, v in json.loads(line).items() if k != "seconds"}
+            for line in f
+        ]
+
+
+def test_read_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    csv_path.write_text(
+        "id,capacity,name,weight,priority,quantity\n"
+        "a,15,Sable de luz,5,90,1\n"
+        "a,15,Holoproyector,2,40,3\n"
+        "b,4,Bláster DL-44,4,70,1\n",
+        encoding="utf-8"
+    )
+
+    instances = [(key, rows, capacity) for _, key, rows, capacity in read_instances(str(csv_path))]
+
+    assert instances == [
+        ("a", (("Sable de luz", 5, 90, 1), ("Holoproyector", 2, 40, 3)), 15),
+        ("b", (("Bláster DL-44", 4, 70, 1),), 4),
+    ]
+
+    jsonl_path = tmp_path / "in.jsonl"
+    write_jsonl(str(jsonl_path), count=2)
+
+    keys = [key for _, key, _, _ in read_instances(str(jsonl_path))]
+    assert keys == ["i0", "i1", "roto"]
+
+
+def test_malformed_csv_row_is_its_own_error(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    csv_path.write_bytes(
+        b"id,capacity,name,weight,priority\n"
+        b"a,15,Sable de luz,5,90\n"
+        b"a,15,Holoproyector,2\r40\n"
+        b"b,4,Bl\xc3\xa1ster DL-44,4,70\n"
+        b"c,4," + b"x" * 200_000 + b",1,1\n"
+        b"d,3,Droide,1,10\n"
+    )
+
+    records = list(read_instances(str(csv_path)))
+    keys = [key for _, key, _, _ in records]
+
+    # csv.Error: la fila mala cierra la instancia abierta y queda
+    # como registro erróneo propio, con su offset; el lote sigue
+    assert keys == ["a", None, "b", None, "d"]
+    assert isinstance(records[1][2], lote.InvalidRecord)
+    assert isinstance(records[3][2], lote.InvalidRecord)
+    assert records[0][2] == (("Sable de luz", 5, 90, 1),)
+    assert records[4][2] == (("Droide", 1, 10, 1),)
+
+    # el offset de cada registro es el final de su última fila
+    data = csv_path.read_bytes()
+    ends = [i + 1 for i, byte in enumerate(data) if byte == ord("\n")]
+    assert [offset for offset, _, _, _ in records] == ends[1:]
+
+    output = str(tmp_path / "out.csv.jsonl")
+    runner = BatchRunner(str(csv_path), output, engine="dag", max_workers=0)
+
+    assert runner.run() == 5
+    assert runner.errors == 2
+    assert [r["id"] for r in results(output)] == ["a", None, "b", None, "d"]
+
+
+def test_quoted_newline_stays_in_its_row(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    csv_path.write_bytes(
+        b"id,capacity,name,weight,priority\n"
+        b'a,15,"Sable\nde luz",5,90\n'
+        b'a,15,"Holo ""proyector""\r\nR2",2,40\n'
+        b"b,4,Droide,1,10\n"
+    )
+
+    records = list(read_instances(str(csv_path)))
+
+    assert [(key, rows) for _, key, rows, _ in records] == [
+        ("a", (("Sable\nde luz", 5, 90, 1), ('Holo "proyector"\r\nR2', 2, 40, 1))),
+        ("b", (("Droide", 1, 10, 1),)),
+    ]
+
+    # el offset cae al final de la fila entera, no dentro del campo
+    data = csv_path.read_bytes()
+    assert records[0][0] == data.index(b"b,4")
+    assert records[1][0] == len(data)
+
+    resumed = list(read_instances(str(csv_path), records[0][0]))
+    assert [key for _, key, _, _ in resumed] == ["b"]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_output_in_input_order(tmp_path, workers):
+    source = str(tmp_path / "in.jsonl")
+    output = str(tmp_path / "out.jsonl")
+    write_jsonl(source)
+
+    runner = BatchRunner(source, output, engine="dag", chunk_size=3, max_workers=workers)
+
+    assert runner.run() == 12
+    assert runner.errors == 1
+    assert [r["id"] for r in results(output)] == [f"i{i}" for i in range(11)] + ["roto"]
+
+
+def test_resume_after_crash(tmp_path, monkeypatch):
+    source = str(tmp_path / "in.jsonl")
+    write_jsonl(source)
+
+    reference = str(tmp_path / "ref.jsonl")
+    BatchRunner(source, reference, engine="dag", chunk_size=2, max_workers=0).run()
+
+    # el tercer bloque tira el proceso a mitad del lote
+    solve_chunk = lote._solve_chunk
+    calls = []
+
+    def crash(engine, chunk):
+        calls.append(chunk)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return solve_chunk(engine, chunk)
+
+    output = str(tmp_path / "out.jsonl")
+    monkeypatch.setattr(lote, "_solve_chunk", crash)
+
+    with pytest.raises(KeyboardInterrupt):
+        BatchRunner(source, output, engine="dag", chunk_size=2, max_workers=0).run()
+
+    # basura tras el último commit: --resume la descarta
+    with open(output, "ab") as f:
+        f.write(b'{"id": "a medio escribir"')
+
+    monkeypatch.setattr(lote, "_solve_chunk", solve_chunk)
+
+    runner = BatchRunner(source, output, engine="dag", chunk_size=2, max_workers=0)
+    assert runner.load_progress()["solved"] == 4
+
+    assert runner.run(resume=True) == 12
+    assert results(output) == results(reference)
+
+
+def test_resume_keeps_error_count(tmp_path, monkeypatch):
+    # dos registros rotos antes del corte y uno (el último) después
+    source = tmp_path / "in.jsonl"
+    write_jsonl(str(source), count=5)
+    source.write_text('{"id": "sin capacidad", "items": []}\n[1, 2]\n' + source.read_text(encoding="utf-8"), encoding="utf-8")
+
+    solve_chunk = lote._solve_chunk
+    calls = []
+
+    def crash(engine, chunk):
+        calls.append(chunk)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return solve_chunk(engine, chunk)
+
+    output = str(tmp_path / "out.jsonl")
+    monkeypatch.setattr(lote, "_solve_chunk", crash)
+
+    with pytest.raises(KeyboardInterrupt):
+        BatchRunner(str(source), output, engine="dag", chunk_size=2, max_workers=0).run()
+
+    monkeypatch.setattr(lote, "_solve_chunk", solve_chunk)
+
+    runner = BatchRunner(str(source), output, engine="dag", chunk_size=2, max_workers=0)
+    assert runner.load_progress()["errors"] == 2
+
+    assert runner.run(resume=True) == 8
+    assert runner.errors == 3
@@ -0,0 +1,16 @@
+# =======================================================
+#   MEET-IN-THE-MIDDLE: FUERZA BRUTA
+# =======================================================
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila.mitm import MeetInTheMiddleSolver
+
+
+@QUANTITIES
+def test_mitm_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: MeetInTheMiddleSolver(items, capacity).solve(), quantities)
@@ -0,0 +1,152 @@
+# =======================================================
+#   MULTIDIMENSIONAL CONTRA FUERZA BRUTA, Y LOS MOTORES DE
+#   UN SOLO RECURSO RECHAZANDO OTROS RECURSOS
+# =======================================================
+
+import itertools
+import random
+
+import pytest
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, Graph, KnapsackSolver
+from mochila.grafo import path_counts
+from mochila.bb import BranchAndBoundSolver
+from mochila.cache import SolutionCache
+from mochila.pareto import ParetoSolver
+from mochila.planner import Planner
+from mochila.stream import StreamingSolver
+
+
+@QUANTITIES
+def test_single_resource_matches_brute_force(quantities):
+    pytest.importorskip("numpy")
+    from mochila.multidim import MultiDimSolver
+
+    check_engine(
+        lambda items, capacity: MultiDimSolver(Graph(items, capacity)).solve(),
+        quantities
+    )
+
+
+# -------------------------------------------------------
+# Multidimensional: cada recurso contra su capacidad
+# -------------------------------------------------------
+
+def test_multidim_matches_brute_force():
+    pytest.importorskip("numpy")
+    from mochila.multidim import MultiDimSolver
+
+    rng = random.Random(0)
+
+    for _ in range(60):
+        items = [
+            Item(f"obj-{i}", rng.randint(0, 6), rng.randint(0, 20),
+                 costs=(rng.randint(0, 6), rng.randint(0, 6)),
+                 quantity=rng.choice((1, 1, 2, 3)))
+            for i in range(rng.randint(0, 5))
+        ]
+        capacity = tuple(rng.randint(0, 12) for _ in range(3))
+
+        best = 0
+        for counts in itertools.product(*(range(item.quantity + 1) for item in items)):
+            used = [
+                sum(c * item.resources()[d] for c, item in zip(counts, items))
+                for d in range(3)
+            ]
+            if all(u <= c for u, c in zip(used, capacity)):
+                best = max(best, sum(c * item.priority for c, item in zip(counts, items)))
+
+        path, priority = MultiDimSolver(Graph(items, capacity)).solve()
+        counts = path_counts(items, path)
+
+        assert priority == best
+        assert sum(c * item.priority for c, item in zip(counts, items)) == priority
+        for d in range(3):
+            assert sum(c * item.resources()[d] for c, item in zip(counts, items)) <= capacity[d]
+
+
+# -------------------------------------------------------
+# Tres recursos y objetos de sobra para que la cota poda:
+# todos los subconjuntos a la vez con NumPy, y n=100 sin
+# que la frontera explote
+# -------------------------------------------------------
+
+def random_three_resources(rng, n):
+    items = [
+        Item(f"obj-{i}", rng.randint(1, 100), rng.randint(1, 100),
+             costs=(rng.randint(1, 100), rng.randint(1, 100)))
+        for i in range(n)
+    ]
+    capacity = tuple(sum(item.resources()[d] for item in items) // 2 for d in range(3))
+    return items, capacity
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_three_resources_match_enumeration(seed):
+    np = pytest.importorskip("numpy")
+    from mochila.multidim import MultiDimSolver
+
+    items, capacity = random_three_resources(random.Random(seed), 14)
+
+    subsets = (np.arange(2 ** len(items))[:, None] >> np.arange(len(items))) & 1
+    used = subsets @ np.array([item.resources() for item in items])
+    value = subsets @ np.array([item.priority for item in items])
+    best = value[(used <= capacity).all(axis=1)].max()
+
+    path, priority = MultiDimSolver(Graph(items, capacity)).solve()
+    counts = path_counts(items, path)
+
+    assert priority == best
+    for d in range(3):
+        assert sum(c * item.resources()[d] for c, item in zip(counts, items)) <= capacity[d]
+
+
+def test_hundred_items_three_resources_stay_small():
+    pytest.importorskip("numpy")
+    from mochila.multidim import MultiDimSolver
+
+    items, capacity = random_three_resources(random.Random(0), 100)
+
+    solver = MultiDimSolver(Graph(items, capacity))
+    path, priority = solver.solve()
+    counts = path_counts(items, path)
+
+    # con u = 1 / C fijo se exploraban ~577 000 estados
+    assert solver.explored < 100_000
+    assert sum(c * item.priority for c, item in zip(counts, items)) == priority
+    for d in range(3):
+        assert sum(c * item.resources()[d] for c, item in zip(counts, items)) <= capacity[d]
+
+
+# -------------------------------------------------------
+# Solo MultiDimSolver mira los costs: el resto los rechaza
+# -------------------------------------------------------
+
+def solve_tree(items, capacity):
+    graph = Graph(items, capacity)
+    graph.build()
+    return KnapsackSolver(graph).solve()
+
+
+SINGLE_RESOURCE = {
+    "tree": solve_tree,
+    "bb": lambda items, capacity: BranchAndBoundSolver(Graph(items, capacity)).solve(),
+    "stream": lambda items, capacity: StreamingSolver(Graph(items, capacity)).solve(),
+    "pareto": lambda items, capacity: ParetoSolver(items, capacity).solve(),
+    "planner": lambda items, capacity: Planner(items, capacity).solve(),
+    "cache": lambda items, capacity: SolutionCache().solve(items, capacity),
+}
+
+
+@pytest.mark.parametrize("engine", sorted(SINGLE_RESOURCE))
+def test_single_resource_engines_reject_costs(engine):
+    with pytest.raises(ValueError):
+        SINGLE_RESOURCE[engine]([Item("a", 1, 5, costs=(100,)), Item("b", 1, 3)], 10)
+
+    with pytest.raises(ValueError):
+        SINGLE_RESOURCE[engine]([Item("a", 1, 5)], (10, 10))
+
+    with pytest.raises(TypeError):
+        SINGLE_RESOURCE[engine]([Item("a", 1, 5)], "15")
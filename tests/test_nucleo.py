@@ -0,0 +1,38 @@
+# =======================================================
+#   NÚCLEO: FUERZA BRUTA E INSTANCIAS PISINGER CONTRA LA DP
+# =======================================================
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from fuerza_bruta import QUANTITIES, check_engine, check_path
+
+from mochila.bench import KINDS, generate
+from mochila.dp import NumpyDPSolver
+from mochila.nucleo import CoreSolver
+
+
+@QUANTITIES
+def test_core_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: CoreSolver(items, capacity).solve(), quantities)
+
+
+# -------------------------------------------------------
+# Instancias Pisinger de unos cientos de objetos, donde la
+# reducción y la expansión del núcleo sí trabajan (con
+# core_size=2 el núcleo se duplica varias veces)
+# -------------------------------------------------------
+
+@pytest.mark.parametrize("core_size", [2, 64])
+def test_core_matches_dp_on_pisinger_instances(core_size):
+    for kind in KINDS:
+        for seed in range(2):
+            items, capacity = generate(kind, 300, R=100, seed=seed)
+
+            solver = CoreSolver(items, capacity, core_size=core_size)
+            path, priority = solver.solve()
+
+            assert priority == NumpyDPSolver(items, capacity).solve()[1], (kind, seed)
+            assert core_size > 2 or len(solver.core_sizes) > 1
+            check_path(items, capacity, path, priority)
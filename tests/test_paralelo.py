@@ -0,0 +1,38 @@
+# =======================================================
+#   PARALELO: FUERZA BRUTA Y NODOS DEL ÁRBOL COMPLETO
+# =======================================================
+
+import pytest
+
+from fuerza_bruta import check_engine
+
+from mochila import Item, Graph
+from mochila.paralelo import ParallelSolver
+
+
+def test_parallel_matches_brute_force():
+    # pocas semillas: cada una arranca un pool de procesos
+    check_engine(
+        lambda items, capacity: ParallelSolver(Graph(items, capacity), max_workers=2).solve(),
+        quantities=True, seeds=range(4)
+    )
+
+
+@pytest.mark.parametrize("split_depth", [0, 2, 5])
+def test_parallel_node_count_matches_tree(split_depth):
+    items = [
+        Item("Sable de luz", 5, 90),
+        Item("Holoproyector", 2, 40),
+        Item("Bláster DL-44", 4, 70),
+        Item("Herramientas de reparación", 3, 50),
+        Item("Mini-dron de reconocimiento", 6, 85),
+    ]
+    graph = Graph(items, 15)
+    graph.build()
+
+    # prefijos en el padre + subárboles en los procesos: el árbol entero
+    solver = ParallelSolver(Graph(items, 15), split_depth=split_depth, max_workers=2)
+    _, priority = solver.solve()
+
+    assert priority == 250
+    assert solver.node_count == len(graph.nodes) == 59
@@ -0,0 +1,85 @@
+# =======================================================
+#   PARETO: FRONTERA Y CAMINOS CONTRA LA DP
+# =======================================================
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, UNBOUNDED
+from mochila.grafo import path_counts
+from mochila.dp import NumpyDPSolver
+from mochila.pareto import ParetoSolver
+
+
+def random_instance(rng, unbounded=True):
+    items = []
+
+    for i in range(rng.randint(0, 7)):
+        quantity = rng.choice((1, 1, 1, 0, 2, 3) + ((UNBOUNDED,) if unbounded else ()))
+        weight = rng.randint(1 if quantity == UNBOUNDED else 0, 9)
+        items.append(Item(f"obj-{i}", weight, rng.randint(0, 30), quantity=quantity))
+
+    return items, rng.randint(0, 30)
+
+
+def totals(items, path):
+    counts = path_counts(items, path)
+
+    assert all(c <= item.quantity for c, item in zip(counts, items))
+    return (
+        sum(c * item.weight for c, item in zip(counts, items)),
+        sum(c * item.priority for c, item in zip(counts, items)),
+    )
+
+
+def check_frontier(solver, items, capacity):
+    frontier = solver.frontier()
+    weights = [w for w, _ in frontier]
+    priorities = [p for _, p in frontier]
+
+    # pesos y prioridades estrictamente crecientes (sin dominados)
+    assert weights == sorted(set(weights))
+    assert priorities == sorted(set(priorities))
+    assert capacity is None or weights[-1] <= capacity
+
+    dp = NumpyDPSolver(items, weights[-1] if capacity is None else capacity)
+    values = dp.solve_all()
+
+    for k, (weight, priority) in enumerate(frontier):
+        # el camino del punto k pesa y rinde exactamente lo del punto
+        assert totals(items, solver.path(k)) == (weight, priority)
+
+        # y es el óptimo de la DP con capacidad weight, que no se
+        # alcanza con menos peso
+        assert totals(items, dp.solution(weight)[0])[1] == priority == values[weight]
+        assert weight == 0 or values[weight - 1] < priority
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_frontier_paths_match_dp(seed):
+    items, capacity = random_instance(random.Random(seed))
+
+    solver = ParetoSolver(items, capacity)
+    path, priority = solver.solve()
+
+    assert priority == NumpyDPSolver(items, capacity).solve()[1]
+    check_frontier(solver, items, capacity)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_unlimited_frontier_matches_dp(seed):
+    items, _ = random_instance(random.Random(seed), unbounded=False)
+
+    solver = ParetoSolver(items)
+
+    check_frontier(solver, items, None)
+
+
+@QUANTITIES
+def test_pareto_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: ParetoSolver(items, capacity).solve(), quantities)
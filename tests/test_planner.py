@@ -0,0 +1,103 @@
+# =======================================================
+#   PLANIFICADOR: ESTIMADOR DE KNUTH Y ELECCIÓN DEL MOTOR
+# =======================================================
+
+import pytest
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, Graph
+from mochila.bb import BranchAndBoundSolver
+from mochila.planner import (
+    PROBE_STEPS, Planner, estimate_tree_nodes, knuth_probes,
+)
+
+
+STAR_WARS = [
+    Item("Sable de luz", 5, 90),
+    Item("Holoproyector", 2, 40),
+    Item("Bláster DL-44", 4, 70),
+    Item("Herramientas de reparación", 3, 50),
+    Item("Mini-dron de reconocimiento", 6, 85),
+]
+
+
+# -------------------------------------------------------
+# Knuth: exacto cuando todos los descensos son iguales
+# -------------------------------------------------------
+
+def test_tree_estimate_is_exact_when_every_take_fits():
+    items = [Item(f"obj-{i}", 1, 1) for i in range(10)]
+
+    assert estimate_tree_nodes(items, 10) == 2 ** 11 - 1
+
+
+def test_tree_estimate_is_exact_when_no_take_fits():
+    items = [Item(f"obj-{i}", 5, 1) for i in range(10)]
+
+    assert estimate_tree_nodes(items, 4) == 11
+
+
+def test_bb_estimate_within_full_tree():
+    nodes = BranchAndBoundSolver(Graph(STAR_WARS, 15)).estimate_nodes()
+
+    assert 1 <= nodes <= 2 ** (len(STAR_WARS) + 1) - 1
+
+
+def test_probes_are_capped():
+    assert knuth_probes(0) == knuth_probes(10) == 64
+    assert knuth_probes(10**4) * 10**4 <= PROBE_STEPS
+    assert knuth_probes(10**7) == 1
+
+
+# -------------------------------------------------------
+# Elección: instancias claramente pequeñas, grandes y de
+# subset-sum
+# -------------------------------------------------------
+
+def choose(items, capacity):
+    planner = Planner(items, capacity)
+    return planner.plan().name
+
+
+def test_small_instance_uses_dp():
+    pytest.importorskip("numpy")
+
+    assert choose(STAR_WARS, 15) == "dp"
+
+
+def test_large_instance_uses_core():
+    pytest.importorskip("numpy")
+    from mochila.bench import generate
+
+    for kind in ("uncorrelated", "strongly", "inverse"):
+        items, capacity = generate(kind, 10**4, seed=0)
+        assert choose(items, capacity) == "core", kind
+
+
+def test_subset_sum_uses_bitset():
+    pytest.importorskip("numpy")
+    from mochila.bench import generate
+
+    items, capacity = generate("subset-sum", 50, seed=0)
+
+    assert choose(items, capacity) == "bitset"
+
+
+def test_bb_never_ahead_of_an_exact_dp():
+    pytest.importorskip("numpy")
+    from mochila.bench import KINDS, generate
+
+    for kind in KINDS:
+        planner = Planner(*generate(kind, 200, seed=0))
+        planner.plan()
+        names = [e.name for e in planner.ranking]
+
+        # bb puede quedar fuera del presupuesto de memoria
+        if "bb" in names:
+            assert names.index("bb") > names.index("dp"), kind
+
+
+@QUANTITIES
+def test_planner_matches_brute_force(quantities):
+    check_engine(lambda items, capacity: Planner(items, capacity).solve(), quantities)
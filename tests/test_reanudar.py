@@ -0,0 +1,87 @@
+# =======================================================
+#   PUNTOS DE CONTROL: GUARDAR, CARGAR Y REANUDAR
+# =======================================================
+
+import pytest
+
+from mochila import Item, Graph, KnapsackSolver, UNBOUNDED
+from mochila.reanudar import ResumableSolver
+
+
+ITEMS = [
+    Item("Sable de luz", 5, 90),
+    Item("Holoproyector", 2, 40, quantity=3),
+    Item("Bláster DL-44", 4, 70, quantity=UNBOUNDED),
+    Item("Herramientas de reparación", 0, 50, quantity=2),
+    Item("Mini-dron de reconocimiento", 6, 85)
+]
+
+CAPACITY = 15
+
+
+def full_tree():
+    graph = Graph(ITEMS, CAPACITY)
+    graph.build()
+    return graph, KnapsackSolver(graph).solve()
+
+
+def test_uninterrupted_matches_graph_build(tmp_path):
+    graph, (path, priority) = full_tree()
+    solver = ResumableSolver(Graph(ITEMS, CAPACITY), str(tmp_path / "ckpt"))
+
+    assert solver.solve() == (path, priority)
+    assert solver.nodes + 1 == len(graph.nodes)
+
+
+def test_save_load_round_trip(tmp_path):
+    checkpoint = str(tmp_path / "ckpt")
+
+    solver = ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint)
+    solver.stop_requested = True
+    assert solver.solve() is None
+
+    loaded = ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint)
+    loaded.load()
+
+    assert loaded.counts == solver.counts
+    assert loaded.best == solver.best
+    assert loaded.best_priority == solver.best_priority
+    assert (loaded.nodes, loaded.leaves, loaded.done) == (solver.nodes, solver.leaves, False)
+
+
+def test_resume_after_every_leaf(tmp_path):
+    # cortar tras cada hoja y reanudar hasta terminar: mismo
+    # óptimo y mismos nodos que una ejecución sin cortes
+    checkpoint = str(tmp_path / "ckpt")
+    graph, (path, priority) = full_tree()
+
+    runs = 0
+    result = None
+
+    while result is None:
+        solver = ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint)
+        solver.stop_requested = True
+        result = solver.solve(resume=runs > 0)
+        runs += 1
+
+    assert runs > 1
+    assert result[1] == priority
+    assert solver.nodes + 1 == len(graph.nodes)
+
+    # terminado: reanudar devuelve el resultado guardado
+    again = ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint)
+    assert again.solve(resume=True) == result
+
+
+def test_checkpoint_of_another_instance(tmp_path):
+    checkpoint = str(tmp_path / "ckpt")
+    ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint).solve()
+
+    with pytest.raises(ValueError):
+        ResumableSolver(Graph(ITEMS, CAPACITY + 1), checkpoint).load()
+
+    with open(checkpoint, "r+b") as f:
+        f.write(b"XXXXXXXX")
+
+    with pytest.raises(ValueError):
+        ResumableSolver(Graph(ITEMS, CAPACITY), checkpoint).load()
@@ -0,0 +1,215 @@
+# =======================================================
+#   SERVICIO: AGRUPAR PETICIONES, DEADLINES Y ERRORES
+#   (max_workers=0: los cálculos van a hilos del bucle)
+# =======================================================
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mochila import servicio
+from mochila.servicio import SolveService
+
+
+ITEMS = [
+    {"name": "Sable de luz", "weight": 5, "priority": 90},
+    {"name": "Holoproyector", "weight": 2, "priority": 40, "quantity": 3},
+    {"name": "Bláster DL-44", "weight": 4, "priority": 70},
+    {"name": "Mini-dron de reconocimiento", "weight": 6, "priority": 85},
+]
+
+CAPACITY = 15
+
+# óptimo: sable + 3 holoproyectores + bláster (peso 15)
+BEST = 280
+
+
+def renamed(items, seed):
+    # la misma instancia con otros nombres y en otro orden
+    shift = seed % len(items)
+    return [dict(o, name=f"{o['name']} #{seed}") for o in items[shift:] + items[:shift]]
+
+
+async def exchange(service, lines):
+    # envía las líneas por una conexión TCP y lee las respuestas
+    # hasta que el servicio cierra
+    server = await service.serve(port=0)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"".join(lines))
+        writer.write_eof()
+
+        responses = [json.loads(line) async for line in reader]
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    return responses
+
+
+def test_coalescing_renamed_and_reordered_copies():
+    service = SolveService(max_workers=0)
+    requests = [
+        {"id": i, "capacity": CAPACITY, "items": renamed(ITEMS, i)}
+        for i in range(5)
+    ]
+
+    async def run():
+        return await asyncio.gather(*(service.solve(r) for r in requests))
+
+    responses = asyncio.run(run())
+
+    assert service.computed == 1
+    assert service.coalesced == 4
+    assert service.inflight == {}
+    assert [r["coalesced"] for r in responses] == [False, True, True, True, True]
+
+    for request, response in zip(requests, responses):
+        by_name = {o["name"]: o for o in request["items"]}
+
+        assert response["id"] == request["id"]
+        assert response["priority"] == BEST
+        assert sum(by_name[name]["priority"] for name in response["taken"]) == BEST
+        assert sum(by_name[name]["weight"] for name in response["taken"]) <= CAPACITY
+
+
+def test_deadline_reply(monkeypatch):
+    solve_canonical = servicio._solve_canonical
+
+    def slow(engine, rows, capacity, limit=None):
+        time.sleep(0.3)
+        return solve_canonical(engine, rows, capacity, limit)
+
+    monkeypatch.setattr(servicio, "_solve_canonical", slow)
+    service = SolveService(max_workers=0, deadline=0.02)
+
+    async def run():
+        return await asyncio.gather(
+            service.solve({"id": "corta", "capacity": CAPACITY, "items": ITEMS}),
+            service.solve({"id": "larga", "capacity": CAPACITY, "items": ITEMS, "deadline": 5}),
+        )
+
+    short, long = asyncio.run(run())
+
+    assert short == {"id": "corta", "error": "deadline"}
+    assert long["priority"] == BEST
+    assert service.expired == 1
+
+
+def test_error_replies_and_oversized_lines():
+    service = SolveService(max_workers=0, line_limit=300)
+
+    def line(request):
+        return (json.dumps(request) + "\n").encode("utf-8")
+
+    lines = [
+        b"esto no es JSON\n",
+        b"[1, 2, 3]\n",
+        line({"id": "sin-objetos", "capacity": CAPACITY}),
+        line({"id": "negativo", "capacity": CAPACITY, "items": ITEMS[:1], "deadline": -1}),
+        line({"id": "bool", "capacity": CAPACITY, "items": ITEMS[:1], "deadline": True}),
+        line({"id": "texto", "capacity": CAPACITY, "items": ITEMS[:1], "deadline": "1"}),
+        line({"id": "peso", "capacity": CAPACITY, "items": [["a", "5", 1], ["b", 2, 1]]}),
+        line({"id": "capacidad", "capacity": "15", "items": ITEMS[:1]}),
+        line({"id": "enorme", "capacity": CAPACITY, "items": ITEMS * 10}),
+        line({"id": "bien", "capacity": CAPACITY, "items": ITEMS[:2]}),
+    ]
+
+    responses = asyncio.run(exchange(service, lines))
+    by_id = {r["id"]: r for r in responses if r["id"] is not None}
+    anonymous = [r["error"] for r in responses if r["id"] is None]
+
+    assert len(responses) == len(lines)
+    assert len(anonymous) == 3
+    assert any(error.startswith("JSONDecodeError") for error in anonymous)
+    assert "la petición debe ser un objeto JSON" in anonymous
+    assert any(error.startswith("línea de más de 300 bytes") for error in anonymous)
+
+    assert by_id["sin-objetos"]["error"].startswith("KeyError")
+    for key in ("negativo", "bool", "texto"):
+        assert by_id[key]["error"].startswith("ValueError: deadline no válido")
+
+    # tipos no numéricos: error con el id, antes de ordenar objetos
+    assert by_id["peso"]["error"] == "TypeError: weight no numérico: '5'"
+    assert by_id["capacidad"]["error"] == "TypeError: capacity no numérico: '15'"
+
+    # la línea descartada no se lleva por delante las siguientes
+    assert by_id["bien"]["priority"] == 210
+    assert service.errors == 9
+
+
+def test_pending_requests_per_connection_are_capped(monkeypatch):
+    solve_canonical = servicio._solve_canonical
+    running = []
+    peak = []
+
+    def slow(engine, rows, capacity, limit=None):
+        running.append(capacity)
+        peak.append(len(running))
+        time.sleep(0.05)
+        running.remove(capacity)
+        return solve_canonical(engine, rows, capacity, limit)
+
+    monkeypatch.setattr(servicio, "_solve_canonical", slow)
+    service = SolveService(max_workers=0, max_pending=2)
+
+    # capacidades distintas: nada se agrupa
+    lines = [
+        (json.dumps({"id": c, "capacity": c, "items": ITEMS}) + "\n").encode("utf-8")
+        for c in range(8)
+    ]
+
+    responses = asyncio.run(exchange(service, lines))
+
+    assert sorted(r["id"] for r in responses) == list(range(8))
+    assert service.computed == 8
+    assert max(peak) == 2
+
+
+def test_replaced_computation_is_cancelled(monkeypatch):
+    solve_canonical = servicio._solve_canonical
+    calls = []
+
+    def slow(engine, rows, capacity, limit=None):
+        calls.append(limit)
+        time.sleep(0.2)
+        return solve_canonical(engine, rows, capacity, limit)
+
+    monkeypatch.setattr(servicio, "_solve_canonical", slow)
+    service = SolveService(max_workers=0)
+
+    async def run():
+        # un solo hilo: el segundo cálculo espera en la cola
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+
+        def request(key, deadline):
+            return asyncio.create_task(service.solve(
+                {"id": key, "capacity": CAPACITY, "items": ITEMS, "deadline": deadline}
+            ))
+
+        # cada petición espera más que el cálculo en vuelo y lo
+        # sustituye; "media" nunca llega a empezar
+        corta = request("corta", 0.05)
+        await asyncio.sleep(0.01)
+        media = request("media", 0.1)
+        await asyncio.sleep(0.01)
+        larga = request("larga", 5)
+        await asyncio.sleep(0.01)
+        igual = request("igual", 2)
+
+        return await asyncio.gather(corta, media, larga, igual)
+
+    corta, media, larga, igual = asyncio.run(run())
+
+    assert corta["error"] == media["error"] == "deadline"
+    assert larga["priority"] == igual["priority"] == BEST
+    assert igual["coalesced"]
+
+    assert service.computed == 3
+    assert calls == [0.05, 5]
+    assert service.inflight == {}
@@ -0,0 +1,87 @@
+# =======================================================
+#   GRAFO COMPACTO: FUERZA BRUTA, MISMOS NODOS QUE Graph
+#   Y BYTES EXACTOS
+# =======================================================
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Item, Graph, KnapsackSolver
+from mochila.soa import CompactGraph
+
+
+STAR_WARS = [
+    Item("Sable de luz", 5, 90),
+    Item("Holoproyector", 2, 40),
+    Item("Bláster DL-44", 4, 70),
+    Item("Herramientas de reparación", 3, 50),
+    Item("Mini-dron de reconocimiento", 6, 85),
+]
+
+
+def solve_compact(items, capacity):
+    graph = CompactGraph(items, capacity)
+    graph.build()
+    return KnapsackSolver(graph).solve()
+
+
+@QUANTITIES
+def test_compact_matches_brute_force(quantities):
+    check_engine(solve_compact, quantities)
+
+
+def build_both(items, capacity):
+    graph = Graph(items, capacity)
+    graph.build()
+
+    compact = CompactGraph(items, capacity)
+    compact.build()
+
+    return graph, compact
+
+
+def test_same_nodes_as_graph():
+    items = STAR_WARS + [Item("Droide", 1, 10, quantity=3)]
+
+    graph, compact = build_both(items, 15)
+
+    assert len(compact.nodes) == len(graph.nodes)
+
+    # mismo orden BFS: mismo nodo, padre, acción y unidades
+    ids = {node: i for i, node in enumerate(graph.nodes)}
+
+    for i, (node, view) in enumerate(zip(graph.nodes, compact.nodes)):
+        assert (view.index, view.weight, view.priority) == (node.index, node.weight, node.priority)
+        assert view.action == node.action
+        assert view.count == node.count
+
+        if node.parent is None:
+            assert view.parent is None
+        else:
+            assert compact.parent[i] == ids[node.parent]
+
+        assert list(compact.children(i)) == [ids[e.next_node] for e in node.edges]
+
+
+def test_nbytes_star_wars():
+    _, compact = build_both(STAR_WARS, 15)
+
+    # 59 nodos × (índice 2 + peso 8 + prioridad 8 + padre 8) y
+    # un bit de acción por nodo (8 bytes para 59 bits)
+    assert len(compact.nodes) == 59
+    assert compact.counts is None
+    assert compact.nbytes() == 59 * 26 + 8
+
+
+def test_nbytes_with_quantities_and_floats():
+    items = [Item("a", 2, 3.5, quantity=2), Item("b", 1, 1)]
+
+    compact = CompactGraph(items, 4)
+    compact.build()
+
+    # raíz, 3 hijos de a (0, 1, 2 unidades) y 2 hijos de cada
+    # uno salvo el de 2 unidades, donde b ya no cabe
+    assert len(compact.nodes) == 9
+    assert compact.weight.typecode == compact.priority.typecode == "d"
+
+    # + 8 bytes de unidades por nodo; 9 bits de acción = 2 bytes
+    assert compact.nbytes() == 9 * (26 + 8) + 2
@@ -0,0 +1,100 @@
+# =======================================================
+#   ESTADÍSTICAS: CONTADORES DE BUILD Y SOLVE EN LA
+#   INSTANCIA DE STAR WARS
+# =======================================================
+
+import json
+
+from mochila import Item, Graph, KnapsackSolver, Stats
+
+
+STAR_WARS = [
+    Item("Sable de luz", 5, 90),
+    Item("Holoproyector", 2, 40),
+    Item("Bláster DL-44", 4, 70),
+    Item("Herramientas de reparación", 3, 50),
+    Item("Mini-dron de reconocimiento", 6, 85),
+]
+
+
+def build_and_solve(items, capacity, merge):
+    graph = Graph(items, capacity)
+    stats = Stats()
+
+    graph.build(merge=merge, stats=stats)
+    _, priority = KnapsackSolver(graph).solve(stats=stats)
+
+    return graph, stats, priority
+
+
+def per_level(stats, key):
+    return [level[key] for level in stats.levels]
+
+
+def test_tree_counters():
+    graph, stats, priority = build_and_solve(STAR_WARS, 15, merge=False)
+
+    assert priority == 250
+    assert len(graph.nodes) == 59
+
+    # hijos creados al expandir cada nivel: el take del dron
+    # no cabe en 4 de los 16 nodos del nivel 4
+    assert per_level(stats, "level") == [0, 1, 2, 3, 4, 5]
+    assert per_level(stats, "created") == [2, 4, 8, 16, 28, 0]
+    assert per_level(stats, "rejected") == [0, 0, 0, 0, 4, 0]
+    assert stats.rejected == 4
+    assert stats.merged == 0
+
+    # el solve visita cada nodo del árbol una vez
+    assert stats.visited == len(graph.nodes)
+    assert stats.peak_queue == 28
+    assert stats.peak_stack == 5
+
+
+def test_merged_counters():
+    graph, stats, priority = build_and_solve(STAR_WARS, 15, merge=True)
+
+    assert priority == 250
+    assert len(graph.nodes) == 43
+
+    # cada candidato (skip, o take que cabe) crea un nodo o se
+    # fusiona con el (índice, peso) que ya existe
+    assert per_level(stats, "created") == [2, 4, 8, 13, 15, 0]
+    assert per_level(stats, "merged") == [0, 0, 0, 3, 7, 0]
+    assert stats.merged == 10
+    assert stats.rejected == 4
+    assert stats.visited == len(graph.nodes)
+
+
+def test_quantity_level_counters():
+    items = [Item("a", 2, 3, quantity=3), Item("b", 3, 4)]
+
+    graph, stats, priority = build_and_solve(items, 7, merge=True)
+
+    # pesos 0, 2, 4, 6 tras a; b no cabe sobre el peso 6
+    assert priority == 10
+    assert per_level(stats, "created") == [4, 7, 0]
+    assert stats.rejected == 1
+    assert stats.merged == 0
+    assert stats.visited == len(graph.nodes) == 12
+
+
+def test_to_json_round_trip(tmp_path):
+    _, stats, _ = build_and_solve(STAR_WARS, 15, merge=True)
+    path = tmp_path / "traza.json"
+
+    trace = json.loads(stats.to_json(str(path)))
+
+    assert trace == json.loads(path.read_text(encoding="utf-8"))
+    assert trace["merged"] == 10
+    assert trace["visited"] == 43
+    assert [level["created"] for level in trace["levels"]] == [2, 4, 8, 13, 15, 0]
+
+
+def test_memory_per_level():
+    graph = Graph(STAR_WARS, 15)
+    stats = Stats(memory=True)
+    graph.build(stats=stats)
+
+    assert all("bytes" in level for level in stats.levels)
+    assert sum(level["bytes"] for level in stats.levels) > 0
@@ -0,0 +1,19 @@
+# =======================================================
+#   STREAMING (NIVEL A NIVEL) CONTRA FUERZA BRUTA
+# =======================================================
+
+import pytest
+
+from fuerza_bruta import QUANTITIES, check_engine
+
+from mochila import Graph
+from mochila.stream import StreamingSolver
+
+
+@QUANTITIES
+@pytest.mark.parametrize("merge", [False, True], ids=["árbol", "merge"])
+def test_stream_matches_brute_force(merge, quantities):
+    check_engine(
+        lambda items, capacity: StreamingSolver(Graph(items, capacity), merge=merge).solve(),
+        quantities
+    )
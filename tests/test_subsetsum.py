@@ -0,0 +1,88 @@
+# =======================================================
+#   SUBSET-SUM: PESOS ALCANZABLES Y TESTIGOS CONTRA
+#   FUERZA BRUTA
+# =======================================================
+
+import itertools
+import random
+
+import pytest
+
+from fuerza_bruta import optimum, instance, check_path
+
+from mochila import Item, UNBOUNDED
+from mochila.grafo import path_counts
+from mochila.subsetsum import SubsetSumSolver
+
+
+def random_instance(rng):
+    items = []
+
+    for i in range(rng.randint(0, 7)):
+        quantity = rng.choice((1, 1, 1, 0, 2, 3, UNBOUNDED))
+        weight = rng.randint(1 if quantity == UNBOUNDED else 0, 12)
+        items.append(Item(f"obj-{i}", weight, rng.randint(0, 30), quantity=quantity))
+
+    return items, rng.randint(0, 40)
+
+
+def brute_force_weights(items, capacity):
+    reachable = set()
+
+    for counts in itertools.product(*(range(item.units(capacity) + 1) for item in items)):
+        weight = sum(c * item.weight for c, item in zip(counts, items))
+        if weight <= capacity:
+            reachable.add(weight)
+
+    return reachable
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_reachable_and_witnesses_match_brute_force(seed):
+    items, capacity = random_instance(random.Random(seed))
+    expected = brute_force_weights(items, capacity)
+
+    solver = SubsetSumSolver(items, capacity)
+
+    assert solver.weights() == sorted(expected)
+
+    for weight in range(-1, capacity + 2):
+        assert solver.reachable(weight) == (weight in expected)
+
+        witness = solver.witness(weight)
+
+        if weight not in expected:
+            assert witness is None
+            continue
+
+        counts = path_counts(items, witness)
+        assert all(c <= item.quantity for c, item in zip(counts, items))
+        assert sum(c * item.weight for c, item in zip(counts, items)) == weight
+
+    for limit in range(-1, capacity + 1):
+        below = [w for w in expected if w <= limit]
+        assert solver.best(limit) == (max(below) if below else None)
+
+
+def test_witness_across_checkpoint_blocks():
+    # 30 partes: stride 5, seis bloques recalculados al reconstruir
+    items = [Item(f"obj-{i}", 2 * i + 1, 2 * i + 1) for i in range(30)]
+    capacity = 200
+
+    solver = SubsetSumSolver(items, capacity)
+    assert solver.stride == 5
+
+    for weight in (0, 1, 99, 150, 200):
+        counts = path_counts(items, solver.witness(weight))
+        assert sum(c * item.weight for c, item in zip(counts, items)) == weight
+
+
+def test_subset_sum_matches_brute_force():
+    for seed in range(60):
+        items, capacity = instance(seed, quantities=True)
+        items = [Item(item.name, item.weight, item.weight, quantity=item.quantity) for item in items]
+
+        path, weight = SubsetSumSolver(items, capacity).solve()
+
+        assert weight == optimum(items, capacity)
+        check_path(items, capacity, path, weight)